@@ -0,0 +1,331 @@
+"""Frame tick benchmarks - how _tick_frame scales with layers, builders and properties
+
+Runs outside Talon: the real RigState / LayerGroup / ActiveBuilder classes
+are driven by src/headless.Simulation on a virtual clock, with a stubbed
+`talon` module (benchmarks/talon_stub.py) and rig-core loaded from source.
+
+    python benchmarks/bench_tick.py --rig-core ../talon-rig-core
+    python benchmarks/bench_tick.py --scenario boost_stacks --sizes 1 100
+    python benchmarks/bench_tick.py --compare benchmarks/results/<earlier>.json
+
+Each scenario is run at several sizes N. Per tick it records:
+    us          wall time of one _tick_frame, in microseconds
+    alloc_peak  bytes allocated above the tick's starting point at its peak
+                (transient allocations, via tracemalloc)
+    alloc_net   memory blocks still allocated after the tick (retained growth)
+and reports mean/p50/p99 of each. Allocation figures come from a separate
+pass so tracemalloc overhead doesn't skew the timings.
+
+Results are written to benchmarks/results/<timestamp>.json (or --output).
+
+Nothing runs on import - Talon loads this file like any other.
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(HERE)
+RESULTS_DIR = os.path.join(HERE, "results")
+
+# Held far longer than any run so lifecycles stay active while measuring
+FOREVER_MS = 10_000_000
+
+DEFAULT_SIZES = (1, 10, 50)
+DEFAULT_WARMUP = 50
+DEFAULT_FRAMES = 500
+
+
+# ============================================================================
+# SCENARIOS - each sets up N of something on a fresh rig, with the frame
+# loop left running
+# ============================================================================
+
+def _moving(rig):
+    rig.direction.to(1, 0)
+    rig.speed.to(1)
+
+
+def scenario_layers_speed(rig, n):
+    _moving(rig)
+    for i in range(n):
+        rig.layer(f"bench_speed_{i}").speed.add(0.001)
+
+
+def scenario_layers_direction(rig, n):
+    _moving(rig)
+    for i in range(n):
+        rig.layer(f"bench_direction_{i}").direction.by(0.001)
+
+
+def scenario_layers_vector(rig, n):
+    _moving(rig)
+    for i in range(n):
+        rig.layer(f"bench_vector_{i}").vector.add(0.001, 0)
+
+
+def scenario_layers_pos(rig, n):
+    _moving(rig)
+    for i in range(n):
+        rig.layer(f"bench_pos_{i}").pos.add(0.001, 0)
+
+
+def scenario_layers_scroll(rig, n):
+    rig.scroll.direction.to(0, 1)
+    rig.scroll.speed.to(0.01)
+    for i in range(n):
+        rig.layer(f"bench_scroll_{i}").scroll.speed.add(0.001)
+
+
+def scenario_boost_stacks(rig, n):
+    """Unlimited stacked boosts, as user.mouse_rig_boost(stacks=0) makes them"""
+    _moving(rig)
+    for _ in range(n):
+        rig.speed.offset.add(0.01).over(500).hold(FOREVER_MS).revert(500).stack(0)
+
+
+def scenario_emit_layers(rig, n):
+    _moving(rig)
+    for i in range(n):
+        name = f"bench_emit_{i}"
+        rig.layer(name).speed.add(0.01)
+        rig.layer(name).emit(FOREVER_MS)
+
+
+def scenario_pos_by(rig, n):
+    for _ in range(n):
+        rig.pos.by(10, 0).over(FOREVER_MS)
+
+
+def scenario_pos_to(rig, n):
+    for i in range(n):
+        rig.pos.to(100 + i, 100).over(FOREVER_MS)
+
+
+SCENARIOS = {
+    "layers_speed": scenario_layers_speed,
+    "layers_direction": scenario_layers_direction,
+    "layers_vector": scenario_layers_vector,
+    "layers_pos": scenario_layers_pos,
+    "layers_scroll": scenario_layers_scroll,
+    "boost_stacks": scenario_boost_stacks,
+    "emit_layers": scenario_emit_layers,
+    "pos_by": scenario_pos_by,
+    "pos_to": scenario_pos_to,
+}
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _summary(values) -> dict:
+    return {
+        "mean": statistics.fmean(values) if values else 0.0,
+        "p50": _percentile(values, 0.50),
+        "p99": _percentile(values, 0.99),
+        "max": max(values) if values else 0.0,
+    }
+
+
+def _tick(sim):
+    """Run everything scheduled before the next frame, then return a callable
+    that runs exactly that frame, or None if the loop has stopped"""
+    job = sim.state._frame_loop_job
+    if job is None:
+        return None
+    runtime = sim.runtime
+    while True:
+        due = runtime.next_due()
+        if due is None or due >= job.due:
+            break
+        runtime.step()
+    return runtime.step
+
+
+def _measure(core, setup, n, warmup, frames, trace_alloc) -> dict:
+    from mouse_rig.src.headless import Simulation
+
+    with Simulation(core=core, cursor=(500, 500)) as sim:
+        setup(sim.rig(), n)
+        groups = len(sim.state._layer_groups)
+        builders = sum(len(group.builders) for group in sim.state._layer_groups.values())
+
+        for _ in range(warmup):
+            step = _tick(sim)
+            if step is None:
+                break
+            step()
+
+        times, peaks, nets = [], [], []
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        if trace_alloc:
+            tracemalloc.start()
+        try:
+            for _ in range(frames):
+                step = _tick(sim)
+                if step is None:
+                    break
+                if trace_alloc:
+                    tracemalloc.reset_peak()
+                    start_bytes = tracemalloc.get_traced_memory()[0]
+                    start_blocks = sys.getallocatedblocks()
+                    step()
+                    peaks.append(tracemalloc.get_traced_memory()[1] - start_bytes)
+                    nets.append(sys.getallocatedblocks() - start_blocks)
+                else:
+                    t0 = time.perf_counter_ns()
+                    step()
+                    times.append((time.perf_counter_ns() - t0) / 1000.0)
+        finally:
+            if trace_alloc:
+                tracemalloc.stop()
+            if gc_was_enabled:
+                gc.enable()
+
+    if trace_alloc:
+        return {"ticks": len(peaks), "alloc_peak": _summary(peaks), "alloc_net": _summary(nets)}
+    return {"ticks": len(times), "groups": groups, "builders": builders, "us": _summary(times)}
+
+
+def run_scenario(core, name, n, warmup=DEFAULT_WARMUP, frames=DEFAULT_FRAMES) -> dict:
+    setup = SCENARIOS[name]
+    result = _measure(core, setup, n, warmup, frames, trace_alloc=False)
+    result.update(_measure(core, setup, n, warmup, frames, trace_alloc=True))
+    result.update(scenario=name, n=n)
+    return result
+
+
+# ============================================================================
+# ENVIRONMENT
+# ============================================================================
+
+def load_engine(rig_core_path):
+    """Install the talon stub, load rig-core from source and return it"""
+    sys.path.insert(0, HERE)
+    import talon_stub
+
+    talon_stub.install()
+    talon_stub.load_package("rig_core", rig_core_path)
+    talon_stub.app.fire("ready")
+
+    rig_core = talon_stub.actions.user._actions.get("rig_core")
+    if rig_core is None:
+        raise SystemExit(f"No user.rig_core action found in {rig_core_path}")
+
+    talon_stub.mount_package("mouse_rig", REPO)
+    __import__("mouse_rig.mouse_rig_settings")
+    __import__("mouse_rig.src.headless")
+    return rig_core()
+
+
+def _git_revision() -> str:
+    head = os.path.join(REPO, ".git", "HEAD")
+    try:
+        with open(head) as f:
+            ref = f.read().strip()
+        if ref.startswith("ref: "):
+            with open(os.path.join(REPO, ".git", ref[5:])) as f:
+                return f.read().strip()[:12]
+        return ref[:12]
+    except OSError:
+        return "unknown"
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def _format_row(result) -> str:
+    us = result["us"]
+    peak = result["alloc_peak"]
+    net = result["alloc_net"]
+    return (
+        f"{result['scenario']:<18} {result['n']:>5} {result['builders']:>6}"
+        f" {us['mean']:>9.1f} {us['p50']:>9.1f} {us['p99']:>9.1f}"
+        f" {peak['p50']:>9.0f} {peak['p99']:>9.0f} {net['p50']:>6.0f} {net['p99']:>6.0f}"
+    )
+
+
+HEADER = (
+    f"{'scenario':<18} {'n':>5} {'bldrs':>6}"
+    f" {'us mean':>9} {'us p50':>9} {'us p99':>9}"
+    f" {'peak p50':>9} {'peak p99':>9} {'net50':>6} {'net99':>6}"
+)
+
+
+def _compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    previous = {(r["scenario"], r["n"]): r for r in baseline["results"]}
+    print(f"\nvs {os.path.basename(baseline_path)} ({baseline.get('revision', '?')}):")
+    for result in results:
+        before = previous.get((result["scenario"], result["n"]))
+        if before is None:
+            continue
+        old, new = before["us"]["p50"], result["us"]["p50"]
+        change = (new - old) / old * 100 if old else 0.0
+        print(f"  {result['scenario']:<18} {result['n']:>5}  p50 {old:>8.1f} -> {new:>8.1f} us ({change:+.0f}%)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rig-core", default=os.path.join(os.path.dirname(REPO), "talon-rig-core"),
+                        help="path to a talon-rig-core checkout (default: sibling directory)")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--output", help="results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", help="earlier results file to compare p50 against")
+    args = parser.parse_args(argv)
+
+    core = load_engine(args.rig_core)
+
+    results = []
+    print(HEADER)
+    for name in args.scenario or list(SCENARIOS):
+        for n in args.sizes:
+            result = run_scenario(core, name, n, args.warmup, args.frames)
+            results.append(result)
+            print(_format_row(result))
+
+    stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+    output = args.output or os.path.join(RESULTS_DIR, f"{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "timestamp": stamp,
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "frames": args.frames,
+            "warmup": args.warmup,
+            "results": results,
+        }, f, indent=2)
+    print(f"\nSaved {output}")
+
+    if args.compare:
+        _compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""Minimal stand-in for the `talon` module, for running the engine outside Talon
+
+Nothing happens on import - call install() to register the stub in
+sys.modules. It covers what mouse rig and rig-core touch at import and build
+time: Module/Context registration, actions.user, settings defaults,
+app.register and no-op cron/ctrl. Anything else resolves to an inert
+placeholder. Scheduling, the clock and mouse output come from
+src/headless.py, not from here.
+
+mount_package() / load_package() make a Talon user package directory (no
+__init__.py at the top) importable under a synthetic package name.
+"""
+
+import importlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import types
+
+
+class _Inert:
+    """Absorbs any attribute access, call or decoration"""
+
+    def __init__(self, name="talon"):
+        self._name = name
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Inert(f"{self._name}.{name}")
+
+    def __call__(self, *args, **kwargs):
+        if len(args) == 1 and not kwargs and (callable(args[0]) or isinstance(args[0], type)):
+            return args[0]
+        return _Inert(f"{self._name}()")
+
+    def __bool__(self):
+        return False
+
+    def __iter__(self):
+        return iter(())
+
+    def __repr__(self):
+        return f"<stub {self._name}>"
+
+
+class _UserActions:
+    """actions.user - functions registered through Module.action_class"""
+
+    def __init__(self):
+        self._actions = {}
+
+    def __getattr__(self, name):
+        actions = self.__dict__.get("_actions", {})
+        if name in actions:
+            return actions[name]
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Inert(f"actions.user.{name}")
+
+
+class _Actions(_Inert):
+    def __init__(self):
+        super().__init__("actions")
+        self.user = _UserActions()
+
+
+class _Settings:
+    def __init__(self):
+        self._values = {}
+
+    def get(self, name, default=None):
+        return self._values.get(name, default)
+
+    def set(self, name, value):
+        self._values[name] = value
+
+    def register(self, name, callback):
+        pass
+
+
+class _App(_Inert):
+    def __init__(self):
+        super().__init__("app")
+        self.platform = {"darwin": "mac", "win32": "windows"}.get(sys.platform, "linux")
+        self._callbacks = {}
+
+    def register(self, event, callback):
+        self._callbacks.setdefault(event, []).append(callback)
+
+    def unregister(self, event, callback):
+        if callback in self._callbacks.get(event, []):
+            self._callbacks[event].remove(callback)
+
+    def notify(self, *args, **kwargs):
+        pass
+
+    def fire(self, event):
+        """Run and clear callbacks registered for `event` (e.g. "ready")"""
+        for callback in self._callbacks.pop(event, []):
+            callback()
+
+
+class _Cron:
+    def after(self, spec, callback):
+        return None
+
+    def interval(self, spec, callback):
+        return None
+
+    def cancel(self, job):
+        pass
+
+
+class _Ctrl(_Inert):
+    def __init__(self):
+        super().__init__("ctrl")
+
+    def mouse_pos(self):
+        return (0, 0)
+
+    def mouse_move(self, x, y, **kwargs):
+        pass
+
+    def mouse_click(self, **kwargs):
+        pass
+
+
+class _Module(_Inert):
+    def __init__(self, *args, **kwargs):
+        super().__init__("Module")
+
+    def setting(self, name, type=None, default=None, desc=None, **kwargs):
+        settings._values.setdefault(f"user.{name}", default)
+        return _Inert(f"setting.{name}")
+
+    def action_class(self, cls):
+        for name, value in vars(cls).items():
+            if callable(value) and not name.startswith("_"):
+                actions.user._actions[name] = value
+        return cls
+
+
+class _Context(_Inert):
+    def __init__(self, *args, **kwargs):
+        super().__init__("Context")
+        self.settings = {}
+        self.lists = {}
+        self.tags = []
+        self.matches = ""
+
+    def action_class(self, *args):
+        if args and isinstance(args[0], type):
+            return args[0]
+        return lambda cls: cls
+
+
+actions = _Actions()
+settings = _Settings()
+app = _App()
+cron = _Cron()
+ctrl = _Ctrl()
+
+
+class _SubmoduleFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Serves any `talon.<x>` import with an inert module"""
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname.startswith("talon."):
+            return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        module = types.ModuleType(spec.name)
+        module.__path__ = []
+        module.__getattr__ = lambda name: _Inert(f"{spec.name}.{name}")
+        return module
+
+    def exec_module(self, module):
+        pass
+
+
+def install() -> types.ModuleType:
+    """Register the stub as `talon` (and `talon.*`) in sys.modules"""
+    if "talon" in sys.modules:
+        return sys.modules["talon"]
+    module = types.ModuleType("talon")
+    module.__path__ = []
+    module.__dict__.update(
+        actions=actions, settings=settings, app=app, cron=cron, ctrl=ctrl,
+        Module=_Module, Context=_Context,
+    )
+    module.__getattr__ = lambda name: _Inert(f"talon.{name}")
+    sys.modules["talon"] = module
+    sys.meta_path.append(_SubmoduleFinder())
+    return module
+
+
+def mount_package(name: str, path: str) -> types.ModuleType:
+    """Register directory `path` as package `name` without importing anything in it"""
+    path = os.path.abspath(path)
+    init = os.path.join(path, "__init__.py")
+    if os.path.exists(init):
+        spec = importlib.util.spec_from_file_location(name, init, submodule_search_locations=[path])
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        return module
+    module = types.ModuleType(name)
+    module.__path__ = [path]
+    sys.modules[name] = module
+    return module
+
+
+def load_package(name: str, path: str, skip: tuple = ("tests",)) -> types.ModuleType:
+    """Import a Talon user package directory as `name`
+
+    Every directory becomes a package and every .py file is imported in
+    sorted order, the way Talon loads a user directory. Directories named in
+    `skip` are left out.
+    """
+    path = os.path.abspath(path)
+    package = mount_package(name, path)
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d not in skip and not d.startswith((".", "_")))
+        rel = os.path.relpath(root, path)
+        prefix = name if rel == "." else f"{name}.{rel.replace(os.sep, '.')}"
+        if prefix not in sys.modules:
+            mount_package(prefix, root)
+        for file in sorted(files):
+            if file.endswith(".py") and file != "__init__.py":
+                importlib.import_module(f"{prefix}.{file[:-3]}")
+    return package
@@ -2,6 +2,7 @@ from talon import actions, settings, Module
 from typing import Any
 from .src import rig as get_rig, reload_rig
 from .src.sequence import run_sequence, WaitHandle
+from .src.easing import register_easing
 
 mod = Module()
 
@@ -486,6 +487,80 @@ class Actions:
         rig = actions.user.mouse_rig()
         rig.reset()
 
+    def mouse_rig_perf_report(reset: bool = False) -> str:
+        """Print and return per-phase frame loop timing.
+
+        Timing is recorded while the user.mouse_rig_perf setting is on or after
+        rig.state.perf.enable(). Shows count, mean and max per phase (builder
+        advance, velocity, position, emission, callbacks, ...) and the
+        breakdown of the slowest frame.
+
+        Args:
+            reset: Clear the counters after reporting
+        """
+        perf = actions.user.mouse_rig().state.perf
+        report = perf.report()
+        print(report)
+        if reset:
+            perf.reset()
+        return report
+
+    def mouse_rig_jitter_report(export_path: str = "", reset: bool = False) -> str:
+        """Print and return frame loop timing jitter.
+
+        Compares each real tick interval with the scheduled frame interval:
+        lateness histogram (session and recent), late and missed frame counts,
+        and the worst stall with the layers and backend active at the time.
+
+        Args:
+            export_path: Also write the full data as JSON to this file
+            reset: Clear the counters after reporting
+        """
+        jitter = actions.user.mouse_rig().state.jitter
+        report = jitter.report()
+        if export_path:
+            jitter.export(export_path)
+            report += f"\n  exported to {export_path}"
+        print(report)
+        if reset:
+            jitter.reset()
+        return report
+
+    def mouse_rig_emit_report(reset: bool = False) -> str:
+        """Print and return async emission queue metrics.
+
+        Recorded while the user.mouse_rig_async_emit setting is on: queue
+        depth, frames merged because the queue was full, latency from frame
+        commit to emission, and time spent in the mouse backend.
+
+        Args:
+            reset: Clear the counters after reporting
+        """
+        emit_queue = actions.user.mouse_rig().state.emit_queue
+        report = emit_queue.report()
+        print(report)
+        if reset:
+            emit_queue.reset()
+        return report
+
+    def mouse_rig_easing_register(name: str, curve: str) -> None:
+        """Register a custom easing curve, usable anywhere an easing name is.
+
+        The curve is compiled once into a lookup table.
+
+        ```python
+        actions.user.mouse_rig_easing_register("snappy", "cubic_bezier(0.2, 0.9, 0.3, 1)")
+        actions.user.mouse_rig_easing_register("kick", "piecewise(0:0, 0.2:0.7, 1:1)")
+        actions.user.mouse_rig().pos.by(200, 0).over(300, "snappy")
+        ```
+
+        Args:
+            name: Easing name to register
+            curve: "cubic_bezier(x1, y1, x2, y2)" (CSS style, x1/x2 in 0-1) or
+                "piecewise(t:value, ...)" (straight segments from t=0 to t=1)
+        """
+        register_easing(name, curve)
+
     def mouse_rig_button_prime(button: str) -> None:
         """Prime a mouse button to press on next rig action and release on stop.
 
@@ -12,6 +12,93 @@ mod.setting(
     Lower = smoother movement. Default: 16ms (60 updates per second)"""
 )
 
+mod.setting(
+    "mouse_rig_time_based",
+    type=bool,
+    default=False,
+    desc="""Integrate movement over real elapsed time instead of per frame.
+    When enabled, speed is in pixels per second and scroll speed in lines per second,
+    so cursor speed no longer depends on mouse_rig_frame_interval or late frames.
+    Late frames are sub-stepped so easing, boosts and emit decay stay accurate.
+    Default: False (speed is pixels per frame)"""
+)
+
+mod.setting(
+    "mouse_rig_adaptive_frame_rate",
+    type=bool,
+    default=False,
+    desc="""Lower the frame rate while nothing needs it, to save CPU and battery.
+    Eased over/revert phases, position moves and fast motion run at mouse_rig_frame_interval.
+    Holds, slow constant velocity and scroll-only motion drop toward mouse_rig_max_frame_interval.
+    Movement is scaled by elapsed time, so rate changes do not change speed.
+    Default: False"""
+)
+
+mod.setting(
+    "mouse_rig_max_frame_interval",
+    type=int,
+    default=64,
+    desc="""Slowest frame interval (in milliseconds) the adaptive frame rate may drop to.
+    Only used when mouse_rig_adaptive_frame_rate is enabled. Default: 64ms"""
+)
+
+mod.setting(
+    "mouse_rig_idle_grace_ms",
+    type=int,
+    default=500,
+    desc="""How long (in milliseconds) the frame loop's timer stays scheduled after motion stops.
+    A command within this time reuses it instead of scheduling a new one, so rapid commands
+    don't churn the timer. Stop callbacks still fire as soon as motion stops. 0 cancels the
+    timer right away. Default: 500ms"""
+)
+
+mod.setting(
+    "mouse_rig_frame_thread",
+    type=bool,
+    default=False,
+    desc="""Run the frame loop on a dedicated timing thread instead of Talon's cron.
+    Ticks keep steady deadlines (sleep, then spin the last millisecond) while Talon's main
+    thread is busy decoding speech, so short intervals like 8ms or 4ms hold up.
+    .then() and stop callbacks still run on Talon's main thread. Default: False"""
+)
+
+mod.setting(
+    "mouse_rig_async_emit",
+    type=bool,
+    default=False,
+    desc="""Hand each frame's mouse backend calls to an emission thread instead of making them
+    inside the frame loop, so a slow backend call doesn't hold up the next frame. Frames queue
+    up to a small bound; past it they merge, so no motion is dropped.
+    See rig.state.emit_queue or the mouse_rig_emit_report action. Default: False"""
+)
+
+mod.setting(
+    "mouse_rig_engine_process",
+    type=bool,
+    default=False,
+    desc="""Emit move and scroll velocity from a separate worker process. Talon still advances
+    builders each frame and sends the resulting velocity over shared memory; the worker keeps
+    moving at that velocity on its own timing, so Talon pauses don't freeze the cursor.
+    Needs a native backend (windows_send_input, windows_mouse_event, linux_x11, linux_uinput);
+    otherwise, and for pos.to/pos.by and .api() overrides, emission stays in Talon. Default: False"""
+)
+
+mod.setting(
+    "mouse_rig_engine_python",
+    type=str,
+    default="",
+    desc="""Python interpreter that runs the engine process worker.
+    Empty uses python3/python from PATH. Default: "" (python3 on PATH)"""
+)
+
+mod.setting(
+    "mouse_rig_perf",
+    type=bool,
+    default=False,
+    desc="""Record per-phase frame loop timing (builder advance, velocity, emission, callbacks, ...).
+    Read it with rig.state.perf or the mouse_rig_perf_report action. Default: False"""
+)
+
 mod.setting(
     "mouse_rig_api",
     type=str,
@@ -23,7 +110,8 @@ mod.setting(
     - "windows_send_input": Windows SendInput (modern, recommended for Windows)
     - "windows_mouse_event": Windows win32api.mouse_event (legacy, requires pywin32)
     - "macos_cgevent": macOS CGEventCreateMouseEvent (via CoreGraphics ctypes)
-    - "linux_x11": Linux X11 XWarpPointer (requires python-xlib)
+    - "linux_x11": Linux X11 XTest relative motion, one flush per frame (requires python-xlib)
+    - "linux_uinput": Linux uinput virtual mouse seen by games reading evdev/raw input (requires write access to /dev/uinput)
 
     To override this, chain .api("name") to force a specific API for an individual action.
     """
@@ -41,7 +129,8 @@ mod.setting(
     - "windows_send_input": Windows SendInput MOUSEEVENTF_WHEEL/HWHEEL
     - "windows_mouse_event": Windows win32api.mouse_event (legacy, requires pywin32)
     - "macos_cgevent": macOS CGEventCreateScrollWheelEvent (via CoreGraphics ctypes)
-    - "linux_x11": Linux X11 XTest fake button events (requires python-xlib)
+    - "linux_x11": Linux X11 XTest fake button events, one flush per frame (requires python-xlib)
+    - "linux_uinput": Linux uinput high-resolution wheel events, sub-line precision (requires write access to /dev/uinput)
     """
 )
 
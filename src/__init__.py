@@ -29,6 +29,7 @@ from .contracts import (
     VALID_RIG_PROPERTIES
 )
 from .ui import show_reloading_notification
+from .frame_thread import locked
 
 # Module-level references - set by _on_ready via _build_classes
 # Contracts symbols (used in class method bodies, safe to be None at import time)
@@ -42,18 +43,27 @@ _ready = False
 
 def _on_ready():
     """Initialize all modules by getting rig-core and calling _build_classes in order"""
+    _build_all(actions.user.rig_core())
+
+
+def _build_all(core):
+    """Call every module's _build_classes with the given rig-core, in dependency
+    order. Also used by headless.Simulation to build the engine outside Talon."""
     global _ready
-    core = actions.user.rig_core()
 
     # Import all submodules
     from . import core as _core_mod
     from . import mode_operations as _mode_ops_mod
     from . import layer_group as _layer_group_mod
+    from . import easing as _easing_mod
+    from . import soa as _soa_mod
 
     # Call _build_classes in dependency order
     _core_mod._build_classes(core)
+    _easing_mod._build_classes(core)
     _contracts_mod._build_classes(core)
     _mode_ops_mod._build_classes(core)
+    _soa_mod._build_classes(core)
     _layer_group_mod._build_classes(core)
     _state_mod._build_classes(core)
     _builder_mod._build_classes(core)
@@ -88,12 +98,18 @@ def reload_rig():
         try:
             # Stop movement first (sets base speed to 0)
             _global_state.stop(transition_ms=0)
-            # Then stop the frame loop
-            _global_state._stop_frame_loop()
         except Exception as e:
             pass
+        # Then cancel the frame loop outright and close the engine process -
+        # the reloaded module builds a new state, so nothing may keep
+        # pointing at this one
+        _global_state.shutdown()
         _global_state = None
 
+    # Custom easings are re-registered by the reloaded code
+    from . import easing as _easing_mod
+    _easing_mod.release()
+
     # Show brief notification before reload
     show_reloading_notification()
     # Small delay to ensure notification is visible before reload
@@ -138,12 +154,17 @@ def reload_rig():
                     pass
 
 
+# Rig entry points that mutate state hold its lock (see frame_thread)
+_locked = locked(lambda owner: owner._state)
+
+
 class StopHandle:
     """Handle returned by stop() that allows adding callbacks via .then()"""
 
     def __init__(self, state):
         self._state = state
 
+    @_locked
     def then(self, callback):
         """Add a callback to be executed when the system fully stops
 
@@ -165,6 +186,7 @@ class ScrollStopHandle:
     def __init__(self, state):
         self._state = state
 
+    @_locked
     def then(self, callback):
         """Add a callback to be executed when scroll fully stops
 
@@ -181,6 +203,7 @@ class MoveStopHandle:
     def __init__(self, state):
         self._state = state
 
+    @_locked
     def then(self, callback):
         """Add a callback to be executed when movement fully stops
 
@@ -197,8 +220,9 @@ class Rig:
     All property accesses and methods return RigBuilder for fluent chaining.
     """
 
-    def __init__(self):
-        self._state = _get_global_state()
+    def __init__(self, state=None):
+        # state: a RigState to drive instead of the global one (headless use)
+        self._state = state if state is not None else _get_global_state()
 
     # ========================================================================
     # PROPERTY ACCESSORS (base layer)
@@ -294,6 +318,7 @@ class Rig:
     # SPECIAL OPERATIONS
     # ========================================================================
 
+    @_locked
     def stop(self, ms: Optional[float] = None, easing: str = "linear") -> StopHandle:
         """Stop everything: bake all layers, clear builders, decelerate to 0
 
@@ -309,6 +334,7 @@ class Rig:
         self._state.stop(ms, easing)
         return StopHandle(self._state)
 
+    @_locked
     def reset(self):
         """Reset everything to default state
 
@@ -320,6 +346,7 @@ class Rig:
         """
         self._state.reset()
 
+    @_locked
     def reverse(self, ms: Optional[float] = None, easing: str = "linear"):
         """Reverse direction of all movement (base + layers)
 
@@ -419,10 +446,25 @@ class Rig:
         # Mouse-specific: flip base direction fields
         self._state._base_direction = self._state._base_direction * -1
 
+    @_locked
     def bake(self):
         """Bake all active builders to base state"""
         self._state.bake_all()
 
+    @_locked
+    def finish_all(self):
+        """Jump every running animation to its end state
+
+        Relative moves emit the rest of their distance, reverts complete
+        and .then() callbacks fire, as if their time had run out.
+
+        Example:
+            rig.pos.by(200, 0).over(1000)
+            rig.finish_all()  # cursor is 200px right now
+        """
+        self._state.finish_all()
+
+    @_locked
     def emit(self, ms: float = 1000, easing: str = "linear"):
         """Convert current total velocity to autonomous decaying offset
 
@@ -486,6 +528,7 @@ class _MoveProxy:
     def __init__(self, state):
         self._state = state
 
+    @_locked
     def stop(self, ms: Optional[float] = None, easing: str = "linear") -> MoveStopHandle:
         """Stop movement only: bake movement layers, clear movement effects, decelerate to 0
 
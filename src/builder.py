@@ -6,7 +6,6 @@ ActiveBuilder extends BaseActiveBuilder with mouse-specific value resolution.
 
 import math
 import time
-from talon import ctrl
 from typing import Optional, Callable, Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -34,8 +33,18 @@ ActiveBuilder = None
 rate_utils = None
 
 # Module-level imports that don't need rig-core
-from .core import mouse_move, mouse_move_relative, mouse_scroll_native
-from .mouse_api import MOUSE_APIS, get_mouse_move_functions
+from .core import mouse_move, mouse_move_relative, mouse_scroll_native, get_mouse_move_with_overrides
+from .mouse_api import MOUSE_APIS
+from .emit_queue import EMIT_ABSOLUTE, EMIT_RELATIVE, EMIT_SCROLL
+from .easing import resolve_easing
+from .trajectory import UNPLANNED
+from . import runtime
+from .frame_thread import locked
+
+# Entry points that mutate rig state hold its lock, so a tick on the frame
+# thread never sees a half-applied change
+_locked = locked(lambda builder: builder.rig_state)
+_proxy_locked = locked(lambda proxy: proxy.builder.rig_state)
 
 
 def _build_classes(core):
@@ -89,6 +98,24 @@ def _build_classes(core):
             self._mouse_config = config
             self._mouse_rig_state = rig_state
 
+            # Precomputed pos / scroll_pos move, planned on the first frame
+            self._trajectory = UNPLANNED
+
+            # Identical stacked builders folded into this one (see
+            # RigState._coalesce_stacked); the value is scaled by it. While
+            # holding it may also carry the weight of parked builders, which
+            # rejoin the group when their own hold ends (_fold_holding).
+            self._stack_weight = 1
+            self._stack_frame = None
+            self._stack_parked = ()
+
+            # What the frame loop has emitted for a pos / scroll_pos move:
+            # whole pixels so far (None until its first frame) and the last
+            # interpolated totals
+            self._total_emitted_int = None
+            self._last_emitted_relative_pos = None
+            self._last_emitted_scroll_pos = Vec2(0, 0)
+
             # Call super which will call our abstract methods
             super().__init__(config, rig_state, is_base_layer)
 
@@ -120,7 +147,7 @@ def _build_classes(core):
             if config.operator == "to":
                 if config.property == "pos":
                     if config.movement_type == "absolute":
-                        return Vec2(*ctrl.mouse_pos())
+                        return Vec2(*runtime.current.mouse_pos())
                     else:
                         return Vec2(0, 0)
                 else:
@@ -215,7 +242,7 @@ def _build_classes(core):
         def _get_own_value(self) -> Any:
             """Override to add scroll_pos handling"""
             if self.config.property == "scroll_pos":
-                current_time = time.perf_counter()
+                current_time = runtime.current.now()
                 phase, progress = self.lifecycle.advance(current_time)
 
                 neutral = Vec2(0, 0)
@@ -235,13 +262,13 @@ def _build_classes(core):
         def get_interpolated_value(self) -> Any:
             """Override to use PropertyAnimator.interpolate for group lifecycle"""
             if self.group_lifecycle and not self.group_lifecycle.is_complete():
-                current_time = time.perf_counter()
+                current_time = runtime.current.now()
                 phase, progress = self.group_lifecycle.advance(current_time)
 
                 property_type = self.config.property
                 interpolation = self.config.revert_interpolation
 
-                return PropertyAnimator.interpolate(
+                value = PropertyAnimator.interpolate(
                     property_type,
                     self.group_base_value,
                     self.group_target_value,
@@ -250,8 +277,12 @@ def _build_classes(core):
                     self.group_lifecycle.has_reverted(),
                     interpolation
                 )
+            else:
+                value = self._get_own_value()
 
-            return self._get_own_value()
+            if self._stack_weight != 1 and value is not None:
+                return value * self._stack_weight
+            return value
 
         # ====================================================================
         # MOUSE-SPECIFIC: execute_synchronous
@@ -264,7 +295,7 @@ def _build_classes(core):
                     mode = self.config.mode
                     current_value = self.target_value
 
-                    current_mouse_pos = ctrl.mouse_pos()
+                    current_mouse_pos = runtime.current.mouse_pos()
                     self.rig_state._internal_pos = Vec2(current_mouse_pos[0], current_mouse_pos[1])
                     self.rig_state._base_pos = Vec2(current_mouse_pos[0], current_mouse_pos[1])
 
@@ -273,23 +304,26 @@ def _build_classes(core):
                     self.rig_state._base_pos = Vec2(new_pos.x, new_pos.y)
 
                     if self.config.api_override is not None:
-                        move_absolute, _ = get_mouse_move_functions(self.config.api_override, None)
-                        move_absolute(int(self.rig_state._internal_pos.x), int(self.rig_state._internal_pos.y))
+                        move_absolute, _ = get_mouse_move_with_overrides(self.config.api_override, None)
                     else:
-                        mouse_move(int(self.rig_state._internal_pos.x), int(self.rig_state._internal_pos.y))
+                        move_absolute = mouse_move
+                    self.rig_state._emit(
+                        EMIT_ABSOLUTE, move_absolute,
+                        int(self.rig_state._internal_pos.x), int(self.rig_state._internal_pos.y),
+                    )
                 else:
                     delta = self.target_value
 
                     if self.config.api_override is not None:
-                        _, move_relative = get_mouse_move_functions(None, self.config.api_override)
-                        move_relative(int(delta.x), int(delta.y))
+                        _, move_relative = get_mouse_move_with_overrides(None, self.config.api_override)
                     else:
-                        mouse_move_relative(int(delta.x), int(delta.y))
+                        move_relative = mouse_move_relative
+                    self.rig_state._emit(EMIT_RELATIVE, move_relative, int(delta.x), int(delta.y))
 
             elif self.config.property == "scroll_pos":
                 delta = self.target_value
                 if abs(delta.x) > 0.01 or abs(delta.y) > 0.01:
-                    mouse_scroll_native(delta.x, delta.y)
+                    self.rig_state._emit(EMIT_SCROLL, mouse_scroll_native, delta.x, delta.y)
 
     ActiveBuilder = _MouseActiveBuilder
 
@@ -428,9 +462,11 @@ class ScrollPropertyProxy:
             self.builder.config.mode = self.mode
         return PropertyBuilder(self.builder, "scroll_pos").by(*args)
 
+    @_proxy_locked
     def bake(self):
         self.builder.rig_state.bake_scroll_all()
 
+    @_proxy_locked
     def emit(self, ms: float = 1000, easing: str = "linear") -> 'RigBuilder':
         """Convert current total scroll velocity to autonomous decaying offset"""
         scroll_speed, scroll_direction = self.builder.rig_state._compute_scroll_velocity()
@@ -443,6 +479,7 @@ class ScrollPropertyProxy:
         self.builder._mark_invalid()
         return RigBuilder(self.builder.rig_state, layer=layer_name).scroll.vector.offset.to(current_velocity.x, current_velocity.y).revert(ms, easing)
 
+    @_proxy_locked
     def stop(self, ms=None, easing: str = "linear"):
         ms = validate_timing(ms, 'ms', method='stop')
         self.builder.rig_state.scroll_stop(ms, easing)
@@ -558,6 +595,7 @@ class RigBuilder:
         interpolation: str = "lerp",
         **kwargs
     ) -> 'RigBuilder':
+        easing = self._resolve_easing(easing)
         all_kwargs = {'easing': easing, 'interpolation': interpolation, **kwargs}
         self.config.validate_method_kwargs('over', self._mark_invalid, **all_kwargs)
 
@@ -593,6 +631,7 @@ class RigBuilder:
         interpolation: str = "lerp",
         **kwargs
     ) -> 'RigBuilder':
+        easing = self._resolve_easing(easing)
         all_kwargs = {'easing': easing, 'interpolation': interpolation, **kwargs}
         self.config.validate_method_kwargs('revert', self._mark_invalid, **all_kwargs)
 
@@ -608,11 +647,20 @@ class RigBuilder:
         self._lifecycle_stage = LifecyclePhase.REVERT
         return self
 
+    def _resolve_easing(self, easing):
+        """Register inline cubic_bezier(...) / piecewise(...) easings by name"""
+        try:
+            return resolve_easing(easing)
+        except ConfigError:
+            self._mark_invalid()
+            raise
+
     def then(self, callback: Callable) -> 'RigBuilder':
         stage = self._lifecycle_stage or LifecyclePhase.OVER
         self.config.then_callbacks.append((stage, callback))
         return self
 
+    @_locked
     def reverse(self, ms: Optional[float] = None, easing: str = "linear") -> 'RigBuilder':
         ms = validate_timing(ms, 'ms', method='reverse', mark_invalid=self._mark_invalid) if ms is not None else None
 
@@ -644,15 +692,20 @@ class RigBuilder:
         if group.property in ("direction", "vector") and group.accumulated_value is not None:
             group.accumulated_value = group.accumulated_value * -1
 
+        self.rig_state._unfold_stacked(group)
         for builder in group.builders:
             if builder.config.property in ("direction", "vector") and builder.target_value is not None:
                 builder.target_value = builder.target_value * -1
                 if builder.base_value is not None:
                     builder.base_value = builder.base_value * -1
+        group.invalidate()
+
+        self.rig_state._invalidate_snapshot()
 
         self._mark_invalid()
         return RigBuilder(self.rig_state, layer=layer_name)
 
+    @_locked
     def copy(self, name: Optional[str] = None) -> 'RigBuilder':
         layer_name = self.config.layer_name
 
@@ -676,16 +729,20 @@ class RigBuilder:
             copy_name = name
 
         original_group = self.rig_state._layer_groups[layer_name]
+        self.rig_state._unfold_stacked(original_group)
         copy_group = original_group.copy(copy_name)
         self.rig_state._layer_groups[copy_name] = copy_group
+        self.rig_state._invalidate_snapshot()
 
         self._mark_invalid()
         return RigBuilder(self.rig_state, layer=copy_name)
 
+    @_locked
     def emit(self, ms: float = 1000, easing: str = "linear") -> 'RigBuilder':
         if not self._executed and self._is_valid and self.config.property is not None:
             self._execute()
 
+        easing = self._resolve_easing(easing)
         self.config.validate_easing(easing, context='emit', mark_invalid=self._mark_invalid)
 
         layer_name = self.config.layer_name
@@ -877,6 +934,7 @@ class RigBuilder:
         if self._is_valid and not self._executed:
             self._execute()
 
+    @_locked
     def _execute(self):
         self._executed = True
 
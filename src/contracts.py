@@ -26,7 +26,7 @@ VALID_OPERATORS = {
 RESERVED_LAYERS = {}
 
 VALID_RIG_METHODS = [
-    'layer', 'api', 'stop', 'reverse', 'bake',
+    'layer', 'api', 'stop', 'reverse', 'bake', 'finish_all',
 ]
 
 VALID_RIG_PROPERTIES = [
@@ -2,11 +2,15 @@
 
 Vec2/easing/math come from rig-core at runtime via _build_classes().
 Mouse-specific: SubpixelAdjuster, mouse API wrappers.
+
+The mouse API wrappers emit through runtime.current.output when a runtime
+provides one (headless simulation), otherwise through the mouse_api backends.
 """
 
 from typing import Tuple, Optional
-from talon import app
-from .mouse_api import get_mouse_move_functions, get_mouse_scroll_function
+from talon import app, settings
+from .mouse_api import get_mouse_move_functions, get_mouse_scroll_function, invalidate_backends
+from . import runtime
 
 
 # ============================================================================
@@ -63,6 +67,10 @@ def get_mouse_move_with_overrides(absolute_override: Optional[str] = None, relat
     Returns:
         Tuple of (absolute_func, relative_func)
     """
+    output = runtime.current.output
+    if output is not None:
+        return output.move_absolute, output.move_relative
+
     if absolute_override is None and relative_override is None:
         if _mouse_move_absolute is None:
             _initialize_mouse_move()
@@ -80,6 +88,10 @@ def get_mouse_scroll_with_override(override: Optional[str] = None):
     Returns:
         scroll_func(dx, dy) -> None
     """
+    output = runtime.current.output
+    if output is not None:
+        return output.scroll
+
     if override is None:
         if _mouse_scroll is None:
             _initialize_mouse_move()
@@ -88,11 +100,53 @@ def get_mouse_scroll_with_override(override: Optional[str] = None):
     return get_mouse_scroll_function(override)
 
 
-app.register("ready", _initialize_mouse_move)
+# Settings that decide how a frame is emitted. Changing one (or the API)
+# bumps the settings version, so per-tick caches keyed on it re-read them.
+_FRAME_SETTINGS = (
+    "user.mouse_rig_time_based",
+    "user.mouse_rig_adaptive_frame_rate",
+    "user.mouse_rig_engine_process",
+)
+_settings_version = 0
+
+
+def get_settings_version() -> int:
+    """Bumped on every change to the mouse API or a frame setting"""
+    return _settings_version
+
+
+def _on_frame_setting_change(*_):
+    global _settings_version
+    _settings_version += 1
+
+
+def _on_api_setting_change(*_):
+    """Drop cached backends so the next move/scroll picks up the new API"""
+    global _mouse_move_absolute, _mouse_move_relative, _mouse_scroll
+    invalidate_backends()
+    _mouse_move_absolute = None
+    _mouse_move_relative = None
+    _mouse_scroll = None
+    _on_frame_setting_change()
+
+
+def _on_ready():
+    _initialize_mouse_move()
+    settings.register("user.mouse_rig_api", _on_api_setting_change)
+    settings.register("user.mouse_rig_scroll_api", _on_api_setting_change)
+    for name in _FRAME_SETTINGS:
+        settings.register(name, _on_frame_setting_change)
+
+
+app.register("ready", _on_ready)
 
 
 def mouse_move(x: float, y: float) -> None:
     """Move mouse to absolute screen position"""
+    output = runtime.current.output
+    if output is not None:
+        output.move_absolute(x, y)
+        return
     if _mouse_move_absolute is None:
         _initialize_mouse_move()
     _mouse_move_absolute(x, y)
@@ -100,6 +154,10 @@ def mouse_move(x: float, y: float) -> None:
 
 def mouse_move_relative(dx: float, dy: float) -> None:
     """Move mouse by relative delta"""
+    output = runtime.current.output
+    if output is not None:
+        output.move_relative(dx, dy)
+        return
     if _mouse_move_relative is None:
         _initialize_mouse_move()
     _mouse_move_relative(dx, dy)
@@ -107,6 +165,10 @@ def mouse_move_relative(dx: float, dy: float) -> None:
 
 def mouse_scroll_native(dx: float, dy: float) -> None:
     """Scroll using native platform API with sub-line precision"""
+    output = runtime.current.output
+    if output is not None:
+        output.scroll(dx, dy)
+        return
     if _mouse_scroll is None:
         _initialize_mouse_move()
     _mouse_scroll(dx, dy)
@@ -120,6 +182,26 @@ def mouse_scroll_native(dx: float, dy: float) -> None:
 SCROLL_EMIT_THRESHOLD = 0.001
 
 
+# ============================================================================
+# MOUSE-SPECIFIC: TIME-BASED INTEGRATION
+# ============================================================================
+
+# Upper bound on substeps for one late frame in time-based mode. A stall
+# longer than this many frame intervals is integrated in coarser steps
+# rather than replayed frame by frame.
+MAX_SUBSTEPS = 8
+
+
+# ============================================================================
+# MOUSE-SPECIFIC: ADAPTIVE FRAME RATE
+# ============================================================================
+
+# Largest cursor step (px) allowed per tick while the adaptive scheduler runs
+# below the full frame rate. One pixel, so slow drift still moves a pixel at
+# a time rather than visibly stepping. Anything faster stays at the full rate.
+ADAPTIVE_MAX_STEP_PX = 1.0
+
+
 # ============================================================================
 # MOUSE-SPECIFIC: SUBPIXEL ADJUSTER
 # ============================================================================
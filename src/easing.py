@@ -0,0 +1,268 @@
+"""Easing tables - custom easing curves compiled into lookup tables
+
+An EasingTable holds LUT_SIZE + 1 evenly spaced samples of a curve and
+evaluates by linear interpolation between them. Endpoints are exact.
+
+Custom curves compile into a table once, up front, and are registered into
+rig-core's EASING_FUNCTIONS, so lifecycles look them up by name like any
+built-in easing. They can't replace a built-in, and release() takes them
+back out (reload_rig() calls it, and a rebuild drops any a previous load of
+this module left behind), so rig-core's registries only hold them while the
+rig that registered them is loaded:
+
+    register_easing("snappy", cubic_bezier(0.2, 0.9, 0.3, 1.0))
+    register_easing("kick", piecewise([(0, 0), (0.2, 0.7), (1, 1)]))
+    rig.speed.offset.to(5).over(300, "snappy")
+
+or inline, registered on first use under their normalized spec:
+
+    rig.speed.to(10).over(500, "cubic_bezier(0.2, 0.9, 0.3, 1)")
+    rig.speed.to(10).over(500, "piecewise(0:0, 0.2:0.7, 1:1)")
+
+Cubic-bezier curves are inverted by sampling x(u) densely and walking it,
+so no Newton iteration runs at all, let alone per frame.
+
+Built-in easings are left as they are: they are a few multiplications, which
+CPython evaluates faster than an index plus a lerp. get_table() tabulates
+any easing by name (cached) for code that samples a curve many times.
+"""
+
+import re
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+# Intervals per table (LUT_SIZE + 1 samples)
+LUT_SIZE = 512
+
+# Bezier samples per table interval when inverting x(u)
+BEZIER_OVERSAMPLE = 8
+
+# Set by _build_classes
+_core = None
+
+# Custom curves by name, installed into rig-core when it is available
+_custom: dict = {}
+
+# Inline specs as written -> registered name, so each compiles once
+_spec_names: dict = {}
+
+# Tables of built-in easings, built on first get_table()
+_tables: dict = {}
+
+_SPEC = re.compile(r"^\s*(cubic[-_]bezier|piecewise)\s*\((.*)\)\s*$")
+
+
+class EasingTable:
+    """An easing curve sampled at LUT_SIZE + 1 evenly spaced points"""
+
+    __slots__ = ("name", "table", "_last")
+
+    # Marks entries in rig-core's EASING_FUNCTIONS as ours, including ones
+    # installed by an earlier load of this module
+    mouse_rig_easing = True
+
+    def __init__(self, values: Sequence[float], name: str = ""):
+        if len(values) < 2:
+            raise ValueError("An easing table needs at least 2 samples")
+        self.name = name
+        self.table = tuple(float(v) for v in values)
+        self._last = len(self.table) - 1
+
+    @classmethod
+    def from_function(cls, fn: Callable[[float], float], name: str = "", size: int = LUT_SIZE) -> 'EasingTable':
+        return cls([fn(i / size) for i in range(size + 1)], name)
+
+    def __call__(self, t: float) -> float:
+        if t <= 0.0:
+            return self.table[0]
+        if t >= 1.0:
+            return self.table[self._last]
+        x = t * self._last
+        i = int(x)
+        a = self.table[i]
+        return a + (self.table[i + 1] - a) * (x - i)
+
+    def __repr__(self) -> str:
+        return f"EasingTable({self.name or '?'}, {self._last + 1} samples)"
+
+
+def cubic_bezier(x1: float, y1: float, x2: float, y2: float, name: str = "", size: int = LUT_SIZE) -> EasingTable:
+    """Compile a CSS-style cubic-bezier(x1, y1, x2, y2) curve into a table
+
+    x1 and x2 must be within [0, 1] so the curve is a function of time;
+    y1 and y2 may overshoot for anticipation/bounce.
+    """
+    if not (0.0 <= x1 <= 1.0 and 0.0 <= x2 <= 1.0):
+        raise ValueError(f"cubic_bezier x1 and x2 must be between 0 and 1, got {x1}, {x2}")
+
+    def bezier(u, p1, p2):
+        v = 1.0 - u
+        return 3.0 * v * v * u * p1 + 3.0 * v * u * u * p2 + u * u * u
+
+    samples = size * BEZIER_OVERSAMPLE
+    xs = [bezier(j / samples, x1, x2) for j in range(samples + 1)]
+    ys = [bezier(j / samples, y1, y2) for j in range(samples + 1)]
+
+    values = [0.0]
+    j = 0
+    for k in range(1, size):
+        x = k / size
+        while xs[j + 1] < x:
+            j += 1
+        span = xs[j + 1] - xs[j]
+        f = (x - xs[j]) / span if span > 0 else 0.0
+        values.append(ys[j] + (ys[j + 1] - ys[j]) * f)
+    values.append(1.0)
+    return EasingTable(values, name or f"cubic_bezier({x1:g}, {y1:g}, {x2:g}, {y2:g})")
+
+
+def piecewise(points: Sequence[Tuple[float, float]], name: str = "", size: int = LUT_SIZE) -> EasingTable:
+    """Compile straight segments through (t, value) points into a table
+
+    t must start at 0, end at 1 and increase; values are free, so a curve
+    can overshoot or dip.
+    """
+    points = [(float(t), float(v)) for t, v in points]
+    if len(points) < 2 or points[0][0] != 0.0 or points[-1][0] != 1.0:
+        raise ValueError("piecewise points must run from t=0 to t=1")
+    if any(b[0] <= a[0] for a, b in zip(points, points[1:])):
+        raise ValueError("piecewise points must have increasing t")
+
+    values = []
+    j = 0
+    for k in range(size + 1):
+        t = k / size
+        while j < len(points) - 2 and points[j + 1][0] < t:
+            j += 1
+        (t0, v0), (t1, v1) = points[j], points[j + 1]
+        values.append(v0 + (v1 - v0) * (t - t0) / (t1 - t0))
+    default = "piecewise(" + ", ".join(f"{t:g}:{v:g}" for t, v in points) + ")"
+    return EasingTable(values, name or default)
+
+
+def parse_easing(spec: str) -> Optional[EasingTable]:
+    """Compile an inline "cubic_bezier(...)" / "piecewise(t:v, ...)" spec,
+    or None if `spec` isn't one"""
+    match = _SPEC.match(spec)
+    if match is None:
+        return None
+    kind, args = match.groups()
+    try:
+        if kind == "piecewise":
+            points = [tuple(float(n) for n in part.split(":")) for part in args.split(",")]
+            return piecewise(points)
+        values = [float(n) for n in args.split(",")]
+        if len(values) != 4:
+            raise ValueError(f"cubic_bezier takes 4 numbers, got {len(values)}")
+        return cubic_bezier(*values)
+    except (TypeError, ValueError) as e:
+        raise _config_error(f"Invalid easing '{spec}': {e}") from None
+
+
+def register_easing(name: str, curve: Union[EasingTable, Callable[[float], float], str]) -> str:
+    """Make `curve` usable as an easing called `name`
+
+    curve is an EasingTable (cubic_bezier / piecewise), a plain function of
+    t (tabulated here) or an inline spec string. Returns the name.
+    """
+    if isinstance(curve, str):
+        table = parse_easing(curve)
+        if table is None:
+            raise _config_error(f"Invalid easing '{curve}': expected cubic_bezier(...) or piecewise(...)")
+    elif isinstance(curve, EasingTable):
+        table = curve
+    elif callable(curve):
+        table = EasingTable.from_function(curve, name)
+    else:
+        raise TypeError(f"Easing curve must be an EasingTable, a function or a spec string, not {type(curve).__name__}")
+
+    if _core is not None and _is_builtin(_core, name):
+        raise _config_error(f"Can't register easing '{name}': it would replace rig-core's built-in easing")
+
+    _custom[name] = table
+    if _core is not None:
+        _install(_core, name, table)
+
+    from .trajectory import clear_plans
+    clear_plans()
+    return name
+
+
+def resolve_easing(easing):
+    """Name to store on a builder config for `easing`: known names pass
+    through, inline specs and EasingTables are registered on first use"""
+    if isinstance(easing, EasingTable):
+        return register_easing(easing.name or f"custom_{id(easing)}", easing)
+    if not isinstance(easing, str) or easing in _custom:
+        return easing
+    if easing in _spec_names:
+        return _spec_names[easing]
+    if _core is not None and easing in _core.EASING_FUNCTIONS:
+        return easing
+    table = parse_easing(easing)
+    if table is None:
+        return easing
+    _spec_names[easing] = register_easing(table.name, table)
+    return _spec_names[easing]
+
+
+def get_table(name: str) -> EasingTable:
+    """EasingTable for any registered easing name"""
+    table = _custom.get(name) or _tables.get(name)
+    if table is None:
+        fn = _core.EASING_FUNCTIONS.get(name) if _core is not None else None
+        if fn is None:
+            raise _config_error(f"Unknown easing '{name}'")
+        table = _tables[name] = EasingTable.from_function(fn, name)
+    return table
+
+
+def _config_error(message: str) -> Exception:
+    return _core.ConfigError(message) if _core is not None else ValueError(message)
+
+
+def release():
+    """Take every custom easing back out of rig-core's registries"""
+    if _core is not None:
+        _uninstall(_core)
+    _tables.clear()
+
+
+def _is_builtin(core, name: str) -> bool:
+    fn = core.EASING_FUNCTIONS.get(name)
+    return fn is not None and not getattr(fn, "mouse_rig_easing", False)
+
+
+def _install(core, name: str, table: EasingTable):
+    if _is_builtin(core, name):
+        print(f"[Mouse Rig] Easing '{name}' not registered: it would replace rig-core's built-in easing")
+        return
+    core.EASING_FUNCTIONS[name] = table
+    valid = core.VALID_EASINGS
+    if name in valid:
+        return
+    if hasattr(valid, "append"):
+        valid.append(name)
+    elif hasattr(valid, "add"):
+        valid.add(name)
+
+
+def _uninstall(core):
+    """Remove every EASING_FUNCTIONS entry this module (in any load) added"""
+    names = [name for name, fn in core.EASING_FUNCTIONS.items() if getattr(fn, "mouse_rig_easing", False)]
+    valid = core.VALID_EASINGS
+    for name in names:
+        del core.EASING_FUNCTIONS[name]
+        if name in valid:
+            if hasattr(valid, "remove"):
+                valid.remove(name)
+            elif hasattr(valid, "discard"):
+                valid.discard(name)
+
+
+def _build_classes(core):
+    global _core
+    _core = core
+    _tables.clear()
+    _uninstall(core)
+    for name, table in _custom.items():
+        _install(core, name, table)
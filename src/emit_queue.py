@@ -0,0 +1,203 @@
+"""Emit queue - hand each frame's backend calls to an emission thread
+
+With user.mouse_rig_async_emit on, the frame loop no longer calls the mouse
+backend inline. Every move/scroll call a tick makes is collected into one
+batch, and the batch is queued for a worker thread that replays it between
+begin_frame()/end_frame(). A slow backend call (X11 sync, Talon action
+dispatch) then delays later output, not the next frame's computation.
+
+The queue is bounded. When it is full, the new batch is merged into the
+newest queued one rather than dropped: relative moves and scroll add up,
+absolute moves keep the latest target. Order between absolute and relative
+moves is kept, so no motion is lost or reordered.
+
+Backend calls made outside a tick (instant pos.to, bake) wait for the queue
+to drain and then run inline, so they never overtake queued frames and the
+backend is never used from two threads at once.
+
+Metrics (rig.state.emit_queue):
+    depth       batches waiting when a frame is committed (mean, max)
+    merged      frames folded into an earlier batch because the queue was full
+    latency     commit -> start of emission
+    backend     time spent in the backend per batch
+"""
+
+import threading
+import time
+import traceback
+from collections import deque
+
+from .mouse_api import begin_frame, end_frame
+from .perf import PhaseStats, HISTOGRAM_BOUNDS_US
+
+# Batches waiting for the emission thread before new frames merge
+EMIT_QUEUE_DEPTH = 4
+
+# Seconds to wait for the queue to drain before emitting inline anyway
+DRAIN_TIMEOUT = 0.1
+
+EMIT_ABSOLUTE = 0   # move to (x, y) - later calls replace earlier ones
+EMIT_RELATIVE = 1   # move by (dx, dy) - calls add up
+EMIT_SCROLL = 2     # scroll by (x, y) lines - calls add up
+
+
+def _merge(batch: list, op: tuple):
+    """Fold `op` into `batch` without changing what it emits"""
+    kind, fn = op[0], op[1]
+    is_scroll = kind == EMIT_SCROLL
+    for i in range(len(batch) - 1, -1, -1):
+        last = batch[i]
+        if (last[0] == EMIT_SCROLL) != is_scroll:
+            continue
+        if last[0] == kind and last[1] is fn:
+            if kind == EMIT_ABSOLUTE:
+                batch[i] = op
+            else:
+                batch[i] = (kind, fn, last[2] + op[2], last[3] + op[3])
+            return
+        break
+    batch.append(op)
+
+
+class EmitQueue:
+    """Bounded queue of per-frame backend calls, drained by its own thread"""
+
+    def __init__(self, maxlen: int = EMIT_QUEUE_DEPTH, clock=time.perf_counter):
+        self.maxlen = maxlen
+        self._clock = clock
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._batch = None
+        self._busy = False
+        self._thread = None
+        self.reset()
+
+    def reset(self):
+        self.batches = 0
+        self.merged = 0
+        self.max_depth = 0
+        self._depth_total = 0
+        self.latency = PhaseStats()
+        self.backend = PhaseStats()
+
+    # ========================================================================
+    # Frame loop side
+    # ========================================================================
+
+    def begin(self):
+        """Start collecting a frame's backend calls"""
+        self._batch = []
+
+    def put(self, kind: int, fn, x: float, y: float):
+        """Queue a backend call in the open batch, or outside a frame, run it
+        inline once everything queued has been emitted"""
+        if self._batch is not None:
+            self._batch.append((kind, fn, x, y))
+            return
+        self.drain()
+        fn(x, y)
+
+    def commit(self):
+        """Queue the open batch, merging it into the newest one if full"""
+        batch, self._batch = self._batch, None
+        if not batch:
+            return
+        with self._cond:
+            queue = self._queue
+            if len(queue) >= self.maxlen:
+                tail = queue[-1][1]
+                for op in batch:
+                    _merge(tail, op)
+                self.merged += 1
+            else:
+                queue.append((self._clock(), batch))
+            depth = len(queue)
+            self.batches += 1
+            self._depth_total += depth
+            if depth > self.max_depth:
+                self.max_depth = depth
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="mouse_rig_emit", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def drain(self, timeout: float = DRAIN_TIMEOUT) -> bool:
+        """Wait until every queued batch has been emitted"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._busy, timeout)
+
+    def flush(self, timeout: float = DRAIN_TIMEOUT) -> bool:
+        """Queue the open batch, if any, and wait until everything is emitted"""
+        self.commit()
+        return self.drain(timeout)
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    # ========================================================================
+    # Emission thread
+    # ========================================================================
+
+    def _run(self):
+        cond = self._cond
+        clock = self._clock
+        while True:
+            with cond:
+                while not self._queue:
+                    cond.wait()
+                queued_at, batch = self._queue.popleft()
+                self._busy = True
+
+            start = clock()
+            begin_frame()
+            try:
+                for kind, fn, x, y in batch:
+                    fn(x, y)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                end_frame()
+            end = clock()
+
+            with cond:
+                self.latency.add(start - queued_at)
+                self.backend.add(end - start)
+                self._busy = False
+                cond.notify_all()
+
+    # ========================================================================
+    # Reporting
+    # ========================================================================
+
+    @property
+    def mean_depth(self) -> float:
+        return self._depth_total / self.batches if self.batches else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "mean_depth": self.mean_depth,
+            "batches": self.batches,
+            "merged": self.merged,
+            "latency": self.latency.to_dict(),
+            "backend": self.backend.to_dict(),
+            "histogram_bounds_us": list(HISTOGRAM_BOUNDS_US),
+        }
+
+    def report(self) -> str:
+        if not self.batches:
+            return "Mouse rig emit queue: no frames queued (user.mouse_rig_async_emit off?)"
+        bounds = "/".join(str(b) for b in HISTOGRAM_BOUNDS_US)
+        return "\n".join([
+            f"Mouse rig emit queue: {self.batches} frames, {self.merged} merged, "
+            f"depth mean {self.mean_depth:.2f} max {self.max_depth}/{self.maxlen}",
+            f"  latency  mean {self.latency.mean * 1e6:.0f}us, max {self.latency.max * 1e6:.0f}us, "
+            f"recent (<{bounds}us, over): {self.latency.histogram()}",
+            f"  backend  mean {self.backend.mean * 1e6:.0f}us, max {self.backend.max * 1e6:.0f}us, "
+            f"recent: {self.backend.histogram()}",
+        ])
+
+    def __repr__(self) -> str:
+        return self.report()
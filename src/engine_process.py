@@ -0,0 +1,420 @@
+"""Engine process - emit rig velocity from a separate worker process
+
+With user.mouse_rig_engine_process on, the frame loop still advances
+builders and computes velocity in Talon, but hands the resulting move and
+scroll velocity to a worker process instead of emitting it itself. The
+worker integrates that velocity on its own deadlines and emits through the
+same mouse_api backend. Talon pausing (GC, command parsing, a long phrase)
+then no longer freezes the cursor mid-motion: the worker keeps moving at
+the last velocity until the next update arrives.
+
+Position builders (pos.to / pos.by), scroll position, .api() overrides and
+backends that need Talon itself ("talon", macos_cgevent relative moves)
+stay in-process.
+
+Channels:
+    command ring   main -> worker, shared memory, single producer/consumer.
+                   Each slot carries its own sequence number, so the worker
+                   never acts on a half-written slot.
+    state block    worker -> main, shared memory seqlock. Readers retry
+                   instead of waiting, so rig.state.engine never blocks.
+    stdin pipe     closed when Talon exits; the worker exits on EOF.
+
+The worker is restarted (and re-sent the current velocity) if it dies or
+stops ticking; after MAX_RESTARTS failures in RESTART_WINDOW seconds the
+rig falls back to in-process emission. RigState closes its engine on
+reset() and reload_rig(); an EngineProcess dropped any other way (a module
+unload, Talon exiting) shuts its worker down and unlinks the shared memory
+when it is collected or at interpreter exit.
+
+Run as a script this file is the worker; imported, it only defines things.
+"""
+
+import importlib.util
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import threading
+import time
+import weakref
+from multiprocessing import shared_memory
+
+# Relative move APIs the worker can drive without Talon
+ENGINE_MOVE_APIS = ("windows_send_input", "windows_mouse_event", "linux_x11", "linux_uinput")
+ENGINE_SCROLL_APIS = ("windows_send_input", "windows_mouse_event", "macos_cgevent", "linux_x11", "linux_uinput")
+
+RING_SLOTS = 64
+_RING_HEADER = struct.Struct("<QQ")         # write index, read index
+_SLOT = struct.Struct("<QQddddd")           # sequence, opcode, 5 args
+_RING_SIZE = _RING_HEADER.size + RING_SLOTS * _SLOT.size
+
+# seq (odd while writing), ticks, pid, emitted x/y (px), scrolled x/y (lines),
+# velocity x/y (px/s), scroll velocity x/y (lines/s)
+_STATE = struct.Struct("<QQQdddddddd")
+
+CMD_VELOCITY = 1    # move vx, vy (px/s), scroll sx, sy (lines/s)
+CMD_INTERVAL = 2    # tick interval (ms)
+CMD_SHUTDOWN = 3
+
+# Worker must tick at least this often to count as alive (seconds); covers
+# interpreter startup too
+HEARTBEAT_TIMEOUT = 2.0
+MAX_RESTARTS = 3
+RESTART_WINDOW = 10.0
+
+
+# ============================================================================
+# SHARED MEMORY CHANNELS
+# ============================================================================
+
+class CommandRing:
+    """Fixed-size single-producer/single-consumer command queue"""
+
+    def __init__(self, shm):
+        self.shm = shm
+        self.buf = shm.buf
+
+    def push(self, opcode: int, *args) -> bool:
+        write, read = _RING_HEADER.unpack_from(self.buf, 0)
+        if write - read >= RING_SLOTS:
+            return False
+        values = (args + (0.0,) * 5)[:5]
+        offset = _RING_HEADER.size + (write % RING_SLOTS) * _SLOT.size
+        _SLOT.pack_into(self.buf, offset, write + 1, opcode, *values)
+        struct.pack_into("<Q", self.buf, 0, write + 1)
+        return True
+
+    def pop(self):
+        """Next command as (opcode, args), or None if empty or not yet visible"""
+        write, read = _RING_HEADER.unpack_from(self.buf, 0)
+        if read >= write:
+            return None
+        offset = _RING_HEADER.size + (read % RING_SLOTS) * _SLOT.size
+        seq, opcode, *args = _SLOT.unpack_from(self.buf, offset)
+        if seq != read + 1:
+            return None
+        struct.pack_into("<Q", self.buf, 8, read + 1)
+        return opcode, args
+
+
+class StateBlock:
+    """Seqlock-protected worker state; reads never block"""
+
+    FIELDS = (
+        "ticks", "pid", "emitted_x", "emitted_y", "scrolled_x", "scrolled_y",
+        "velocity_x", "velocity_y", "scroll_velocity_x", "scroll_velocity_y",
+    )
+
+    def __init__(self, shm):
+        self.shm = shm
+        self.buf = shm.buf
+        self._seq = 0
+        self._last = None
+
+    def write(self, *values):
+        self._seq += 1
+        struct.pack_into("<Q", self.buf, 0, self._seq)
+        _STATE.pack_into(self.buf, 0, self._seq, *values)
+        self._seq += 1
+        struct.pack_into("<Q", self.buf, 0, self._seq)
+
+    def read(self, attempts: int = 4):
+        """Latest consistent snapshot as a dict (the previous one if the
+        worker kept writing through every attempt)"""
+        for _ in range(attempts):
+            seq, *values = _STATE.unpack_from(self.buf, 0)
+            if seq % 2 == 0 and struct.unpack_from("<Q", self.buf, 0)[0] == seq:
+                self._last = dict(zip(self.FIELDS, values))
+                break
+        return self._last
+
+
+# ============================================================================
+# MAIN PROCESS SIDE
+# ============================================================================
+
+def _shutdown(process, ring: CommandRing, state: StateBlock):
+    """Stop a worker and unlink its shared memory. Holds no reference to the
+    EngineProcess, so it can run as that object's finalizer."""
+    if process is not None:
+        try:
+            ring.push(CMD_SHUTDOWN)
+            process.stdin.close()
+            process.wait(0.5)
+        except Exception:
+            process.kill()
+    for channel in (ring, state):
+        if channel is not None:
+            try:
+                channel.buf.release()
+                channel.shm.close()
+                channel.shm.unlink()
+            except Exception:
+                pass
+
+
+def find_python(setting: str = "") -> str:
+    """Interpreter for the worker. Talon's own executable is not a plain
+    Python, so default to one on PATH."""
+    return setting or shutil.which("python3") or shutil.which("python") or sys.executable
+
+
+def engine_config(move_api: str, scroll_api: str, scale: float, python: str = ""):
+    """(move_api, scroll_api, scale, python) for an EngineProcess, or None if
+    relative moves on this API can't be emitted out of process. scroll_api is
+    "" when scrolling has to stay in-process."""
+    if move_api not in ENGINE_MOVE_APIS:
+        return None
+    if scroll_api not in ENGINE_SCROLL_APIS:
+        scroll_api = ""
+    return (move_api, scroll_api, float(scale), find_python(python))
+
+
+class EngineProcess:
+    """Owns one worker process and its shared memory"""
+
+    def __init__(self, move_api: str, scroll_api: str, scale: float, python: str):
+        self.config = (move_api, scroll_api, scale, python)
+        self.move_api = move_api
+        self.scroll_api = scroll_api
+        self.scale = scale
+        self.python = python
+        self.failed = False
+        self.restarts = []
+        self._process = None
+        self._ring = None
+        self._state = None
+        self._velocity = (0.0, 0.0, 0.0, 0.0)
+        self._interval_ms = 16
+        self._pending = []
+        self._last_ticks = -1
+        self._last_progress = 0.0
+        self._ready = False
+        self._finalizer = None
+
+    def start(self):
+        ring_shm = shared_memory.SharedMemory(create=True, size=_RING_SIZE)
+        state_shm = shared_memory.SharedMemory(create=True, size=_STATE.size)
+        ring_shm.buf[:_RING_SIZE] = bytes(_RING_SIZE)
+        state_shm.buf[:_STATE.size] = bytes(_STATE.size)
+        self._ring = CommandRing(ring_shm)
+        self._state = StateBlock(state_shm)
+        self._ready = False
+        # A new worker starts still; velocity goes over once it is ready
+        self._velocity = (0.0, 0.0, 0.0, 0.0)
+        self._pending = [
+            (CMD_INTERVAL, float(self._interval_ms)),
+            (CMD_VELOCITY,) + self._velocity,
+        ]
+        try:
+            self._process = subprocess.Popen(
+                [self.python, os.path.abspath(__file__), ring_shm.name, state_shm.name,
+                 self.move_api, self.scroll_api, repr(self.scale)],
+                stdin=subprocess.PIPE,
+            )
+        finally:
+            self._finalizer = weakref.finalize(self, _shutdown, self._process, self._ring, self._state)
+        self._last_ticks = -1
+        self._last_progress = time.monotonic()
+        self._flush()
+
+    def close(self):
+        """Stop the worker and free its shared memory. Safe to call twice."""
+        finalizer, self._finalizer = self._finalizer, None
+        self._process = None
+        self._ring = self._state = None
+        self._ready = False
+        if finalizer is not None:
+            finalizer()
+
+    @property
+    def handles_scroll(self) -> bool:
+        return bool(self.scroll_api)
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def ready(self) -> bool:
+        """True once the current worker has ticked. Until then it is still
+        starting up (interpreter, backend imports) and the rig keeps
+        emitting in-process."""
+        if not self._ready:
+            state = self.read_state()
+            self._ready = state is not None and state["ticks"] > 0
+        return self._ready
+
+    def ensure_running(self) -> bool:
+        """Restart the worker if it died or stopped ticking. False once it
+        has failed too often and the rig should emit in-process."""
+        if self.failed:
+            return False
+        if self._process is not None:
+            if self._process.poll() is None and not self._stalled():
+                return True
+            print("[Mouse Rig] Engine process stopped, restarting")
+            self.close()
+        now = time.monotonic()
+        self.restarts = [t for t in self.restarts if now - t < RESTART_WINDOW] + [now]
+        if len(self.restarts) > MAX_RESTARTS:
+            print("[Mouse Rig] Engine process keeps failing, emitting in-process")
+            self.failed = True
+            return False
+        try:
+            self.start()
+        except Exception as e:
+            print(f"[Mouse Rig] Could not start engine process: {e}")
+            self.close()
+            self.failed = True
+            return False
+        return True
+
+    def _stalled(self) -> bool:
+        state = self._state.read()
+        now = time.monotonic()
+        if state is not None and state["ticks"] != self._last_ticks:
+            self._last_ticks = state["ticks"]
+            self._last_progress = now
+            return False
+        return now - self._last_progress > HEARTBEAT_TIMEOUT
+
+    def set_velocity(self, vx: float, vy: float, sx: float, sy: float):
+        velocity = (vx, vy, sx, sy)
+        if velocity != self._velocity:
+            self._velocity = velocity
+            self._queue((CMD_VELOCITY,) + velocity)
+
+    def set_interval(self, interval_ms: float):
+        if interval_ms != self._interval_ms:
+            self._interval_ms = interval_ms
+            self._queue((CMD_INTERVAL, float(interval_ms)))
+
+    def read_state(self):
+        return self._state.read() if self._state is not None else None
+
+    def _queue(self, command: tuple):
+        # Only the latest of each command matters
+        self._pending = [c for c in self._pending if c[0] != command[0]] + [command]
+        self._flush()
+
+    def _flush(self):
+        if self._ring is None:
+            return
+        while self._pending and self._ring.push(*self._pending[0]):
+            self._pending.pop(0)
+
+
+# ============================================================================
+# WORKER PROCESS
+# ============================================================================
+
+class _WorkerSettings:
+    """The settings mouse_api reads, supplied by the parent instead of Talon"""
+
+    def __init__(self, values: dict):
+        self._values = values
+
+    def get(self, name, default=None):
+        return self._values.get(name, default)
+
+
+def _load_sibling(name: str):
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{name}.py")
+    spec = importlib.util.spec_from_file_location(f"mouse_rig_engine_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _attach(name: str):
+    """Open the parent's shared memory without letting this process's
+    resource tracker unlink it on exit (the parent owns it)"""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    return shm
+
+
+def _exit_on_eof():
+    """Talon closing our stdin (or exiting) ends the worker"""
+    try:
+        sys.stdin.buffer.read()
+    finally:
+        os._exit(0)
+
+
+def worker_main(ring_name: str, state_name: str, move_api: str, scroll_api: str, scale: float):
+    mouse_api = _load_sibling("mouse_api")
+    frame_thread = _load_sibling("frame_thread")
+    mouse_api.settings = _WorkerSettings({"user.mouse_rig_scale": scale})
+
+    if move_api not in ENGINE_MOVE_APIS or not getattr(mouse_api, f"_{move_api}_available", False):
+        print(f"[Mouse Rig] Engine process: {move_api} not available", file=sys.stderr)
+        sys.exit(2)
+    _, move_relative = mouse_api._make_mouse_move(move_api)
+    scroll = mouse_api._make_mouse_scroll(scroll_api) if scroll_api else None
+
+    ring = CommandRing(_attach(ring_name))
+    state = StateBlock(_attach(state_name))
+    threading.Thread(target=_exit_on_eof, daemon=True).start()
+
+    deadlines = frame_thread.Deadlines(0.016)
+    clock = deadlines.clock
+    vx = vy = sx = sy = 0.0
+    frac_x = frac_y = 0.0
+    emitted_x = emitted_y = scrolled_x = scrolled_y = 0.0
+    ticks = 0
+    pid = os.getpid()
+
+    last = clock()
+    while True:
+        deadlines.wait()
+        now = clock()
+        dt = now - last
+        last = now
+
+        command = ring.pop()
+        while command is not None:
+            opcode, args = command
+            if opcode == CMD_VELOCITY:
+                vx, vy, sx, sy = args[:4]
+                if vx == 0 and vy == 0:
+                    frac_x = frac_y = 0.0
+            elif opcode == CMD_INTERVAL:
+                deadlines.interval = max(0.001, args[0] / 1000.0)
+            elif opcode == CMD_SHUTDOWN:
+                return
+            command = ring.pop()
+
+        mouse_api.begin_frame()
+        try:
+            if vx or vy:
+                frac_x += vx * dt
+                frac_y += vy * dt
+                dx, dy = int(frac_x), int(frac_y)
+                if dx or dy:
+                    frac_x -= dx
+                    frac_y -= dy
+                    move_relative(dx, dy)
+                    emitted_x += dx
+                    emitted_y += dy
+            if scroll is not None and (sx or sy):
+                scroll(sx * dt, sy * dt)
+                scrolled_x += sx * dt
+                scrolled_y += sy * dt
+        finally:
+            mouse_api.end_frame()
+
+        ticks += 1
+        state.write(ticks, pid, emitted_x, emitted_y, scrolled_x, scrolled_y, vx, vy, sx, sy)
+        deadlines.advance()
+
+
+if __name__ == "__main__":
+    worker_main(sys.argv[1], sys.argv[2], sys.argv[3], sys.argv[4], float(sys.argv[5]))
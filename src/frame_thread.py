@@ -0,0 +1,126 @@
+"""Frame thread - run the frame loop on a dedicated timing thread
+
+Used instead of cron.interval when user.mouse_rig_frame_thread is on.
+Talon's cron runs on the main thread alongside speech decoding, action
+dispatch and UI work, and has millisecond granularity; a long phrase can
+hold a frame back by tens of ms. FrameThread keeps its own deadlines: it
+sleeps until shortly before each one, then spins (yielding the GIL) until
+the deadline. Missed deadlines are skipped rather than replayed in a burst.
+
+State is handed between threads with the rig state's RLock: each tick runs
+holding it, and every main-thread entry point that mutates the rig (builder
+execution, stop/reset/reverse/bake/emit, stop callbacks) takes it too - see
+`locked`. So do reads of computed state: evaluating a builder advances its
+lifecycle, and rig.state.at() swaps the clock rig-core reads, so a read is
+never safe alongside a tick. A snapshot already computed for the frame is
+immutable and is handed out without locking. User callbacks raised by a
+tick are handed back to Talon's main thread (see on_frame_thread).
+
+Deadlines is the timing loop on its own, also used by the engine process
+worker. Both take the clock and sleep function to use, so tests can run
+them on a virtual clock.
+"""
+
+import functools
+import threading
+import time
+import traceback
+
+# Wake this long before a deadline and spin the rest of the way. Covers
+# sleep overshoot on most systems without spinning for long.
+SPIN_SECONDS = 0.001
+
+
+def locked(get_state):
+    """Decorator: run a method holding the lock of the rig state returned by
+    get_state(self)"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with get_state(self)._lock:
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def on_frame_thread() -> bool:
+    """True when called from a FrameThread tick"""
+    return isinstance(threading.current_thread(), FrameThread)
+
+
+def _wait_until(deadline: float, stopped: threading.Event = None, clock=time.perf_counter, sleep=time.sleep):
+    remaining = deadline - clock()
+    if remaining > SPIN_SECONDS:
+        sleep(remaining - SPIN_SECONDS)
+    while clock() < deadline and not (stopped is not None and stopped.is_set()):
+        sleep(0)
+
+
+class Deadlines:
+    """A deadline every `interval` seconds
+
+    wait() returns at the next deadline, sleeping until shortly before it
+    and spinning the rest of the way; advance() moves to the one after,
+    skipping any that have already passed. `interval` may be changed
+    between ticks.
+    """
+
+    def __init__(self, interval: float, clock=time.perf_counter, sleep=time.sleep):
+        self.interval = interval
+        self.clock = clock
+        self.sleep = sleep
+        self.deadline = clock() + interval
+
+    def wait(self, stopped: threading.Event = None):
+        """Block until the deadline, or until `stopped` is set"""
+        _wait_until(self.deadline, stopped, self.clock, self.sleep)
+
+    def advance(self):
+        interval = self.interval
+        self.deadline += interval
+        late = self.clock() - self.deadline
+        if late > 0:
+            self.deadline += (int(late / interval) + 1) * interval
+
+
+class FrameThread(threading.Thread):
+    """Calls `callback` every `interval` seconds while holding `lock`
+
+    `clock` and `sleep` default to the real ones (see Deadlines).
+    """
+
+    def __init__(self, interval: float, callback, lock, clock=time.perf_counter, sleep=time.sleep):
+        super().__init__(name="mouse_rig_frame", daemon=True)
+        self.interval = interval
+        self.callback = callback
+        self.lock = lock
+        self.clock = clock
+        self.sleep = sleep
+        self._stopped = threading.Event()
+
+    def cancel(self):
+        """Stop after the current tick. Safe from any thread, including this one."""
+        self._stopped.set()
+
+    @property
+    def active(self) -> bool:
+        return not self._stopped.is_set()
+
+    def run(self):
+        deadlines = Deadlines(self.interval, self.clock, self.sleep)
+        while not self._stopped.is_set():
+            deadlines.wait(self._stopped)
+            with self.lock:
+                if self._stopped.is_set():
+                    break
+                try:
+                    self.callback()
+                except Exception:
+                    traceback.print_exc()
+            deadlines.advance()
+
+
+def start_frame_thread(interval: float, callback, lock, clock=time.perf_counter, sleep=time.sleep) -> FrameThread:
+    thread = FrameThread(interval, callback, lock, clock, sleep)
+    thread.start()
+    return thread
@@ -0,0 +1,295 @@
+"""Headless runtime - run the rig engine without a live cursor or wall clock
+
+HeadlessRuntime implements the runtime interface (see runtime.py) with a
+virtual clock, a manually stepped scheduler, a simulated cursor and an
+output that records every emitted move/scroll instead of sending it to the
+OS. Simulation wires it up around a fresh RigState so tests and benchmarks
+can drive the real engine frame by frame, faster than real time:
+
+    from .src.headless import Simulation
+
+    with Simulation(settings={"user.mouse_rig_frame_interval": 16}) as sim:
+        rig = sim.rig()
+        rig.direction.to(1, 0)
+        rig.speed.to(3)
+        sim.run_frames(60)
+        print(sim.cursor, len(sim.output.relative_events))
+
+Inside Talon the already-initialized rig-core is reused. Outside Talon pass
+`core=` (a rig-core instance) and make sure `talon` is importable - the
+engine modules still import it at module level.
+
+rig-core reads time.perf_counter() itself (lifecycle start times, group
+creation). While a Simulation is open, the `time` global of every loaded
+rig-core module is pointed at the virtual clock and restored on close.
+"""
+
+import sys
+from typing import Optional
+
+from . import runtime as _runtime
+from .runtime import parse_interval, bind_core_clock, unbind_core_clock
+
+# Start the virtual clock well away from zero so "time since" math never
+# goes negative when code subtracts a default of 0
+DEFAULT_START_TIME = 1000.0
+
+# Engine settings read through runtime.setting(), mirroring the defaults in
+# mouse_rig_settings.py
+DEFAULT_SETTINGS = {
+    "user.mouse_rig_frame_interval": 16,
+    "user.mouse_rig_frame_thread": False,
+    "user.mouse_rig_engine_process": False,
+    "user.mouse_rig_async_emit": False,
+    "user.mouse_rig_time_based": False,
+    "user.mouse_rig_adaptive_frame_rate": False,
+    "user.mouse_rig_max_frame_interval": 64,
+    "user.mouse_rig_idle_grace_ms": 500,
+    "user.mouse_rig_perf": False,
+    "user.mouse_rig_scale": 1.0,
+}
+
+
+class VirtualClock:
+    """Monotonic clock that only moves when told to"""
+
+    def __init__(self, start: float = DEFAULT_START_TIME):
+        self.time = start
+
+    def now(self) -> float:
+        return self.time
+
+    def advance(self, seconds: float) -> None:
+        self.time += seconds
+
+
+class _Job:
+    __slots__ = ("due", "interval", "callback", "active")
+
+    def __init__(self, due: float, interval: Optional[float], callback):
+        self.due = due
+        self.interval = interval    # None for one-shot jobs
+        self.callback = callback
+        self.active = True
+
+
+class RecordingOutput:
+    """Records emitted events as (time, x, y) and moves the simulated cursor"""
+
+    def __init__(self, headless_runtime: "HeadlessRuntime"):
+        self._runtime = headless_runtime
+        self.absolute_events = []
+        self.relative_events = []
+        self.scroll_events = []
+
+    def move_absolute(self, x: float, y: float) -> None:
+        self.absolute_events.append((self._runtime.now(), x, y))
+        self._runtime.cursor = [float(x), float(y)]
+
+    def move_relative(self, dx: float, dy: float) -> None:
+        self.relative_events.append((self._runtime.now(), dx, dy))
+        self._runtime.cursor[0] += dx
+        self._runtime.cursor[1] += dy
+
+    def scroll(self, dx: float, dy: float) -> None:
+        self.scroll_events.append((self._runtime.now(), dx, dy))
+
+    def clear(self) -> None:
+        self.absolute_events.clear()
+        self.relative_events.clear()
+        self.scroll_events.clear()
+
+
+class HeadlessRuntime:
+    """Runtime with a virtual clock, manual scheduler and recorded output"""
+
+    def __init__(self, settings: Optional[dict] = None, cursor: tuple = (0, 0),
+                 start_time: float = DEFAULT_START_TIME):
+        self.clock = VirtualClock(start_time)
+        self.settings = dict(DEFAULT_SETTINGS)
+        for name, value in (settings or {}).items():
+            self.settings[name if name.startswith("user.") else f"user.{name}"] = value
+        self.cursor = [float(cursor[0]), float(cursor[1])]
+        self.output = RecordingOutput(self)
+        self.clicks = []
+        self._jobs = []
+
+    # ========================================================================
+    # Runtime interface
+    # ========================================================================
+
+    def now(self) -> float:
+        return self.clock.time
+
+    def setting(self, name: str, default=None):
+        return self.settings.get(name, default)
+
+    def schedule_interval(self, interval, callback) -> _Job:
+        seconds = parse_interval(interval)
+        job = _Job(self.clock.time + seconds, seconds, callback)
+        self._jobs.append(job)
+        return job
+
+    def schedule_thread_interval(self, interval, callback, lock) -> _Job:
+        # No real threads on a virtual clock - tick from the manual scheduler,
+        # holding the lock as a FrameThread would
+        def tick():
+            with lock:
+                callback()
+        return self.schedule_interval(interval, tick)
+
+    def after(self, delay, callback) -> _Job:
+        job = _Job(self.clock.time + parse_interval(delay), None, callback)
+        self._jobs.append(job)
+        return job
+
+    def cancel(self, job) -> None:
+        if job is None:
+            return
+        job.active = False
+        if job in self._jobs:
+            self._jobs.remove(job)
+
+    def mouse_pos(self) -> tuple:
+        return (int(round(self.cursor[0])), int(round(self.cursor[1])))
+
+    def mouse_click(self, **kwargs) -> None:
+        self.clicks.append((self.clock.time, kwargs))
+
+    # ========================================================================
+    # Stepping
+    # ========================================================================
+
+    def next_due(self) -> Optional[float]:
+        """Time of the next scheduled callback, or None if nothing is scheduled"""
+        return min((job.due for job in self._jobs), default=None)
+
+    def step(self) -> bool:
+        """Jump to the next scheduled callback and run it. False if none."""
+        if not self._jobs:
+            return False
+        job = min(self._jobs, key=lambda j: j.due)
+        self._run_job(job)
+        return True
+
+    def run_until(self, until: float) -> None:
+        """Run every callback due at or before `until`, then set the clock there"""
+        while self._jobs:
+            job = min(self._jobs, key=lambda j: j.due)
+            if job.due > until:
+                break
+            self._run_job(job)
+        if until > self.clock.time:
+            self.clock.time = until
+
+    def advance(self, ms: float) -> None:
+        """Advance the clock by `ms`, running callbacks as they come due"""
+        self.run_until(self.clock.time + ms / 1000.0)
+
+    def _run_job(self, job: _Job) -> None:
+        if job.due > self.clock.time:
+            self.clock.time = job.due
+        if job.interval is None:
+            self._jobs.remove(job)
+            job.active = False
+        else:
+            job.due += job.interval
+        job.callback()
+
+
+# ============================================================================
+# Simulation
+# ============================================================================
+
+class Simulation:
+    """A fresh RigState driven by a HeadlessRuntime
+
+    Use as a context manager; the headless runtime is active for the whole
+    engine between enter and exit, so only one Simulation can run at a time
+    and the real rig should be idle meanwhile.
+    """
+
+    def __init__(self, core=None, settings: Optional[dict] = None, cursor: tuple = (0, 0)):
+        self.runtime = HeadlessRuntime(settings, cursor)
+        self.state = None
+        self._core = core
+        self._bound = []
+
+    def __enter__(self) -> "Simulation":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self) -> None:
+        from . import state as _state_mod
+        _package = sys.modules[__package__]
+
+        core = self._core
+        if core is not None:
+            _package._build_all(core)
+        else:
+            if not _package._ready:
+                raise RuntimeError("Simulation: rig-core not initialized, pass core=")
+            from talon import actions
+            core = actions.user.rig_core()
+
+        _runtime.install(self.runtime)
+        self._bound = bind_core_clock(core, self.runtime.clock.now)
+        self.state = _state_mod.RigState()
+
+    def close(self) -> None:
+        if self.state is not None:
+            self.state.shutdown()
+            self.state = None
+        unbind_core_clock(self._bound)
+        self._bound = []
+        if _runtime.current is self.runtime:
+            _runtime.uninstall()
+
+    def rig(self):
+        """A Rig bound to this simulation's state"""
+        from . import Rig
+        return Rig(self.state)
+
+    # ========================================================================
+    # Stepping
+    # ========================================================================
+
+    def run_frames(self, count: int) -> int:
+        """Run up to `count` frame ticks (and anything scheduled before them).
+        Returns the number of frames run; stops early when the loop stops."""
+        frames = 0
+        while frames < count:
+            job = self.state._frame_loop_job
+            if job is None:
+                break
+            self.runtime.run_until(job.due)
+            frames += 1
+        return frames
+
+    def run_until_idle(self, max_frames: int = 100000) -> int:
+        """Run until the frame loop stops and no callbacks are pending"""
+        frames = 0
+        while frames < max_frames:
+            if self.state._frame_loop_job is not None:
+                frames += self.run_frames(1)
+            elif not self.runtime.step():
+                break
+        return frames
+
+    def advance(self, ms: float) -> None:
+        self.runtime.advance(ms)
+
+    @property
+    def now(self) -> float:
+        return self.runtime.now()
+
+    @property
+    def cursor(self) -> tuple:
+        return tuple(self.runtime.cursor)
+
+    @property
+    def output(self) -> RecordingOutput:
+        return self.runtime.output
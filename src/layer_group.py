@@ -1,12 +1,18 @@
 """Mouse LayerGroup - extends BaseLayerGroup with mouse-specific fields
 
 Mouse adds: input_type, committed_value, replace_target, copy() override,
-and pos.offset clamping in get_current_value/bake_builder.
+pos.offset clamping in get_current_value/bake_builder, change reporting
+for the fields LayerRegistry indexes on, and a cached aggregate value for
+groups whose builders are all holding or finished.
 (is_emit_layer and source_layer are inherited from BaseLayerGroup in rig-core.)
 """
 
+import math
 from typing import Optional, Any, TYPE_CHECKING
 
+from . import runtime
+from .soa import evaluate_group
+
 if TYPE_CHECKING:
     from .builder import ActiveBuilder
 
@@ -20,10 +26,35 @@ def _build_classes(core):
     Vec2 = core.Vec2
     is_vec2 = core.is_vec2
     EPSILON = core.EPSILON
+    HOLD = core.LifecyclePhase.HOLD
 
     class _MouseLayerGroup(core.BaseLayerGroup):
         """Extends BaseLayerGroup with mouse-specific tracking"""
 
+        # True while any builder in the group has an .api() override
+        has_api_override = False
+
+        # Builder values as arrays, once the group is big enough (see soa)
+        _soa = None
+
+        # Bumped by anything that changes the aggregate value other than
+        # time passing (see invalidate)
+        _version = 0
+
+        # get_current_value's last result, valid for _version while the
+        # clock is within [_cached_from, _cached_until)
+        _cached_value = None
+        _cached_version = -1
+        _cached_from = 0.0
+        _cached_until = 0.0
+
+        # Backing fields for the properties below
+        _accumulated_value = None
+        _committed_value = None
+        _replace_target = None
+        _max_value = None
+        _min_value = None
+
         def __init__(
             self,
             layer_name: str,
@@ -46,6 +77,166 @@ def _build_classes(core):
             # Replace behavior state (for pos.offset only)
             self.replace_target: Optional[Any] = None
 
+        # ====================================================================
+        # REGISTRY-INDEXED FIELDS
+        # The LayerRegistry files groups by order, input_type, is_emit_layer
+        # and api overrides, so changes to them are reported back to it.
+        # ====================================================================
+
+        def _reindex(self):
+            registry = self.__dict__.get('_registry')
+            if registry is not None:
+                registry.reindex(self)
+
+        @property
+        def order(self) -> Optional[int]:
+            return self._order
+
+        @order.setter
+        def order(self, value: Optional[int]):
+            self._order = value
+            self._reindex()
+
+        @property
+        def input_type(self) -> str:
+            return self._input_type
+
+        @input_type.setter
+        def input_type(self, value: str):
+            changed = self.__dict__.get('_input_type') != value
+            self._input_type = value
+            if changed:
+                self._reindex()
+
+        @property
+        def is_emit_layer(self) -> bool:
+            return self._is_emit_layer
+
+        @is_emit_layer.setter
+        def is_emit_layer(self, value: bool):
+            self._is_emit_layer = value
+            self._reindex()
+
+        @property
+        def builders(self) -> list:
+            return self._builders
+
+        @builders.setter
+        def builders(self, value: list):
+            self._builders = value
+            self._version += 1
+            self._update_api_override()
+
+        def add_builder(self, builder):
+            super().add_builder(builder)
+            self._version += 1
+            if builder.config.api_override is not None:
+                self._update_api_override()
+
+        def remove_builder(self, builder):
+            super().remove_builder(builder)
+            self._version += 1
+            if self.has_api_override:
+                self._update_api_override()
+
+        def clear_builders(self):
+            super().clear_builders()
+            self._version += 1
+            self._update_api_override()
+
+        # ====================================================================
+        # VALUE CACHE
+        # Fields the aggregate value is computed from report changes, and
+        # the state calls invalidate() for builder phase changes, reverts
+        # and stack weights. Time passing is covered by the cache window.
+        # ====================================================================
+
+        def invalidate(self):
+            """Drop the cached aggregate value"""
+            self._version += 1
+
+        @property
+        def accumulated_value(self) -> Any:
+            return self._accumulated_value
+
+        @accumulated_value.setter
+        def accumulated_value(self, value: Any):
+            self._accumulated_value = value
+            self._version += 1
+
+        @property
+        def committed_value(self) -> Any:
+            return self._committed_value
+
+        @committed_value.setter
+        def committed_value(self, value: Any):
+            self._committed_value = value
+            self._version += 1
+
+        @property
+        def replace_target(self) -> Any:
+            return self._replace_target
+
+        @replace_target.setter
+        def replace_target(self, value: Any):
+            self._replace_target = value
+            self._version += 1
+
+        @property
+        def max_value(self) -> Any:
+            return self._max_value
+
+        @max_value.setter
+        def max_value(self, value: Any):
+            self._max_value = value
+            self._version += 1
+
+        @property
+        def min_value(self) -> Any:
+            return self._min_value
+
+        @min_value.setter
+        def min_value(self, value: Any):
+            self._min_value = value
+            self._version += 1
+
+        def _static_until(self, now: float) -> Optional[float]:
+            """Until when every builder keeps its value (holding or finished),
+            or None if one is animating now"""
+            until = math.inf
+            for builder in self._builders:
+                group_lifecycle = builder.group_lifecycle
+                if group_lifecycle is not None and not group_lifecycle.is_complete():
+                    return None
+                lifecycle = builder.lifecycle
+                if lifecycle is None or lifecycle.is_complete():
+                    continue
+                if lifecycle.phase != HOLD:
+                    return None
+                if lifecycle.hold_ms is not None:
+                    end = lifecycle.phase_start_time + lifecycle.hold_ms / 1000.0
+                    if end < until:
+                        until = end
+                if builder._stack_parked:
+                    # A parked builder rejoining the group changes the value
+                    parked = builder._stack_parked[0].lifecycle
+                    if parked.hold_ms is not None:
+                        end = parked.phase_start_time + parked.hold_ms / 1000.0
+                        if end < until:
+                            until = end
+            return until if until > now else None
+
+        def _update_api_override(self):
+            """Recount .api() builders and tell the registry if that changed"""
+            has_api_override = any(
+                builder.config.api_override is not None for builder in self._builders
+            )
+            if has_api_override != self.has_api_override:
+                self.has_api_override = has_api_override
+                registry = self.__dict__.get('_registry')
+                if registry is not None:
+                    registry.update_api_override(self)
+
         def copy(self, new_name: str) -> '_MouseLayerGroup':
             """Create a copy of this layer group"""
             copy_group = _MouseLayerGroup(
@@ -140,6 +331,12 @@ def _build_classes(core):
             if self.is_base:
                 return super().get_current_value()
 
+            now = runtime.current.now()
+            if (self._cached_version == self._version
+                    and self._cached_from <= now < self._cached_until):
+                return self._cached_value
+            version = self._version
+
             # Modifier layers: start with accumulated value and apply modes
             result = self.accumulated_value
 
@@ -153,10 +350,8 @@ def _build_classes(core):
                 else:
                     result = 0.0
 
-            for builder in self.builders:
-                builder_value = builder.get_interpolated_value()
-                if builder_value is not None:
-                    result = self._apply_mode(result, builder_value, builder.config.mode)
+            total = evaluate_group(self, result, now)
+            result = total if total is not None else self._combine_builders(result)
 
             # Apply replace clamping for pos.offset
             if self.replace_target is not None and self.committed_value is not None:
@@ -182,7 +377,23 @@ def _build_classes(core):
 
                         result = Vec2(clamped_x - self.committed_value.x, clamped_y - self.committed_value.y)
 
-            return self._apply_constraints(result)
+            result = self._apply_constraints(result)
+
+            until = self._static_until(now)
+            if until is not None:
+                self._cached_value = result
+                self._cached_version = version
+                self._cached_from = now
+                self._cached_until = until
+            return result
+
+        def _combine_builders(self, result: Any) -> Any:
+            """Apply every builder's value to `result`, one object at a time"""
+            for builder in self.builders:
+                builder_value = builder.get_interpolated_value()
+                if builder_value is not None:
+                    result = self._apply_mode(result, builder_value, builder.config.mode)
+            return result
 
         def __repr__(self) -> str:
             return f"<MouseLayerGroup '{self.layer_name}' {self.property} mode={self.mode} builders={len(self.builders)} accumulated={self.accumulated_value}>"
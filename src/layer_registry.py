@@ -0,0 +1,228 @@
+"""Layer registry - the rig's layer name -> LayerGroup mapping with indexes
+
+A dict subclass, so everything that reads or writes `_layer_groups` (including
+rig-core) keeps working. On top of the mapping it keeps groups pre-sorted in
+application order (base groups first in insertion order, then user groups by
+`order`) and partitioned by (input_type, property, is_emit_layer), updated
+incrementally on insert/remove instead of re-sorted every frame.
+
+Index lists are copy-on-write: a list returned by a query is never mutated,
+so callers can iterate it while groups are added or removed.
+
+Groups report changes to indexed fields (order, input_type, is_emit_layer,
+api overrides) through `reindex` / `update_api_override`.
+"""
+
+from bisect import bisect_left
+from typing import Optional
+
+VELOCITY_PROPERTIES = ("speed", "direction", "vector")
+
+# Index key used for "any velocity property" lookups
+_VELOCITY = "velocity"
+
+# Sort position for user groups without an order
+_UNORDERED = 999999
+
+_EMPTY = ()
+
+
+class LayerRegistry(dict):
+    """Layer name -> group mapping with order-sorted, partitioned indexes"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._seq = 0
+        self._seqs = {}                 # layer -> insertion sequence
+        self._entries = {}              # layer -> (sort key, index keys)
+        self._order_keys = []           # sorted sort keys, parallel to _ordered
+        self._ordered = []              # groups in application order
+        self._indexes = {}              # index key -> (sort keys, groups)
+        self._api_override_layers = {}  # layer -> group with api overrides
+        for layer, group in dict(*args, **kwargs).items():
+            self[layer] = group
+
+    # ========================================================================
+    # dict overrides
+    # ========================================================================
+
+    def __setitem__(self, layer, group):
+        previous = dict.get(self, layer)
+        if layer in self:
+            self._unindex(layer, previous)
+        else:
+            self._seqs[layer] = self._seq
+            self._seq += 1
+        dict.__setitem__(self, layer, group)
+        self._index(layer, group)
+        group._registry = self
+        if previous is not None and previous is not group:
+            self._detach(previous)
+
+    def __delitem__(self, layer):
+        group = dict.__getitem__(self, layer)
+        dict.__delitem__(self, layer)
+        self._unindex(layer, group)
+        del self._seqs[layer]
+        self._detach(group)
+
+    def pop(self, layer, *default):
+        if layer not in self:
+            if default:
+                return default[0]
+            raise KeyError(layer)
+        group = dict.__getitem__(self, layer)
+        del self[layer]
+        return group
+
+    def popitem(self):
+        if not self:
+            raise KeyError("popitem(): registry is empty")
+        layer = next(reversed(self.keys()))
+        return layer, self.pop(layer)
+
+    def setdefault(self, layer, default=None):
+        if layer not in self:
+            self[layer] = default
+        return dict.__getitem__(self, layer)
+
+    def update(self, *args, **kwargs):
+        for layer, group in dict(*args, **kwargs).items():
+            self[layer] = group
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        for group in dict.values(self):
+            self._detach(group)
+        dict.clear(self)
+        self._seqs.clear()
+        self._entries.clear()
+        self._order_keys = []
+        self._ordered = []
+        self._indexes.clear()
+        self._api_override_layers.clear()
+
+    # ========================================================================
+    # Queries
+    # ========================================================================
+
+    def ordered(self) -> list:
+        """All groups: base groups first, then user groups by order"""
+        return self._ordered
+
+    def select(self, input_type: str, property: str, is_emit_layer: bool = False) -> list:
+        """Groups for one (input_type, property, is_emit_layer) partition, in order"""
+        entry = self._indexes.get((input_type, property, bool(is_emit_layer)))
+        return entry[1] if entry is not None else _EMPTY
+
+    def velocity_groups(self, input_type: str, is_emit_layer: bool = False) -> list:
+        """speed/direction/vector groups for an input type, in order"""
+        return self.select(input_type, _VELOCITY, is_emit_layer)
+
+    def property_groups(self, property: str) -> list:
+        """Groups for a property across all input types and emit flags, in order"""
+        entry = self._indexes.get((None, property, None))
+        return entry[1] if entry is not None else _EMPTY
+
+    def has_api_overrides(self) -> bool:
+        return bool(self._api_override_layers)
+
+    def api_override_groups(self) -> list:
+        """Groups with at least one builder using .api(), in order"""
+        if not self._api_override_layers:
+            return _EMPTY
+        return [group for group in self._ordered if group.layer_name in self._api_override_layers]
+
+    # ========================================================================
+    # Change notifications from groups
+    # ========================================================================
+
+    def reindex(self, group):
+        """Re-file a group after its order, input_type or is_emit_layer changed"""
+        layer = self._layer_of(group)
+        if layer is None:
+            return
+        self._unindex(layer, group)
+        self._index(layer, group)
+
+    def update_api_override(self, group):
+        """Track whether a group currently has builders with API overrides"""
+        layer = self._layer_of(group)
+        if layer is None:
+            return
+        if group.has_api_override:
+            self._api_override_layers[layer] = group
+        else:
+            self._api_override_layers.pop(layer, None)
+
+    # ========================================================================
+    # Internals
+    # ========================================================================
+
+    def _layer_of(self, group) -> Optional[str]:
+        layer = group.layer_name
+        if dict.get(self, layer) is group:
+            return layer
+        for name, candidate in dict.items(self):
+            if candidate is group:
+                return name
+        return None
+
+    def _detach(self, group):
+        if getattr(group, '_registry', None) is self and group not in dict.values(self):
+            group._registry = None
+
+    def _sort_key(self, layer, group) -> tuple:
+        seq = self._seqs[layer]
+        if group.is_base:
+            return (0, 0, seq)
+        order = group.order if group.order is not None else _UNORDERED
+        return (1, order, seq)
+
+    def _index_keys(self, group) -> list:
+        input_type = getattr(group, 'input_type', 'move')
+        is_emit = bool(group.is_emit_layer)
+        keys = [(input_type, group.property, is_emit), (None, group.property, None)]
+        if group.property in VELOCITY_PROPERTIES:
+            keys.append((input_type, _VELOCITY, is_emit))
+        return keys
+
+    def _index(self, layer, group):
+        key = self._sort_key(layer, group)
+        index_keys = self._index_keys(group)
+        self._entries[layer] = (key, index_keys)
+        self._order_keys, self._ordered = _inserted(self._order_keys, self._ordered, key, group)
+        for index_key in index_keys:
+            sort_keys, groups = self._indexes.get(index_key, (_EMPTY, _EMPTY))
+            self._indexes[index_key] = _inserted(sort_keys, groups, key, group)
+        if getattr(group, 'has_api_override', False):
+            self._api_override_layers[layer] = group
+
+    def _unindex(self, layer, group):
+        key, index_keys = self._entries.pop(layer)
+        self._order_keys, self._ordered = _removed(self._order_keys, self._ordered, key)
+        for index_key in index_keys:
+            sort_keys, groups = _removed(*self._indexes[index_key], key)
+            if groups:
+                self._indexes[index_key] = (sort_keys, groups)
+            else:
+                del self._indexes[index_key]
+        self._api_override_layers.pop(layer, None)
+
+
+def _inserted(sort_keys, groups, key, group) -> tuple:
+    """Copies of the parallel lists with (key, group) inserted in sort order"""
+    i = bisect_left(sort_keys, key)
+    return (
+        list(sort_keys[:i]) + [key] + list(sort_keys[i:]),
+        list(groups[:i]) + [group] + list(groups[i:]),
+    )
+
+
+def _removed(sort_keys, groups, key) -> tuple:
+    """Copies of the parallel lists with the entry for key removed"""
+    i = bisect_left(sort_keys, key)
+    return sort_keys[:i] + sort_keys[i + 1:], groups[:i] + groups[i + 1:]
@@ -5,7 +5,8 @@ Supports multiple mouse movement backends:
 - windows_mouse_event: Windows win32api.mouse_event (legacy API)
 - windows_send_input: Windows SendInput (modern, recommended for Windows)
 - macos_cgevent: macOS CGEventCreateMouseEvent
-- linux_x11: Linux X11 XWarpPointer
+- linux_x11: Linux X11 XTest, batched into one flush per frame
+- linux_uinput: Linux uinput virtual pointer (evdev), one write() per frame
 
 Each API provides two movement modes:
 - Absolute: Move cursor to screen position (for desktop use, pos.to())
@@ -15,11 +16,23 @@ Scroll APIs use the same backends with sub-line precision via native platform
 APIs. Talon's actions.mouse_scroll() quantizes small floats to zero, breaking
 smooth direction transitions at low scroll speeds. Native APIs accumulate
 fractional values and emit when crossing integer thresholds.
+
+Backends are built once per (api, kind) and cached, so per-frame lookups
+(including .api() overrides) reuse the same closures, ctypes structures,
+X connections and scroll accumulators. invalidate_backends() drops them.
+
+Backends that buffer output (linux_x11) request a flush instead of writing
+immediately. Inside begin_frame()/end_frame() those flushes are deferred to
+end_frame(), so everything a frame emits goes out in one write.
 """
 
 import platform
 from typing import Callable, Tuple, Optional
-from talon import ctrl, settings
+try:
+    from talon import ctrl, settings
+except ImportError:
+    # Loaded by the engine process worker, which supplies its own settings
+    ctrl = settings = None
 
 
 # Available mouse APIs
@@ -29,7 +42,8 @@ MOUSE_APIS = {
     'windows_mouse_event': 'Windows win32api.mouse_event (legacy API)',
     'windows_send_input': 'Windows SendInput (modern, recommended)',
     'macos_cgevent': 'macOS CGEventCreateMouseEvent',
-    'linux_x11': 'Linux X11 XWarpPointer',
+    'linux_x11': 'Linux X11 XTest (batched per frame)',
+    'linux_uinput': 'Linux uinput virtual pointer device (evdev/raw input)',
 }
 
 # Track availability of each API
@@ -37,6 +51,7 @@ _windows_mouse_event_available = False
 _windows_send_input_available = False
 _macos_cgevent_available = False
 _linux_x11_available = False
+_linux_uinput_available = False
 
 # Check platform-specific availability
 if platform.system() == "Windows":
@@ -73,6 +88,13 @@ elif platform.system() == "Linux":
     except ImportError:
         pass
 
+    try:
+        import os
+        import fcntl
+        _linux_uinput_available = os.access("/dev/uinput", os.W_OK)
+    except ImportError:
+        pass
+
 
 def _get_platform_api() -> str:
     """Auto-detect the best platform-specific mouse API
@@ -95,6 +117,101 @@ def _get_platform_api() -> str:
     return "talon"
 
 
+def get_active_api_name() -> str:
+    """Name of the API relative movement currently resolves to ("platform" resolved)"""
+    api = settings.get("user.mouse_rig_api", "platform")
+    return _get_platform_api() if api == "platform" else api
+
+
+def get_active_scroll_api_name() -> str:
+    """Name of the API scrolling currently resolves to ("default" and "platform" resolved)"""
+    api = settings.get("user.mouse_rig_scroll_api", "default")
+    if api == "default":
+        api = settings.get("user.mouse_rig_api", "platform")
+    return _get_platform_api() if api == "platform" else api
+
+
+# ============================================================================
+# FRAME BATCHING
+# ============================================================================
+# Buffered backends call _request_flush(flush) after queueing events. Outside
+# a frame the flush runs immediately; inside one it runs once at end_frame().
+
+_frame_depth = 0
+_pending_flushes: dict = {}
+
+
+def begin_frame() -> None:
+    """Start batching backend flushes until the matching end_frame()"""
+    global _frame_depth
+    _frame_depth += 1
+
+
+def end_frame() -> None:
+    """Flush every backend that queued output since begin_frame()"""
+    global _frame_depth
+    _frame_depth -= 1
+    if _frame_depth > 0 or not _pending_flushes:
+        return
+    flushes = list(_pending_flushes.values())
+    _pending_flushes.clear()
+    for flush in flushes:
+        try:
+            flush()
+        except Exception as e:
+            print(f"[Mouse Rig] Error flushing mouse backend: {e}")
+
+
+def _request_flush(flush: Callable[[], None]) -> None:
+    if _frame_depth:
+        # Bound methods are recreated per access - key on their owner
+        owner = getattr(flush, "__self__", flush)
+        _pending_flushes[id(owner)] = flush
+    else:
+        flush()
+
+
+# ============================================================================
+# BACKEND CACHE
+# ============================================================================
+# (api name as requested, "move" | "scroll") -> backend
+# move backends are (absolute_func, relative_func), scroll backends scroll_func.
+# A backend may expose .close() on one of its functions to release OS
+# resources (e.g. an X connection) when it is dropped.
+
+_backends: dict = {}
+
+
+def _get_backend(api_type: str, kind: str, factory: Callable):
+    """Return the cached backend for (api_type, kind), building it on first use"""
+    key = (api_type, kind)
+    backend = _backends.get(key)
+    if backend is None:
+        backend = factory(api_type)
+        _backends[key] = backend
+    return backend
+
+
+def invalidate_backends() -> None:
+    """Drop all cached backends, closing any OS resources they hold
+
+    Called when mouse rig API settings change.
+    """
+    backends = list(_backends.values())
+    _backends.clear()
+    _pending_flushes.clear()
+
+    for backend in backends:
+        funcs = backend if isinstance(backend, tuple) else (backend,)
+        for func in funcs:
+            close = getattr(func, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    print(f"[Mouse Rig] Error closing mouse backend: {e}")
+
+
 def _make_talon_mouse_move() -> Tuple[Callable[[float, float], None], Callable[[float, float], None]]:
     """Cross-platform Talon mouse movement
 
@@ -285,29 +402,264 @@ def _make_macos_cgevent_mouse_move() -> Tuple[Callable[[float, float], None], Ca
     return move_absolute, move_relative
 
 
-def _make_linux_x11_mouse_move() -> Tuple[Callable[[float, float], None], Callable[[float, float], None]]:
+class _X11Connection:
+    """One Xlib display used for XTest input
+
+    Requests are only queued on the display; nothing is sent until flush(),
+    so a frame's motion and scroll events go out together with no round-trip.
+    Tests can pass any object with the same methods to the linux_x11
+    factories (e.g. a recording fake, or a connection to Xvfb).
+    """
+
+    def __init__(self, display_name: Optional[str] = None):
+        from Xlib import display, X  # type: ignore
+        from Xlib.ext import xtest  # type: ignore
+
+        self._X = X
+        self._xtest = xtest
+        self.disp = display.Display(display_name)
+        self.root = self.disp.screen().root
+
+    def move_absolute(self, x: int, y: int) -> None:
+        self.root.warp_pointer(x, y)
+
+    def move_relative(self, dx: int, dy: int) -> None:
+        # detail=True makes XTest treat x/y as a relative motion
+        self._xtest.fake_input(self.disp, self._X.MotionNotify, detail=True, x=dx, y=dy)
+
+    def click(self, button: int) -> None:
+        self._xtest.fake_input(self.disp, self._X.ButtonPress, button)
+        self._xtest.fake_input(self.disp, self._X.ButtonRelease, button)
+
+    def flush(self) -> None:
+        self.disp.flush()
+
+    def close(self) -> None:
+        self.disp.close()
+
+
+_x11_connection: Optional[_X11Connection] = None
+
+
+def _get_x11_connection() -> _X11Connection:
+    """Shared X connection for the linux_x11 move and scroll backends"""
+    global _x11_connection
+    if _x11_connection is None:
+        _x11_connection = _X11Connection()
+    return _x11_connection
+
+
+def _close_x11_connection() -> None:
+    global _x11_connection
+    if _x11_connection is not None:
+        connection = _x11_connection
+        _x11_connection = None
+        connection.close()
+
+
+def _make_linux_x11_mouse_move(connection=None) -> Tuple[Callable[[float, float], None], Callable[[float, float], None]]:
     """Linux X11 mouse movement
 
     Returns (absolute_func, relative_func)
-    Note: X11 only supports absolute positioning, so relative mode
-    implements relative movement on top of absolute positioning.
-    """
-    from Xlib import display  # type: ignore
+    Relative movement is an XTest relative motion event, so there is no
+    position query. Events are flushed per call, or once per frame inside
+    begin_frame()/end_frame().
 
-    disp = display.Display()
-    root = disp.screen().root
+    Args:
+        connection: X connection to use (default: the shared connection)
+    """
+    conn = connection if connection is not None else _get_x11_connection()
 
     def move_absolute(x: float, y: float) -> None:
-        root.warp_pointer(int(x), int(y))
-        disp.sync()
+        conn.move_absolute(int(x), int(y))
+        _request_flush(conn.flush)
 
     def move_relative(dx: float, dy: float) -> None:
-        # Get current position and add delta
-        from talon import ctrl
-        current_x, current_y = ctrl.mouse_pos()
-        root.warp_pointer(int(current_x + dx), int(current_y + dy))
-        disp.sync()
+        conn.move_relative(int(dx), int(dy))
+        _request_flush(conn.flush)
 
+    if connection is None:
+        move_absolute.close = _close_x11_connection
+    return move_absolute, move_relative
+
+
+# ============================================================================
+# LINUX UINPUT
+# ============================================================================
+# A virtual relative pointer created through /dev/uinput. Events are encoded
+# as struct input_event and buffered; flush() appends one SYN_REPORT and
+# sends the frame in a single write().
+
+_EV_SYN = 0x00
+_EV_KEY = 0x01
+_EV_REL = 0x02
+_SYN_REPORT = 0
+_REL_X = 0x00
+_REL_Y = 0x01
+_REL_HWHEEL = 0x06
+_REL_WHEEL = 0x08
+_REL_WHEEL_HI_RES = 0x0b
+_REL_HWHEEL_HI_RES = 0x0c
+_BTN_LEFT = 0x110
+_BTN_RIGHT = 0x111
+_BTN_MIDDLE = 0x112
+
+# Hi-res wheel units per detent (linux/input.h)
+_WHEEL_HI_RES_PER_LINE = 120
+
+# ioctls from linux/uinput.h: _IOW('U', nr, int), _IO('U', nr), _IOW('U', 3, struct uinput_setup)
+_UI_SET_EVBIT = 0x40045564
+_UI_SET_KEYBIT = 0x40045565
+_UI_SET_RELBIT = 0x40045566
+_UI_DEV_CREATE = 0x5501
+_UI_DEV_DESTROY = 0x5502
+_UI_DEV_SETUP = 0x405c5503
+
+
+class _FdSink:
+    """write() straight to a file descriptor"""
+
+    def __init__(self, fd: int):
+        self._fd = fd
+
+    def write(self, data: bytes) -> int:
+        import os
+        return os.write(self._fd, data)
+
+
+class _UinputDevice:
+    """Virtual relative pointer that batches events until flush()
+
+    The device fd is non-blocking so a stalled input stack can never block
+    a frame. If the kernel queue is full the frame's events are dropped and
+    counted in `dropped` rather than raised into the frame loop.
+
+    Args:
+        sink: File-like object with write(bytes). Tests pass an in-memory
+            sink; open() creates a real device on /dev/uinput.
+    """
+
+    def __init__(self, sink, fd: Optional[int] = None):
+        import struct
+        self._event = struct.Struct("llHHi")
+        self._sink = sink
+        self._fd = fd
+        self._buffer = bytearray()
+        self._syn = self._event.pack(0, 0, _EV_SYN, _SYN_REPORT, 0)
+        self.dropped = 0
+
+    @classmethod
+    def open(cls, name: str = "Talon Mouse Rig") -> '_UinputDevice':
+        """Create the virtual device on /dev/uinput"""
+        import os
+        import fcntl
+        import struct
+
+        fd = os.open("/dev/uinput", os.O_WRONLY | os.O_NONBLOCK)
+        try:
+            for ev in (_EV_SYN, _EV_KEY, _EV_REL):
+                fcntl.ioctl(fd, _UI_SET_EVBIT, ev)
+            # Buttons make libinput and games classify the device as a mouse
+            for key in (_BTN_LEFT, _BTN_RIGHT, _BTN_MIDDLE):
+                fcntl.ioctl(fd, _UI_SET_KEYBIT, key)
+            for rel in (_REL_X, _REL_Y, _REL_WHEEL, _REL_HWHEEL, _REL_WHEEL_HI_RES, _REL_HWHEEL_HI_RES):
+                fcntl.ioctl(fd, _UI_SET_RELBIT, rel)
+
+            # struct uinput_setup { struct input_id id; char name[80]; __u32 ff_effects_max; }
+            setup = struct.pack("HHHH80sI", 0x06, 0x1234, 0x5678, 1, name.encode()[:79], 0)
+            fcntl.ioctl(fd, _UI_DEV_SETUP, setup)
+            fcntl.ioctl(fd, _UI_DEV_CREATE)
+        except OSError:
+            os.close(fd)
+            raise
+
+        # os.write raises BlockingIOError when the queue is full, where a
+        # non-blocking file object would silently return None
+        return cls(_FdSink(fd), fd)
+
+    def emit(self, ev_type: int, code: int, value: int) -> None:
+        self._buffer += self._event.pack(0, 0, ev_type, code, value)
+
+    def flush(self) -> None:
+        """Send buffered events and one SYN_REPORT in a single write"""
+        if not self._buffer:
+            return
+        self._buffer += self._syn
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        try:
+            self._sink.write(data)
+        except BlockingIOError:
+            self.dropped += 1
+
+    def close(self) -> None:
+        self._buffer.clear()
+        if self._fd is not None:
+            import os
+            import fcntl
+            try:
+                fcntl.ioctl(self._fd, _UI_DEV_DESTROY)
+            finally:
+                os.close(self._fd)
+                self._fd = None
+
+
+_uinput_device: Optional[_UinputDevice] = None
+
+
+def _get_uinput_device() -> _UinputDevice:
+    """Shared virtual device for the linux_uinput move and scroll backends"""
+    global _uinput_device
+    if _uinput_device is None:
+        _uinput_device = _UinputDevice.open()
+    return _uinput_device
+
+
+def _close_uinput_device() -> None:
+    global _uinput_device
+    if _uinput_device is not None:
+        device = _uinput_device
+        _uinput_device = None
+        device.close()
+
+
+def _make_linux_uinput_mouse_move(device=None) -> Tuple[Callable[[float, float], None], Callable[[float, float], None]]:
+    """Linux uinput mouse movement
+
+    Returns (absolute_func, relative_func)
+    Relative movement is EV_REL X/Y on the virtual device, which games
+    reading evdev/raw input see as real mouse motion. EV_REL counts are
+    whole numbers, so the fraction left after scaling carries per axis into
+    the next call. A relative device has
+    no absolute positioning, so absolute moves use Talon's ctrl.mouse_move.
+
+    Args:
+        device: _UinputDevice to write to (default: the shared device)
+    """
+    dev = device if device is not None else _get_uinput_device()
+    accum = [0.0, 0.0]  # x, y fractional counts after scaling
+
+    def move_absolute(x: float, y: float) -> None:
+        ctrl.mouse_move(int(x), int(y))
+
+    def move_relative(dx: float, dy: float) -> None:
+        scale = settings.get("user.mouse_rig_scale", 1.0)
+        accum[0] += dx * scale
+        accum[1] += dy * scale
+        sdx = int(accum[0])
+        sdy = int(accum[1])
+        if not sdx and not sdy:
+            return
+        accum[0] -= sdx
+        accum[1] -= sdy
+        if sdx:
+            dev.emit(_EV_REL, _REL_X, sdx)
+        if sdy:
+            dev.emit(_EV_REL, _REL_Y, sdy)
+        _request_flush(dev.flush)
+
+    if device is None:
+        move_absolute.close = _close_uinput_device
     return move_absolute, move_relative
 
 
@@ -351,8 +703,14 @@ def _get_api_function(api_type: str, is_absolute: bool) -> Callable[[float, floa
         is_absolute: True for absolute positioning, False for relative movement
 
     Returns:
-        The appropriate mouse move function
+        The appropriate mouse move function (cached per API)
     """
+    abs_func, rel_func = _get_backend(api_type, "move", _make_mouse_move)
+    return abs_func if is_absolute else rel_func
+
+
+def _make_mouse_move(api_type: str) -> Tuple[Callable[[float, float], None], Callable[[float, float], None]]:
+    """Build (absolute_func, relative_func) for an API, falling back to talon"""
     # Validate API type
     if api_type not in MOUSE_APIS:
         api_type = "talon"
@@ -363,36 +721,38 @@ def _get_api_function(api_type: str, is_absolute: bool) -> Callable[[float, floa
             print("[Mouse Rig] windows_mouse_event API requires pywin32, falling back to talon")
             api_type = "talon"
         else:
-            abs_func, rel_func = _make_windows_mouse_event_mouse_move()
-            return abs_func if is_absolute else rel_func
+            return _make_windows_mouse_event_mouse_move()
 
     elif api_type == "windows_send_input":
         if not _windows_send_input_available:
             print("[Mouse Rig] windows_send_input API not available, falling back to talon")
             api_type = "talon"
         else:
-            abs_func, rel_func = _make_windows_send_input_mouse_move()
-            return abs_func if is_absolute else rel_func
+            return _make_windows_send_input_mouse_move()
 
     elif api_type == "macos_cgevent":
         if not _macos_cgevent_available:
             print("[Mouse Rig] macos_cgevent API: CoreGraphics not available, falling back to talon")
             api_type = "talon"
         else:
-            abs_func, rel_func = _make_macos_cgevent_mouse_move()
-            return abs_func if is_absolute else rel_func
+            return _make_macos_cgevent_mouse_move()
 
     elif api_type == "linux_x11":
         if not _linux_x11_available:
             print("[Mouse Rig] linux_x11 API requires python-xlib, falling back to talon")
             api_type = "talon"
         else:
-            abs_func, rel_func = _make_linux_x11_mouse_move()
-            return abs_func if is_absolute else rel_func
+            return _make_linux_x11_mouse_move()
+
+    elif api_type == "linux_uinput":
+        if not _linux_uinput_available:
+            print("[Mouse Rig] linux_uinput API needs write access to /dev/uinput, falling back to talon")
+            api_type = "talon"
+        else:
+            return _make_linux_uinput_mouse_move()
 
     # Default to talon
-    abs_func, rel_func = _make_talon_mouse_move()
-    return abs_func if is_absolute else rel_func
+    return _make_talon_mouse_move()
 
 
 # ============================================================================
@@ -595,15 +955,16 @@ def _make_macos_cgevent_mouse_scroll() -> Callable[[float, float], None]:
     return scroll
 
 
-def _make_linux_x11_mouse_scroll() -> Callable[[float, float], None]:
+def _make_linux_x11_mouse_scroll(connection=None) -> Callable[[float, float], None]:
     """Linux X11 scroll via XTest fake button events
 
     Buttons: 4=up, 5=down, 6=left, 7=right. Accumulates to whole lines.
-    """
-    from Xlib import display, X  # type: ignore
-    from Xlib.ext import xtest  # type: ignore
+    Shares the move backend's connection and flush batching.
 
-    disp = display.Display()
+    Args:
+        connection: X connection to use (default: the shared connection)
+    """
+    conn = connection if connection is not None else _get_x11_connection()
     accum_x = [0.0]
     accum_y = [0.0]
 
@@ -611,22 +972,69 @@ def _make_linux_x11_mouse_scroll() -> Callable[[float, float], None]:
         accum_x[0] += dx
         accum_y[0] += dy
 
-        # Vertical: button 4=up, 5=down
-        while abs(accum_y[0]) >= 1.0:
-            button = 5 if accum_y[0] > 0 else 4  # positive dy = down = button 5
-            xtest.fake_input(disp, X.ButtonPress, button)
-            xtest.fake_input(disp, X.ButtonRelease, button)
-            accum_y[0] -= 1.0 if accum_y[0] > 0 else -1.0
+        lines_y = int(accum_y[0])
+        lines_x = int(accum_x[0])
+        if lines_y == 0 and lines_x == 0:
+            return
+        accum_y[0] -= lines_y
+        accum_x[0] -= lines_x
+
+        # Vertical: button 4=up, 5=down (positive dy = down = button 5)
+        button = 5 if lines_y > 0 else 4
+        for _ in range(abs(lines_y)):
+            conn.click(button)
 
-        # Horizontal: button 6=left, 7=right
-        while abs(accum_x[0]) >= 1.0:
-            button = 7 if accum_x[0] > 0 else 6  # positive dx = right = button 7
-            xtest.fake_input(disp, X.ButtonPress, button)
-            xtest.fake_input(disp, X.ButtonRelease, button)
-            accum_x[0] -= 1.0 if accum_x[0] > 0 else -1.0
+        # Horizontal: button 6=left, 7=right (positive dx = right = button 7)
+        button = 7 if lines_x > 0 else 6
+        for _ in range(abs(lines_x)):
+            conn.click(button)
 
-        disp.sync()
+        _request_flush(conn.flush)
 
+    if connection is None:
+        scroll.close = _close_x11_connection
+    return scroll
+
+
+def _make_linux_uinput_mouse_scroll(device=None) -> Callable[[float, float], None]:
+    """Linux uinput scroll with high-resolution wheel events
+
+    Sends REL_WHEEL_HI_RES/REL_HWHEEL_HI_RES in 1/120 line units, so
+    sub-line scroll is not rounded to whole lines, plus the classic
+    REL_WHEEL/REL_HWHEEL detent whenever a whole line accumulates.
+    Sign conventions: REL_WHEEL positive = up, REL_HWHEEL positive = right.
+
+    Args:
+        device: _UinputDevice to write to (default: the shared device)
+    """
+    dev = device if device is not None else _get_uinput_device()
+    hi_res_accum = [0.0, 0.0]   # x, y fractional hi-res units
+    line_accum = [0, 0]         # x, y hi-res units since the last detent
+
+    def scroll(dx: float, dy: float) -> None:
+        hi_res_accum[0] += dx * _WHEEL_HI_RES_PER_LINE
+        hi_res_accum[1] += -dy * _WHEEL_HI_RES_PER_LINE  # positive dy = down
+
+        emitted = False
+        for axis, hi_res_code, line_code in ((1, _REL_WHEEL_HI_RES, _REL_WHEEL), (0, _REL_HWHEEL_HI_RES, _REL_HWHEEL)):
+            units = int(hi_res_accum[axis])
+            if units == 0:
+                continue
+            hi_res_accum[axis] -= units
+            dev.emit(_EV_REL, hi_res_code, units)
+
+            line_accum[axis] += units
+            lines = int(line_accum[axis] / _WHEEL_HI_RES_PER_LINE)
+            if lines:
+                line_accum[axis] -= lines * _WHEEL_HI_RES_PER_LINE
+                dev.emit(_EV_REL, line_code, lines)
+            emitted = True
+
+        if emitted:
+            _request_flush(dev.flush)
+
+    if device is None:
+        scroll.close = _close_uinput_device
     return scroll
 
 
@@ -655,7 +1063,13 @@ def get_mouse_scroll_function(override: Optional[str] = None) -> Callable[[float
 
 
 def _get_scroll_function(api_type: str) -> Callable[[float, float], None]:
-    """Get a scroll function for the specified API"""
+    """Get a scroll function for the specified API (cached per API, so its
+    fractional line accumulators persist between calls)"""
+    return _get_backend(api_type, "scroll", _make_mouse_scroll)
+
+
+def _make_mouse_scroll(api_type: str) -> Callable[[float, float], None]:
+    """Build a scroll function for an API, falling back to talon"""
     if api_type not in MOUSE_APIS:
         api_type = "talon"
 
@@ -683,4 +1097,10 @@ def _get_scroll_function(api_type: str) -> Callable[[float, float], None]:
         else:
             return _make_linux_x11_mouse_scroll()
 
+    elif api_type == "linux_uinput":
+        if not _linux_uinput_available:
+            api_type = "talon"
+        else:
+            return _make_linux_uinput_mouse_scroll()
+
     return _make_talon_mouse_scroll()
@@ -0,0 +1,343 @@
+"""Frame loop telemetry - per-phase tick profiling and tick interval jitter
+
+TickProfiler (rig.state.perf) splits each frame into phases (debounce
+check, builder advance, velocity, position/scroll processing, backend
+emission, builder removal, phase callbacks, scheduling). The frame loop calls `lap(PHASE)` at the end of each
+phase; the time since the previous lap is charged to that phase. Laps for
+the same phase within one frame add up, and `end()` commits the frame.
+
+Per phase it keeps count, total and max, plus the last WINDOW samples for a
+recent-window histogram. The slowest frame seen is kept with its full phase
+breakdown.
+
+Disabled by default. While disabled, begin/lap/end are bound to a no-op, so
+the frame loop pays one empty call per phase.
+
+    rig.state.perf.enable()
+    ...
+    print(rig.state.perf.report())
+
+FrameJitter (rig.state.jitter) is always on: a fixed-memory histogram of
+real tick intervals against the scheduled interval, with late/missed frame
+counts and stalls tagged with what was active.
+"""
+
+import json
+import time
+from collections import deque
+
+PHASE_DEBOUNCE = 0
+PHASE_ADVANCE = 1
+PHASE_VELOCITY = 2
+PHASE_POSITION = 3
+PHASE_EMIT = 4
+PHASE_REMOVE = 5
+PHASE_CALLBACKS = 6
+PHASE_SCHEDULE = 7
+
+PHASES = (
+    "debounce",     # _check_debounce_pending
+    "advance",      # _advance_all_builders
+    "velocity",     # velocity compute
+    "position",     # pos / scroll pos processing and tracking updates
+    "emit",         # mouse move + scroll emission and backend flush
+    "remove",       # _remove_completed_builders
+    "callbacks",    # phase callbacks (user code)
+    "schedule",     # frame loop stop / adaptive interval
+)
+
+# Samples kept per phase for the recent-window histogram (~4s at 60Hz)
+WINDOW = 240
+
+# Histogram bucket upper bounds, in microseconds
+HISTOGRAM_BOUNDS_US = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000)
+
+
+def _noop(*args):
+    pass
+
+
+class PhaseStats:
+    """Running counters for one phase (seconds)"""
+
+    __slots__ = ("count", "total", "max", "window")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.window = deque(maxlen=WINDOW)
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.window.append(seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def histogram(self) -> list:
+        """Counts of recent samples per HISTOGRAM_BOUNDS_US bucket, plus overflow"""
+        counts = [0] * (len(HISTOGRAM_BOUNDS_US) + 1)
+        for seconds in self.window:
+            us = seconds * 1e6
+            for i, bound in enumerate(HISTOGRAM_BOUNDS_US):
+                if us < bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return counts
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_us": self.mean * 1e6,
+            "max_us": self.max * 1e6,
+            "histogram": self.histogram(),
+        }
+
+
+class TickProfiler:
+    """Per-phase frame loop timing, readable as rig.state.perf"""
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self.enabled = False
+        self.begin = self.lap = self.end = _noop
+        self.reset()
+
+    def enable(self):
+        self.enabled = True
+        self.begin, self.lap, self.end = self._begin, self._lap, self._end
+
+    def disable(self):
+        self.enabled = False
+        self.begin = self.lap = self.end = _noop
+
+    def reset(self):
+        self.phases = {name: PhaseStats() for name in PHASES}
+        self.frame = PhaseStats()
+        self.worst_frame = None     # {"total_us": ..., phase: us, ...}
+        self._stats = [self.phases[name] for name in PHASES]
+        self._frame_times = [0.0] * len(PHASES)
+        self._frame_start = None
+        self._last = None
+
+    # ========================================================================
+    # Frame loop hooks (bound to _noop while disabled)
+    # ========================================================================
+
+    def _begin(self):
+        self._frame_start = self._last = self._clock()
+
+    def _lap(self, phase: int):
+        if self._last is None:
+            return
+        now = self._clock()
+        self._frame_times[phase] += now - self._last
+        self._last = now
+
+    def _end(self):
+        if self._frame_start is None:
+            return
+        total = self._clock() - self._frame_start
+        frame_times = self._frame_times
+        if total > self.frame.max:
+            self.worst_frame = {"total_us": total * 1e6}
+            for name, seconds in zip(PHASES, frame_times):
+                self.worst_frame[name] = seconds * 1e6
+        for phase, seconds in enumerate(frame_times):
+            if seconds:
+                self._stats[phase].add(seconds)
+                frame_times[phase] = 0.0
+        self.frame.add(total)
+        self._frame_start = self._last = None
+
+    # ========================================================================
+    # Reporting
+    # ========================================================================
+
+    def to_dict(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "frame": self.frame.to_dict(),
+            "phases": {name: stats.to_dict() for name, stats in self.phases.items()},
+            "worst_frame": self.worst_frame,
+            "histogram_bounds_us": list(HISTOGRAM_BOUNDS_US),
+        }
+
+    def report(self) -> str:
+        if not self.frame.count:
+            state = "enabled" if self.enabled else "disabled - call rig.state.perf.enable()"
+            return f"Mouse rig perf: no frames recorded ({state})"
+
+        lines = [
+            f"Mouse rig perf: {self.frame.count} frames, "
+            f"mean {self.frame.mean * 1e6:.0f}us, max {self.frame.max * 1e6:.0f}us",
+            f"  {'phase':<10} {'count':>7} {'mean us':>9} {'max us':>9} {'share':>6}",
+        ]
+        for name, stats in self.phases.items():
+            share = stats.total / self.frame.total * 100 if self.frame.total else 0.0
+            lines.append(
+                f"  {name:<10} {stats.count:>7} {stats.mean * 1e6:>9.1f} {stats.max * 1e6:>9.1f} {share:>5.0f}%"
+            )
+        if self.worst_frame:
+            parts = ", ".join(
+                f"{name} {us:.0f}" for name, us in self.worst_frame.items() if name != "total_us" and us
+            )
+            lines.append(f"  worst frame {self.worst_frame['total_us']:.0f}us: {parts}")
+        bounds = "/".join(str(b) for b in HISTOGRAM_BOUNDS_US)
+        lines.append(f"  recent frame histogram (<{bounds}us, over): {self.frame.histogram()}")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return self.report()
+
+
+# ============================================================================
+# FRAME JITTER
+# ============================================================================
+
+# Lateness (tick interval minus scheduled interval) bucket upper bounds, in ms
+LATENESS_BOUNDS_MS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+# Tick intervals kept for the rolling histogram (~10s at 60Hz)
+JITTER_WINDOW = 600
+
+# A tick this late (ms, or a quarter interval if larger) counts as late
+LATE_MS = 2.0
+
+# Stalls kept with their context, most recent last
+RECENT_STALLS = 16
+
+
+def _lateness_bucket(lateness_ms: float) -> int:
+    for i, bound in enumerate(LATENESS_BOUNDS_MS):
+        if lateness_ms < bound:
+            return i
+    return len(LATENESS_BOUNDS_MS)
+
+
+class FrameJitter:
+    """Tick interval telemetry, readable as rig.state.jitter
+
+    Always on: each tick reports its real interval against the scheduled
+    one. Memory is fixed - a session histogram, a rolling histogram over the
+    last JITTER_WINDOW ticks (ring of bucket indices), and the worst stall
+    plus the last RECENT_STALLS stalls. A stall is a tick that arrived at
+    least one whole frame late; the frame loop tags it with what was active.
+    """
+
+    def __init__(self, window: int = JITTER_WINDOW):
+        self._window = window
+        self.reset()
+
+    def reset(self):
+        buckets = len(LATENESS_BOUNDS_MS) + 1
+        self.histogram = [0] * buckets          # whole session
+        self.recent_histogram = [0] * buckets   # last `window` ticks
+        self._ring = bytearray(self._window)
+        self._ring_pos = 0
+        self._ring_full = False
+        self.frames = 0
+        self.late_frames = 0
+        self.missed_frames = 0
+        self.total_lateness_ms = 0.0
+        self.max_lateness_ms = 0.0
+        self.stalls = 0
+        self.worst_stall = None
+        self.recent_stalls = deque(maxlen=RECENT_STALLS)
+
+    def record(self, now: float, dt: float, interval_ms: float):
+        """Record one tick interval (seconds) against the scheduled interval.
+        Returns the stall entry if this tick stalled, for the caller to tag."""
+        dt_ms = dt * 1000.0
+        lateness_ms = dt_ms - interval_ms
+        bucket = _lateness_bucket(lateness_ms)
+
+        self.frames += 1
+        self.histogram[bucket] += 1
+        if self._ring_full:
+            self.recent_histogram[self._ring[self._ring_pos]] -= 1
+        self._ring[self._ring_pos] = bucket
+        self.recent_histogram[bucket] += 1
+        self._ring_pos += 1
+        if self._ring_pos == self._window:
+            self._ring_pos = 0
+            self._ring_full = True
+
+        if lateness_ms <= 0:
+            return None
+        self.total_lateness_ms += lateness_ms
+        if lateness_ms > self.max_lateness_ms:
+            self.max_lateness_ms = lateness_ms
+        if lateness_ms >= max(LATE_MS, interval_ms * 0.25):
+            self.late_frames += 1
+
+        missed = int(dt_ms / interval_ms + 0.5) - 1
+        if missed < 1:
+            return None
+        self.missed_frames += missed
+        self.stalls += 1
+        stall = {"time": now, "dt_ms": dt_ms, "interval_ms": interval_ms, "missed": missed}
+        self.recent_stalls.append(stall)
+        if self.worst_stall is None or dt_ms > self.worst_stall["dt_ms"]:
+            self.worst_stall = stall
+        return stall
+
+    @property
+    def mean_lateness_ms(self) -> float:
+        return self.total_lateness_ms / self.frames if self.frames else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "frames": self.frames,
+            "late_frames": self.late_frames,
+            "missed_frames": self.missed_frames,
+            "stalls": self.stalls,
+            "mean_lateness_ms": self.mean_lateness_ms,
+            "max_lateness_ms": self.max_lateness_ms,
+            "lateness_bounds_ms": list(LATENESS_BOUNDS_MS),
+            "histogram": list(self.histogram),
+            "recent_histogram": list(self.recent_histogram),
+            "worst_stall": self.worst_stall,
+            "recent_stalls": list(self.recent_stalls),
+        }
+
+    def export(self, path: str) -> str:
+        """Write to_dict() as JSON to `path`; returns the path"""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def report(self) -> str:
+        if not self.frames:
+            return "Mouse rig frame timing: no frames recorded"
+
+        bounds = "/".join(str(b) for b in LATENESS_BOUNDS_MS)
+        lines = [
+            f"Mouse rig frame timing: {self.frames} frames, {self.late_frames} late, "
+            f"{self.missed_frames} missed in {self.stalls} stalls",
+            f"  lateness mean {self.mean_lateness_ms:.2f}ms, max {self.max_lateness_ms:.1f}ms",
+            f"  lateness histogram (<{bounds}ms, over): {self.histogram}",
+            f"  last {min(self.frames, self._window)} frames: {self.recent_histogram}",
+        ]
+        if self.worst_stall:
+            stall = self.worst_stall
+            tags = ", ".join(
+                f"{key}={value}" for key, value in stall.items()
+                if key not in ("time", "dt_ms", "interval_ms", "missed")
+            )
+            lines.append(
+                f"  worst stall {stall['dt_ms']:.1f}ms ({stall['missed']} missed at "
+                f"{stall['interval_ms']:.0f}ms){': ' + tags if tags else ''}"
+            )
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return self.report()
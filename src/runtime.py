@@ -0,0 +1,180 @@
+"""Runtime - the clock, scheduler, pointer, settings and output the engine uses
+
+The rig engine never talks to talon.cron, ctrl, settings or time directly;
+it goes through `runtime.current`. By default that is TalonRuntime, which
+forwards to Talon and the real clock and emits through the configured mouse
+APIs. headless.HeadlessRuntime swaps in a virtual clock, a manual scheduler,
+a simulated cursor and an event-recording output, so RigState can run
+outside Talon and faster than real time.
+
+Runtime interface:
+    now() -> float                          seconds, monotonic
+    setting(name, default)                  e.g. "user.mouse_rig_frame_interval"
+    schedule_interval(interval, callback)   interval like "16ms"; returns a job
+    schedule_thread_interval(interval, callback, lock)
+                                            same, but ticking off the main thread
+                                            while holding `lock`, where supported
+    after(delay, callback)                  one-shot; returns a job
+    cancel(job)
+    mouse_pos() -> (x, y)
+    mouse_click(**kwargs)                   same kwargs as ctrl.mouse_click
+    output                                  None to emit through mouse_api
+                                            backends, or an object with
+                                            move_absolute(x, y),
+                                            move_relative(dx, dy),
+                                            scroll(dx, dy)
+
+shifted(seconds) runs a block with the clock moved ahead and frozen(at)
+with it stopped - rig-core's own time reads included. RigState.at() uses
+the first to evaluate future state.
+"""
+
+import sys
+import time
+import types
+from contextlib import contextmanager
+
+from .frame_thread import FrameThread, start_frame_thread
+
+try:
+    from talon import cron, ctrl, settings
+except ImportError:  # headless, outside Talon
+    cron = ctrl = settings = None
+
+
+def parse_interval(spec) -> float:
+    """Talon cron spec ("16ms", "1s", "500us") or a number of ms -> seconds"""
+    if isinstance(spec, (int, float)):
+        return spec / 1000.0
+    spec = str(spec).strip()
+    for suffix, scale in (("ms", 1e-3), ("us", 1e-6), ("s", 1.0), ("m", 60.0)):
+        if spec.endswith(suffix):
+            return float(spec[:-len(suffix)]) * scale
+    return float(spec) / 1000.0
+
+
+class TalonRuntime:
+    """Default runtime: Talon cron/ctrl/settings and time.perf_counter"""
+
+    output = None
+
+    def now(self) -> float:
+        return time.perf_counter()
+
+    def setting(self, name: str, default=None):
+        return settings.get(name, default)
+
+    def schedule_interval(self, interval: str, callback):
+        return cron.interval(interval, callback)
+
+    def schedule_thread_interval(self, interval: str, callback, lock):
+        return start_frame_thread(parse_interval(interval), callback, lock)
+
+    def after(self, delay: str, callback):
+        return cron.after(delay, callback)
+
+    def cancel(self, job) -> None:
+        if isinstance(job, FrameThread):
+            job.cancel()
+        else:
+            cron.cancel(job)
+
+    def mouse_pos(self) -> tuple:
+        return ctrl.mouse_pos()
+
+    def mouse_click(self, **kwargs) -> None:
+        ctrl.mouse_click(**kwargs)
+
+
+# The runtime in use - read this attribute at call time, don't import it by name
+current = TalonRuntime()
+
+
+def install(runtime) -> None:
+    """Make `runtime` the active runtime for the whole engine"""
+    global current
+    current = runtime
+
+
+def uninstall() -> None:
+    """Restore the default Talon runtime"""
+    global current
+    current = TalonRuntime()
+
+
+# ============================================================================
+# Clock overrides
+# ============================================================================
+
+class ClockRuntime:
+    """Another runtime with its clock replaced by `now()`"""
+
+    def __init__(self, runtime, now):
+        self._runtime = runtime
+        self.now = now
+
+    def __getattr__(self, name):
+        return getattr(self._runtime, name)
+
+
+def _clock_time_module(now) -> types.ModuleType:
+    """A stand-in for the `time` module whose clocks read `now()`"""
+    module = types.ModuleType("time")
+    module.__dict__.update(time.__dict__)
+    module.perf_counter = now
+    module.monotonic = now
+    module.time = now
+    module._rig_clock = True
+    return module
+
+
+def bind_core_clock(core, now) -> list:
+    """Point `time` in every loaded rig-core module at `now()`.
+    Returns [(module, previous time)] for unbind_core_clock."""
+    base = getattr(core, "BaseRigState", None)
+    if base is None:
+        return []
+    package = base.__module__.rpartition(".")[0] or base.__module__
+    shim = _clock_time_module(now)
+    bound = []
+    for name, module in list(sys.modules.items()):
+        if module is None or not (name == package or name.startswith(package + ".")):
+            continue
+        previous = getattr(module, "time", None)
+        if previous is time or getattr(previous, "_rig_clock", False):
+            module.time = shim
+            bound.append((module, previous))
+    return bound
+
+
+def unbind_core_clock(bound: list) -> None:
+    for module, previous in reversed(bound):
+        module.time = previous
+
+
+@contextmanager
+def _clock(now, core):
+    global current
+    previous = current
+    current = ClockRuntime(previous, now)
+    bound = bind_core_clock(core, current.now) if core is not None else []
+    try:
+        yield current
+    finally:
+        unbind_core_clock(bound)
+        current = previous
+
+
+def shifted(seconds: float, core=None):
+    """Run the block with the engine clock `seconds` ahead
+
+    Pass `core` to shift rig-core's reads of time.perf_counter() as well.
+    Nothing else may read the clock meanwhile - hold the rig state's lock.
+    """
+    previous = current
+    return _clock(lambda: previous.now() + seconds, core)
+
+
+def frozen(at: float, core=None):
+    """Run the block with the engine clock stopped at `at` (see shifted)"""
+    return _clock(lambda: at, core)
@@ -1,7 +1,7 @@
 """Sequence runner for chaining rig actions with async awareness"""
 
-from talon import cron
 from .builder import RigBuilder
+from . import runtime
 
 
 class WaitHandle:
@@ -9,7 +9,7 @@ class WaitHandle:
 
     def __init__(self, ms: float):
         self._callbacks = []
-        cron.after(f"{int(ms)}ms", self._on_complete)
+        runtime.current.after(f"{int(ms)}ms", self._on_complete)
 
     def _on_complete(self):
         for cb in self._callbacks:
@@ -0,0 +1,188 @@
+"""Vectorised group evaluation - NumPy structure-of-arrays for large stacks
+
+A modifier layer group sums its builders one object at a time: each one
+interpolates its own value, scales it by its stack weight and is added to
+the running total. For groups with SOA_MIN_BUILDERS or more speed/vector
+offset builders, GroupArrays keeps their base values, targets and weights
+in contiguous arrays instead. Each frame only the lifecycles are asked for
+(phase, eased progress) - rig-core owns the phase machine and its
+callbacks - and interpolation, weighting and the sum run as one NumPy pass
+per phase.
+
+Results match the object path bit for bit: the arrays hold the same
+float64 values, rig-core's interpolation is called on whole arrays, and
+the total is a cumulative sum, which adds in builder order just as the
+object path does. The first evaluation after a group's builders change is
+checked against the object path; any difference turns vectorised
+evaluation off for the session and the object path is used from then on.
+
+Without NumPy, or for smaller and non-lerp groups, nothing changes.
+"""
+
+from typing import Optional
+
+from . import runtime
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Builders a group needs before it is evaluated here - below this NumPy's
+# per-call overhead costs more than the object path
+SOA_MIN_BUILDERS = 16
+
+# Group properties the arrays can hold (scalar and Vec2 offsets)
+SOA_PROPERTIES = ("speed", "vector")
+
+# Set by _build_classes
+_core = None
+
+# Set when a check against the object path failed
+_disabled = False
+
+
+def _eligible(builder) -> bool:
+    config = builder.config
+    return (
+        builder.lifecycle is not None
+        and builder.group_lifecycle is None
+        and config.over_interpolation == "lerp"
+        and config.revert_interpolation == "lerp"
+        and getattr(builder, "revert_target", None) is None
+    )
+
+
+class GroupArrays:
+    """Base values, targets and weights of one group's builders, as arrays"""
+
+    __slots__ = ("builders", "base_refs", "target_refs", "weight_refs",
+                 "supported", "is_vec", "bases", "targets", "weights", "progress", "verified")
+
+    def __init__(self, builders: list):
+        self.builders = tuple(builders)
+        self.base_refs = [b.base_value for b in builders]
+        self.target_refs = [b.target_value for b in builders]
+        self.weight_refs = [b._stack_weight for b in builders]
+        self.verified = False
+
+        self.is_vec = is_vec = _core.is_vec2(self.target_refs[0])
+        self.supported = all(_eligible(b) for b in builders) and all(
+            _core.is_vec2(v) if is_vec else isinstance(v, (int, float))
+            for v in self.base_refs + self.target_refs
+        )
+        if not self.supported:
+            return
+
+        if self.is_vec:
+            self.bases = np.array([(v.x, v.y) for v in self.base_refs], dtype=float).T
+            self.targets = np.array([(v.x, v.y) for v in self.target_refs], dtype=float).T
+        else:
+            self.bases = np.array(self.base_refs, dtype=float)
+            self.targets = np.array(self.target_refs, dtype=float)
+        self.weights = np.array(self.weight_refs, dtype=float)
+        self.progress = np.empty(len(builders))
+
+    def matches(self, builders: list) -> bool:
+        """True if `builders` are still the builders and values arrayed here"""
+        if len(builders) != len(self.builders):
+            return False
+        for i, builder in enumerate(builders):
+            if (builder is not self.builders[i]
+                    or builder.base_value is not self.base_refs[i]
+                    or builder.target_value is not self.target_refs[i]
+                    or builder._stack_weight != self.weight_refs[i]):
+                return False
+        return True
+
+    def evaluate(self, current_time: float, start):
+        """start + the sum of every builder's weighted value at current_time,
+        or None if a lifecycle has no progress to give (already complete)"""
+        interpolate = _core.PropertyAnimator.interpolate
+        scalar = _core.PropertyKind.SCALAR
+        progress = self.progress
+
+        buckets = {}
+        for i, builder in enumerate(self.builders):
+            lifecycle = builder.lifecycle
+            phase, p = lifecycle.advance(current_time)
+            if p is None:
+                return None
+            progress[i] = p
+            key = (phase, lifecycle.has_reverted())
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [i]
+            else:
+                bucket.append(i)
+
+        if self.is_vec:
+            values = np.empty_like(self.bases)
+            for (phase, has_reverted), index in buckets.items():
+                p = progress[index]
+                for axis in (0, 1):
+                    values[axis, index] = interpolate(
+                        scalar, self.bases[axis, index], self.targets[axis, index],
+                        phase, p, has_reverted, "lerp")
+            values *= self.weights
+            x = np.cumsum(np.concatenate(([start.x], values[0])))[-1]
+            y = np.cumsum(np.concatenate(([start.y], values[1])))[-1]
+            return _core.Vec2(float(x), float(y))
+
+        values = np.empty_like(self.bases)
+        for (phase, has_reverted), index in buckets.items():
+            values[index] = interpolate(
+                scalar, self.bases[index], self.targets[index],
+                phase, progress[index], has_reverted, "lerp")
+        values *= self.weights
+        return float(np.cumsum(np.concatenate(([start], values)))[-1])
+
+
+def _same(a, b) -> bool:
+    if _core.is_vec2(a) and _core.is_vec2(b):
+        return a.x == b.x and a.y == b.y
+    return a == b
+
+
+def evaluate_group(group, start, current_time: float) -> Optional[object]:
+    """start + the group's builder values, or None if the object path has to
+    compute it (no NumPy, too few builders, unsupported builders)"""
+    global _disabled
+    if np is None or _disabled:
+        return None
+    builders = group.builders
+    if (len(builders) < SOA_MIN_BUILDERS or group.is_base or group.mode != "offset"
+            or group.property not in SOA_PROPERTIES):
+        return None
+
+    arrays = group._soa
+    if arrays is None or not arrays.matches(builders):
+        arrays = group._soa = GroupArrays(builders)
+    if not arrays.supported:
+        return None
+
+    try:
+        value = arrays.evaluate(current_time, start)
+    except (TypeError, ValueError):
+        # rig-core's interpolation doesn't take arrays
+        _disabled = True
+        return None
+    if value is None:
+        return None
+
+    if not arrays.verified:
+        # Object path at the very same instant - rig-core reads the clock itself
+        with runtime.frozen(current_time, _core):
+            expected = group._combine_builders(start)
+        if not _same(value, expected):
+            _disabled = True
+            print(f"[Mouse Rig] Vectorised evaluation off: got {value}, object path {expected}")
+            return expected
+        arrays.verified = True
+    return value
+
+
+def _build_classes(core):
+    global _core, _disabled
+    _core = core
+    _disabled = False
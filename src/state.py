@@ -7,12 +7,27 @@ All shared behavior (throttle, debounce, queue, stack, replace, builder lifecycl
 is inherited from BaseRigState in rig-core.
 """
 
-import time
+import copy
 import math
+import threading
 from typing import Optional, TYPE_CHECKING, Union, Any
-from talon import cron, ctrl, settings
-from .core import SubpixelAdjuster, mouse_move, mouse_move_relative, mouse_scroll_native, SCROLL_EMIT_THRESHOLD
-from .mouse_api import get_mouse_move_functions
+from .core import (
+    SubpixelAdjuster, mouse_move, mouse_move_relative, mouse_scroll_native, get_mouse_move_with_overrides,
+    get_mouse_scroll_with_override, get_settings_version,
+    SCROLL_EMIT_THRESHOLD, MAX_SUBSTEPS, ADAPTIVE_MAX_STEP_PX,
+)
+from .mouse_api import begin_frame, end_frame, get_active_api_name, get_active_scroll_api_name
+from . import runtime
+from .frame_thread import on_frame_thread
+from .engine_process import EngineProcess, engine_config
+from .emit_queue import EmitQueue, EMIT_ABSOLUTE, EMIT_RELATIVE, EMIT_SCROLL
+from .easing import resolve_easing
+from .trajectory import plan_for_builder, UNPLANNED
+from .layer_registry import LayerRegistry
+from .perf import (
+    TickProfiler, FrameJitter, PHASE_DEBOUNCE, PHASE_ADVANCE, PHASE_VELOCITY, PHASE_POSITION,
+    PHASE_EMIT, PHASE_REMOVE, PHASE_CALLBACKS, PHASE_SCHEDULE,
+)
 
 if TYPE_CHECKING:
     from .builder import ActiveBuilder
@@ -20,6 +35,12 @@ if TYPE_CHECKING:
 # Set by _build_classes
 RigState = None
 
+# Shared results for frames with nothing to report, so a tick that only
+# moves at constant velocity builds no containers
+_NO_TRANSITIONS = ()
+_NO_UPDATES = ()
+_NO_LAYERS = frozenset()
+
 
 def _build_classes(core):
     global RigState
@@ -33,12 +54,44 @@ def _build_classes(core):
     from .contracts import BuilderConfig, ConfigError, validate_timing, VALID_LAYER_STATE_ATTRS
     from . import mode_operations
 
+    # finish_all passes - a lifecycle moves at most one phase per advance
+    # (over, hold, revert), plus one spare
+    FINISH_ROUNDS = 4
+
+    # Base values that feed _compute_current_state - assigning any of them
+    # invalidates the cached snapshot
+    _SNAPSHOT_FIELDS = frozenset({
+        '_absolute_base_pos', '_base_speed', '_base_direction',
+        '_base_scroll_speed', '_base_scroll_direction',
+    })
+
+    # Properties whose stacked offsets _coalesce_stacked and _fold_holding
+    # may fold together
+    _STACKABLE_PROPERTIES = frozenset({"speed", "direction", "vector"})
+
+    def _stack_key(config) -> tuple:
+        """What two stacked builders must share to be folded together"""
+        return (
+            config.property, config.operator, getattr(config, 'input_type', 'move'), config.api_override,
+            config.over_ms, config.over_easing, config.over_interpolation, config.hold_ms,
+            config.revert_ms, config.revert_easing, config.revert_interpolation,
+        )
+
+    def _hold_end(lifecycle) -> float:
+        """When a holding lifecycle's hold ends (inf for an open-ended hold)"""
+        if lifecycle.hold_ms is None:
+            return math.inf
+        return lifecycle.phase_start_time + lifecycle.hold_ms / 1000.0
+
     class _MouseRigState(core.BaseRigState):
         """Mouse-specific state manager extending BaseRigState"""
 
         def __init__(self):
             super().__init__()
 
+            # Layer groups are held in an indexed registry (see __setattr__)
+            self._layer_groups = self._layer_groups
+
             # Mouse-specific base state
             self._absolute_base_pos: Optional[Vec2] = None
             self._base_speed: float = 0.0
@@ -57,6 +110,87 @@ def _build_classes(core):
             # Primed button
             self._primed_button: Optional[int] = None
 
+            # Computed state snapshot (see _get_snapshot)
+            self._snapshot = None
+
+            # Per-frame (move x, move y, scroll x, scroll y) while only the
+            # base velocity is active (see _steady_velocity); dropped with
+            # the snapshot
+            self._steady = None
+
+            # Whether settings allow the steady path, and the backend it
+            # emits through, for the runtime, output and settings version
+            # they were read under (see _steady_velocity)
+            self._steady_runtime = None
+            self._steady_output = None
+            self._steady_version = -1
+            self._steady_allowed = False
+            self._steady_move = None
+            self._steady_scroll = None
+
+            # Interval the frame loop is currently scheduled at (ms)
+            self._frame_interval_ms: Optional[int] = None
+
+            # Frame loop job kept scheduled after the loop stopped, until
+            # _idle_until, so a command soon after resumes it instead of
+            # scheduling a new one (user.mouse_rig_idle_grace_ms)
+            self._idle_job = None
+            self._idle_until = 0.0
+            self._idle_key = None
+
+            # Frame loop churn: jobs scheduled and cancelled, loop stops, and
+            # restarts that resumed an idle job
+            self.frame_loop_counts = {"starts": 0, "stops": 0, "idles": 0, "resumes": 0}
+
+            # Set when the frame loop started with its first frame emitted
+            # right away (see _run_first_frame): the first tick then moves
+            # only for the time since that frame
+            self._early_velocity = False
+
+            # Frames ticked so far; tells builders not yet sampled by a
+            # frame apart from older ones (see _coalesce_stacked)
+            self._frame_serial = 0
+
+            # Holding stacked builders that carry parked ones, mapped to
+            # their group (see _fold_holding)
+            self._stack_holders = {}
+
+            # Filled while builders advance, emptied at the end of the frame
+            # by _remove_completed_builders: (group, [(builder, bake_result)])
+            # from group.advance, and (layer, group, builder) to remove -
+            # builder None for a group left empty
+            self._frame_bakes = []
+            self._frame_removals = []
+
+            # Per-phase frame timing (rig.state.perf), off unless enabled
+            self.perf = TickProfiler()
+
+            # Tick interval jitter and stalls (rig.state.jitter), always on
+            self.jitter = FrameJitter()
+
+            # Held by each tick and by main-thread mutations, so the frame
+            # loop can run on its own thread (user.mouse_rig_frame_thread)
+            self._lock = threading.RLock()
+
+            # Worker emitting move/scroll velocity out of process
+            # (user.mouse_rig_engine_process), created on first use
+            self._engine: Optional[EngineProcess] = None
+
+            # Backend calls queued for an emission thread (rig.state.emit_queue),
+            # used while user.mouse_rig_async_emit is on
+            self.emit_queue = EmitQueue()
+            self._async_emit = False
+
+        def __setattr__(self, name, value):
+            """Drop the state snapshot whenever a base value is reassigned,
+            and keep _layer_groups a LayerRegistry whoever assigns it"""
+            if name in _SNAPSHOT_FIELDS:
+                object.__setattr__(self, '_snapshot', None)
+                object.__setattr__(self, '_steady', None)
+            elif name == '_layer_groups' and not isinstance(value, LayerRegistry):
+                value = LayerRegistry(value)
+            object.__setattr__(self, name, value)
+
         # ====================================================================
         # CONFIG FACTORY OVERRIDE
         # ====================================================================
@@ -66,12 +200,37 @@ def _build_classes(core):
             return BuilderConfig()
 
         # ====================================================================
-        # CRON OVERRIDES (mouse uses settings for frame interval)
+        # CRON OVERRIDES (mouse uses settings for frame interval, and
+        # schedules through the runtime so it can run headless or on a
+        # dedicated frame thread)
         # ====================================================================
 
+        def _schedule_cron_interval(self, interval: str, callback):
+            if runtime.current.setting("user.mouse_rig_frame_thread", False):
+                return runtime.current.schedule_thread_interval(interval, callback, self._lock)
+            return runtime.current.schedule_interval(interval, callback)
+
+        def _cancel_cron(self, job):
+            runtime.current.cancel(job)
+
+        def _get_frame_interval_ms(self) -> int:
+            return max(1, runtime.current.setting("user.mouse_rig_frame_interval", 16))
+
+        def _get_idle_grace_seconds(self) -> float:
+            return max(0, runtime.current.setting("user.mouse_rig_idle_grace_ms", 500)) / 1000.0
+
         def _get_frame_interval_str(self) -> str:
-            frame_interval = settings.get("user.mouse_rig_frame_interval", 16)
-            return f"{frame_interval}ms"
+            return f"{self._get_frame_interval_ms()}ms"
+
+        def _get_frame_interval_seconds(self) -> float:
+            return self._get_frame_interval_ms() / 1000.0
+
+        def _is_time_based(self) -> bool:
+            """True when speed is px/s and motion is integrated over real dt"""
+            return runtime.current.setting("user.mouse_rig_time_based", False)
+
+        def _is_adaptive_frame_rate(self) -> bool:
+            return runtime.current.setting("user.mouse_rig_adaptive_frame_rate", False)
 
         # ====================================================================
         # __repr__ / __str__
@@ -145,6 +304,7 @@ def _build_classes(core):
                 *[f'  layers["{name}"] = <LayerState>' for name in layers],
                 f"  base = <BaseState>",
                 f"  frame_loop_active = {self._frame_loop_job is not None}",
+                f"  frame_loop_counts = {self.frame_loop_counts}",
             ])
             return "\n".join(lines)
 
@@ -239,7 +399,14 @@ def _build_classes(core):
             return False
 
         def add_builder(self, builder: 'ActiveBuilder'):
-            """Override to add primed button logic"""
+            """Override to add primed button logic, and to emit the first
+            frame right away when the builder starts the frame loop"""
+            was_running = self._frame_loop_job is not None
+            self._add_builder(builder)
+            if not was_running and self._frame_loop_job is not None:
+                self._run_first_frame()
+
+        def _add_builder(self, builder: 'ActiveBuilder'):
             layer = builder.config.layer_name
 
             if builder.config.operator == "bake":
@@ -271,6 +438,8 @@ def _build_classes(core):
             if behavior == "replace":
                 self._apply_replace_behavior(builder, group)
             elif behavior == "stack":
+                if self._coalesce_stacked(builder, group):
+                    return
                 is_at_stack_limit = self._apply_stack_behavior(builder, group)
                 if is_at_stack_limit:
                     return
@@ -283,16 +452,155 @@ def _build_classes(core):
             if self._primed_button is not None:
                 btn = self._primed_button
                 self._primed_button = None
-                ctrl.mouse_click(button=btn, down=True)
-                self.add_stop_callback(lambda: ctrl.mouse_click(button=btn, up=True))
+                runtime.current.mouse_click(button=btn, down=True)
+                self.add_stop_callback(lambda: runtime.current.mouse_click(button=btn, up=True))
 
             group.add_builder(builder)
+            self._invalidate_snapshot()
 
             if not builder.lifecycle.is_complete():
                 self._ensure_frame_loop_running()
             else:
                 self._finalize_builder_completion(builder, group)
 
+        def _is_stack_foldable(self, builder, group) -> bool:
+            """Whether a stacked builder may be folded into an identical one
+
+            Only speed/direction/vector offset builders that revert qualify:
+            their value scales with the weight through every phase, revert
+            included, and nothing is baked when they end, so max()/min()
+            (applied to the group total) see the same sum. Position offsets
+            don't: their moves follow a trajectory plan built from the
+            unweighted target.
+            """
+            config = builder.config
+            if (group.is_base or config.mode != "offset" or config.property not in _STACKABLE_PROPERTIES
+                    or any(config.behavior_args or ()) or config.then_callbacks
+                    or builder.group_lifecycle is not None):
+                return False
+            lifecycle = builder.lifecycle
+            return lifecycle is not None and bool(lifecycle.revert_ms) and not lifecycle.is_complete()
+
+        def _coalesce_stacked(self, builder, group) -> bool:
+            """Fold an unbounded .stack() builder into an identical one from
+            the same frame instead of adding it. Returns True if folded.
+
+            The folded builder keeps the earlier start, less than a frame
+            apart. Builders started on different frames are at different
+            points of their envelope until they reach their hold, where
+            _fold_holding merges them.
+            """
+            if not self._is_stack_foldable(builder, group):
+                return False
+
+            lifecycle = builder.lifecycle
+            key = _stack_key(builder.config)
+            builder._stack_frame = self._frame_serial
+            for existing in group.builders:
+                if (existing._stack_frame != self._frame_serial
+                        or not self._is_stack_foldable(existing, group)
+                        or existing.lifecycle.phase != lifecycle.phase
+                        or _stack_key(existing.config) != key
+                        or not self._targets_match(existing.base_value, builder.base_value)
+                        or not self._targets_match(existing.target_value, builder.target_value)):
+                    continue
+                existing._stack_weight += builder._stack_weight
+                group.invalidate()
+                self._invalidate_snapshot()
+                return True
+            return False
+
+        def _fold_holding(self, group):
+            """Merge identical stacked builders that are all holding
+
+            Holding, they all sit at the same value, so one of them - the
+            holder, whose hold ends last - carries the others' weight and the
+            rest are parked on it, out of the group. Each parked builder
+            goes back into the group when its own hold ends (see
+            _unpark_stacked) and reverts on its own from there, so the sum
+            is exact while a mashed boost costs one builder per press only
+            while easing in or out, not while holding.
+            """
+            holding = [
+                builder for builder in group.builders
+                if builder.lifecycle is not None and builder.lifecycle.phase == LifecyclePhase.HOLD
+                and builder.config.get_effective_behavior() == "stack"
+                and self._is_stack_foldable(builder, group)
+            ]
+            if len(holding) < 2:
+                return
+
+            folded = False
+            while holding:
+                holder = max(holding, key=lambda b: _hold_end(b.lifecycle))
+                key = _stack_key(holder.config)
+                matches = [
+                    builder for builder in holding
+                    if builder is not holder and _stack_key(builder.config) == key
+                    and self._targets_match(builder.target_value, holder.target_value)
+                ]
+                holding = [builder for builder in holding if builder is not holder and builder not in matches]
+                if not matches:
+                    continue
+
+                parked = list(holder._stack_parked)
+                for builder in matches:
+                    # Its own parked builders move over to the holder with it
+                    own_weight = builder._stack_weight - sum(p._stack_weight for p in builder._stack_parked)
+                    parked.extend(builder._stack_parked)
+                    builder._stack_parked = ()
+                    holder._stack_weight += builder._stack_weight
+                    builder._stack_weight = own_weight
+                    parked.append(builder)
+                    group.builders.remove(builder)
+                    self._stack_holders.pop(builder, None)
+                parked.sort(key=lambda b: _hold_end(b.lifecycle))
+                holder._stack_parked = parked
+                self._stack_holders[holder] = group
+                folded = True
+
+            if folded:
+                group.invalidate()
+                self._invalidate_snapshot()
+
+        def _unfold_stacked(self, group):
+            """Return every builder parked in `group` to it right away, for
+            operations that work builder by builder (reverse, copy)"""
+            for holder in list(group.builders):
+                parked = holder._stack_parked
+                if not parked:
+                    continue
+                holder._stack_parked = ()
+                self._stack_holders.pop(holder, None)
+                for builder in parked:
+                    holder._stack_weight -= builder._stack_weight
+                    group.builders.append(builder)
+                group.invalidate()
+                self._invalidate_snapshot()
+
+        def _unpark_stacked(self, current_time: float):
+            """Return parked builders whose hold has ended to their group,
+            taking their weight back off the holder. A holder that left its
+            hold early (a revert on the layer) takes its parked builders
+            along: they were all holding the same value, so they revert
+            with it."""
+            for holder, group in list(self._stack_holders.items()):
+                parked = holder._stack_parked
+                if (self._layer_groups.get(group.layer_name) is not group or holder not in group.builders
+                        or holder.lifecycle.phase != LifecyclePhase.HOLD):
+                    holder._stack_parked = ()
+                    del self._stack_holders[holder]
+                    continue
+                while parked and _hold_end(parked[0].lifecycle) <= current_time:
+                    builder = parked.pop(0)
+                    holder._stack_weight -= builder._stack_weight
+                    group.builders.append(builder)
+                    group.invalidate()
+                    self._invalidate_snapshot()
+                if not parked:
+                    holder._stack_parked = ()
+                    del self._stack_holders[holder]
+
         def _finalize_builder_completion(self, builder, group):
             """Override for synchronous execution and velocity property frame loop"""
             layer = builder.config.layer_name
@@ -328,6 +636,8 @@ def _build_classes(core):
                     if layer in self._layer_orders:
                         del self._layer_orders[layer]
 
+            self._invalidate_snapshot()
+
         def _apply_replace_behavior(self, builder, group):
             """Override for pos.offset committed_value architecture"""
             current_value = group.get_current_value()
@@ -365,7 +675,7 @@ def _build_classes(core):
                     group.accumulated_value = current_value
 
                 if builder.config.property == "pos" and builder.config.mode == "override" and group.is_base:
-                    mouse_x, mouse_y = ctrl.mouse_pos()
+                    mouse_x, mouse_y = runtime.current.mouse_pos()
                     builder.base_value = Vec2(mouse_x, mouse_y)
                 elif builder.config.property in ("direction", "pos", "vector") and not is_vec2(current_value):
                     builder.base_value = Vec2(0, 0)
@@ -403,49 +713,102 @@ def _build_classes(core):
             return False
 
         def _ensure_frame_loop_running(self):
-            """Override to sync absolute position on start"""
-            if self._frame_loop_job is None:
-                self._last_frame_time = time.perf_counter()
+            """Override to sync absolute position on start and restore the
+            full frame rate if the adaptive scheduler had slowed the loop"""
+            if self._frame_loop_job is not None:
+                # New work while running at a reduced rate - back to full rate
+                if self._frame_interval_ms != self._get_frame_interval_ms():
+                    self._reschedule_frame_loop(self._get_frame_interval_ms())
+                return
+
+            if not self.perf.enabled and runtime.current.setting("user.mouse_rig_perf", False):
+                self.perf.enable()
+            self._async_emit = (
+                runtime.current.output is None and runtime.current.setting("user.mouse_rig_async_emit", False)
+            )
+
+            self._last_frame_time = runtime.current.now()
+            self._frame_interval_ms = self._get_frame_interval_ms()
+            if not self._resume_idle_loop():
                 self._frame_loop_job = self._schedule_cron_interval(
                     self._get_frame_interval_str(),
                     self._tick_frame
                 )
-                # Sync to actual mouse position only if we have absolute position builders
-                has_absolute_builder = any(
-                    group.property == "pos" and any(
-                        builder.config.movement_type == "absolute"
-                        for builder in group.builders
-                    )
-                    for group in self._layer_groups.values()
+                self.frame_loop_counts["starts"] += 1
+            # Sync to actual mouse position only if we have absolute position builders
+            has_absolute_builder = any(
+                group.property == "pos" and any(
+                    builder.config.movement_type == "absolute"
+                    for builder in group.builders
                 )
-                if has_absolute_builder:
-                    current_mouse = Vec2(*ctrl.mouse_pos())
-                    self._absolute_current_pos = current_mouse
-                    self._absolute_base_pos = current_mouse
+                for group in self._layer_groups.values()
+            )
+            if has_absolute_builder:
+                current_mouse = Vec2(*runtime.current.mouse_pos())
+                self._absolute_current_pos = current_mouse
+                self._absolute_base_pos = current_mouse
 
         def _stop_frame_loop(self):
-            """Override to handle subpixel reset, position sync, and mouse-specific stop callbacks"""
+            """Override to handle subpixel reset, position sync, and mouse-specific stop callbacks
+
+            The loop stops here as far as everything else is concerned, stop
+            callbacks included. Its job is kept scheduled for the idle grace
+            period, though, ticking without doing anything, so that a command
+            right after can resume it (see _resume_idle_loop).
+            """
             if self._frame_loop_job is not None:
-                self._cancel_cron(self._frame_loop_job)
+                self.frame_loop_counts["idles"] += 1
+                self._early_velocity = False
+                grace = self._get_idle_grace_seconds()
+                if grace > 0:
+                    self._idle_job = self._frame_loop_job
+                    self._idle_until = runtime.current.now() + grace
+                    self._idle_key = self._frame_loop_key(self._frame_interval_ms)
+                else:
+                    self._cancel_frame_loop_job(self._frame_loop_job)
                 self._frame_loop_job = None
+                self._frame_interval_ms = None
                 self._last_frame_time = None
                 self._subpixel_adjuster.reset()
+                if self._engine is not None:
+                    self._engine.set_velocity(0.0, 0.0, 0.0, 0.0)
+                if self._async_emit:
+                    self.emit_queue.flush()
 
                 if self._absolute_current_pos is not None:
-                    current_mouse = Vec2(*ctrl.mouse_pos())
+                    current_mouse = Vec2(*runtime.current.mouse_pos())
                     self._absolute_current_pos = current_mouse
                     if self._absolute_base_pos is not None:
                         diff = abs(current_mouse.x - self._absolute_base_pos.x) + abs(current_mouse.y - self._absolute_base_pos.y)
                         if diff > 2:
                             self._absolute_base_pos = current_mouse
 
-                for callback in self._stop_callbacks:
-                    try:
-                        callback()
-                    except Exception as e:
-                        pass
+                callbacks = list(self._stop_callbacks)
                 self._stop_callbacks.clear()
 
+                def run_stop_callbacks():
+                    for callback in callbacks:
+                        try:
+                            callback()
+                        except Exception as e:
+                            pass
+
+                self._call_on_main_thread(run_stop_callbacks)
+
+        def _cancel_idle_loop(self):
+            """Cancel a job parked for the idle grace period right away"""
+            job, self._idle_job = self._idle_job, None
+            if job is not None:
+                self._cancel_frame_loop_job(job)
+
+        def shutdown(self):
+            """Stop the frame loop for good - no job left parked for the idle
+            grace period - and close the engine process. For a state that is
+            about to be dropped (reload_rig)."""
+            self._stop_frame_loop()
+            self._cancel_idle_loop()
+            self._close_engine()
+
         # ====================================================================
         # ABSTRACT METHOD IMPLEMENTATIONS (8)
         # ====================================================================
@@ -509,8 +872,7 @@ def _build_classes(core):
                     speed, direction = self._compute_velocity()
                     group.accumulated_value = direction * speed
                 elif builder.config.property == "pos":
-                    pos, _, _, _, _, _ = self._compute_current_state()
-                    group.accumulated_value = pos
+                    group.accumulated_value = self._get_snapshot().pos
 
             if builder.config.order is not None:
                 self._layer_orders[layer] = builder.config.order
@@ -521,8 +883,58 @@ def _build_classes(core):
                     group.order = self._layer_orders[layer]
 
             self._layer_groups[layer] = group
+            self._invalidate_snapshot()
             return group
 
+        # ====================================================================
+        # STATE SNAPSHOT (computed once per frame, shared by all accessors)
+        # ====================================================================
+
+        class StateSnapshot:
+            """Aggregated state for one frame - built from _compute_current_state"""
+            __slots__ = (
+                'pos', 'speed', 'direction', 'scroll_speed', 'scroll_direction',
+                'pos_is_override', '_vector', '_scroll_vector',
+            )
+
+            def __init__(self, computed: tuple):
+                (self.pos, self.speed, self.direction,
+                 self.scroll_speed, self.scroll_direction, self.pos_is_override) = computed
+                self._vector = None
+                self._scroll_vector = None
+
+            @property
+            def vector(self):
+                if self._vector is None:
+                    self._vector = self.direction * self.speed
+                return self._vector
+
+            @property
+            def scroll_vector(self):
+                if self._scroll_vector is None:
+                    self._scroll_vector = self.scroll_direction * self.scroll_speed
+                return self._scroll_vector
+
+        def _get_snapshot(self) -> 'StateSnapshot':
+            """Return the current state snapshot, computing it on first read
+
+            Computing advances lifecycles, so it holds the lock against a
+            frame thread tick. A published snapshot is never changed, so
+            returning one needs no lock.
+            """
+            snapshot = self._snapshot
+            if snapshot is None:
+                with self._lock:
+                    snapshot = self._snapshot
+                    if snapshot is None:
+                        snapshot = _MouseRigState.StateSnapshot(self._compute_current_state())
+                        self._snapshot = snapshot
+            return snapshot
+
+        def _invalidate_snapshot(self):
+            """Force the next state read to re-aggregate builders and groups"""
+            self._snapshot = None
+
         def _compute_current_state(self) -> tuple:
             """Compute (position, speed, direction, scroll_speed, scroll_direction, pos_is_override)"""
             pos = Vec2(self._absolute_base_pos.x, self._absolute_base_pos.y) if self._absolute_base_pos else Vec2(0, 0)
@@ -532,25 +944,8 @@ def _build_classes(core):
             scroll_direction = Vec2(self._base_scroll_direction.x, self._base_scroll_direction.y)
             pos_is_override = False
 
-            base_groups = []
-            user_groups = []
-
-            for layer_name, group in self._layer_groups.items():
-                if group.is_base:
-                    base_groups.append(group)
-                else:
-                    user_groups.append(group)
-
-            def get_layer_order(group) -> int:
-                return group.order if group.order is not None else 999999
-
-            user_groups = sorted(user_groups, key=get_layer_order)
-
-            for group in base_groups:
-                pos, speed, direction, scroll_speed, scroll_direction, override = self._apply_group(group, pos, speed, direction, scroll_speed, scroll_direction)
-                pos_is_override = pos_is_override or override
-
-            for group in user_groups:
+            # Base groups first, then user groups by order
+            for group in self._layer_groups.ordered():
                 pos, speed, direction, scroll_speed, scroll_direction, override = self._apply_group(group, pos, speed, direction, scroll_speed, scroll_direction)
                 pos_is_override = pos_is_override or override
 
@@ -587,31 +982,249 @@ def _build_classes(core):
 
             return pos, speed, direction, scroll_speed, scroll_direction, pos_is_override
 
+        # ====================================================================
+        # TIME QUERIES
+        # ====================================================================
+
+        def at(self, ms: float) -> 'StateSnapshot':
+            """State `ms` from now if nothing new is started
+
+            Every builder and layer group is evaluated at the later time by
+            the same code a frame would run, on copies of the lifecycles, so
+            nothing advances, emits or calls back. pos is the absolute
+            position the layers aim for; cursor travel from velocity over
+            the gap isn't integrated.
+
+            Example:
+                rig.speed.to(10).over(500)
+                rig.state.at(250).speed   # halfway there
+            """
+            ms = validate_timing(ms, 'ms', method='at')
+            with self._lock:
+                # Parked stacked builders may leave their hold by then, so
+                # they are evaluated on their own, as if never folded
+                holders = []
+                for holder, group in self._stack_holders.items():
+                    holders.append((holder, group, holder._stack_weight, len(group.builders)))
+                    holder._stack_weight -= sum(builder._stack_weight for builder in holder._stack_parked)
+                    group.builders.extend(holder._stack_parked)
+                    group.invalidate()
+
+                saved = []
+                for group in self._layer_groups.values():
+                    for builder in group.builders:
+                        saved.append((builder, builder.lifecycle, builder.group_lifecycle))
+                        builder.lifecycle = copy.copy(builder.lifecycle)
+                        builder.group_lifecycle = copy.copy(builder.group_lifecycle)
+                try:
+                    with runtime.shifted(ms / 1000.0, core):
+                        computed = self._compute_current_state()
+                finally:
+                    for builder, lifecycle, group_lifecycle in saved:
+                        builder.lifecycle = lifecycle
+                        builder.group_lifecycle = group_lifecycle
+                    for holder, group, weight, count in holders:
+                        holder._stack_weight = weight
+                        del group.builders[count:]
+                        group.invalidate()
+            return _MouseRigState.StateSnapshot(computed)
+
+        def finish_all(self):
+            """Jump every running animation to its end state
+
+            Each lifecycle's remaining phases are treated as elapsed and the
+            normal frame path does the rest: relative moves emit what is
+            left of their distance, completed layers bake or revert and
+            phase callbacks fire. Velocity is not integrated for the time
+            skipped.
+            """
+            current_time = runtime.current.now()
+            for _ in range(FINISH_ROUNDS):
+                if not self._expire_lifecycles(current_time):
+                    break
+                phase_transitions = self._advance_all_builders(current_time)
+                self._invalidate_snapshot()
+                self._apply_frame(current_time, phase_transitions, 0, 0, 0.0, 0.0)
+
+        def _expire_lifecycles(self, current_time: float) -> bool:
+            """Backdate every running lifecycle so its current phase has
+            elapsed at current_time. Returns False when none are running."""
+            expired = False
+            for group in self._layer_groups.values():
+                for builder in group.builders:
+                    for lifecycle in (builder.lifecycle, builder.group_lifecycle):
+                        if lifecycle is None or lifecycle.is_complete() or lifecycle.phase is None:
+                            continue
+                        remaining_ms = (lifecycle.over_ms or 0) + (lifecycle.hold_ms or 0) + (lifecycle.revert_ms or 0)
+                        lifecycle.phase_start_time = current_time - remaining_ms / 1000.0 - EPSILON
+                        expired = True
+                        group.invalidate()
+            return expired
+
         def _tick_frame(self):
             """Main frame loop tick"""
+            if self._frame_loop_job is None:
+                self._idle_tick()
+                return
             current_time, dt = self._calculate_delta_time()
             if dt is None:
                 return
+            self._frame_serial += 1
 
-            self._check_debounce_pending(current_time)
+            stall = self.jitter.record(current_time, dt, self._frame_interval_ms or self._get_frame_interval_ms())
+            if stall is not None:
+                self._tag_stall(stall)
 
-            phase_transitions = self._advance_all_builders(current_time)
+            self._emit_frame(current_time, dt)
 
-            frame_delta = Vec2(0, 0)
-            frame_delta += self._compute_velocity_delta()
+        def _run_first_frame(self):
+            """Emit the first frame of a loop that just started now, inside
+            the command that started it, rather than one interval later.
 
-            has_absolute_position, absolute_target, relative_delta, relative_position_updates = self._process_position_builders()
-            frame_delta += relative_delta
+            Only the velocity delta goes out here. Builders are not advanced,
+            so no phase or `then` callbacks run and nothing completes while
+            the caller may still be configuring the chain; the first tick
+            does all of that.
 
-            self._emit_mouse_movement(has_absolute_position, absolute_target, frame_delta)
+            This frame is the loop's first frame, so the loop's phase starts
+            at the command: the first tick moves for the time since, at most
+            one frame (see _early_frame_scale), and constant motion steps
+            evenly from the command on.
+            """
+            now = runtime.current.now()
+            self._last_frame_time = now
+            vx, vy = self._velocity_xy()
+            sx, sy = self._scroll_vector_xy()
+            if vx == 0 and vy == 0 and sx == 0 and sy == 0:
+                return
 
-            scroll_pos_delta, scroll_position_updates = self._process_scroll_position_builders()
-            self._emit_scroll(scroll_pos_delta if scroll_pos_delta.magnitude() > 0.001 else None)
+            if self._is_time_based():
+                seconds = self._get_frame_interval_seconds()
+                vx, vy, sx, sy = vx * seconds, vy * seconds, sx * seconds, sy * seconds
+            dx, dy = self._subpixel_adjuster.adjust(vx, vy) if vx != 0 or vy != 0 else (0, 0)
 
-            for group in self._layer_groups.values():
-                if group.property == "pos" and group.replace_target is not None:
-                    if group.builders and group.builders[0].config.movement_type == "relative":
-                        group.committed_value += relative_delta
+            if self._async_emit:
+                emit_queue = self.emit_queue
+                emit_queue.begin()
+                try:
+                    self._emit_first_frame(dx, dy, sx, sy)
+                finally:
+                    emit_queue.commit()
+            else:
+                begin_frame()
+                try:
+                    self._emit_first_frame(dx, dy, sx, sy)
+                finally:
+                    end_frame()
+            self._early_velocity = True
+
+        def _emit_first_frame(self, dx: int, dy: int, sx: float, sy: float):
+            """Emit _run_first_frame's velocity, through the engine process
+            when one is in use"""
+            engine = self._get_engine()
+            if engine is not None:
+                dx, dy, sx, sy = self._hand_off_velocity(engine, False, dx, dy, sx, sy)
+            self._emit_mouse_movement(False, None, dx, dy)
+            self._emit_scroll(sx, sy)
+
+        def _early_frame_scale(self, dt: Optional[float]) -> float:
+            """Share of a frame's velocity to move this tick: the time since
+            _run_first_frame's frame, in frames and at most one, on the first
+            tick after it (a resumed idle job can tick early), else 1"""
+            if not self._early_velocity:
+                return 1.0
+            self._early_velocity = False
+            if dt is None:
+                return 1.0
+            return min(1.0, dt / self._get_frame_interval_seconds())
+
+        def _emit_frame(self, current_time: float, dt: float, profiled: bool = True):
+            """Run a frame inside the backend's frame batch and, for ticks,
+            the perf timer"""
+            perf = self.perf
+            if profiled:
+                perf.begin()
+
+            if self._async_emit:
+                # Backend calls are collected and replayed by the emit thread
+                emit_queue = self.emit_queue
+                emit_queue.begin()
+                try:
+                    self._run_frame(current_time, dt)
+                finally:
+                    emit_queue.commit()
+                    perf.lap(PHASE_EMIT)
+                    perf.end()
+                return
+
+            # Buffered backends flush once, after the whole frame is emitted
+            begin_frame()
+            try:
+                self._run_frame(current_time, dt)
+            finally:
+                end_frame()
+                perf.lap(PHASE_EMIT)
+                perf.end()
+
+        def _run_frame(self, current_time: float, dt: float):
+            """Advance builders and emit one frame of movement and scroll"""
+            steady = self._steady_velocity()
+            if steady is not None:
+                self._run_steady_frame(steady, dt)
+                return
+
+            lap = self.perf.lap
+            if self._debounce_pending:
+                self._check_debounce_pending(current_time)
+            lap(PHASE_DEBOUNCE)
+
+            if self._is_time_based() or self._is_reduced_rate_frame(dt):
+                phase_transitions, move_x, move_y, scroll_x, scroll_y = self._integrate_velocity(current_time, dt)
+            else:
+                phase_transitions = self._advance_all_builders(current_time)
+                self._invalidate_snapshot()
+                lap(PHASE_ADVANCE)
+                scale = self._early_frame_scale(dt)
+                move_x, move_y = self._compute_velocity_delta(scale)
+                scroll_x, scroll_y = self._scroll_vector_xy()
+                if scale != 1.0:
+                    scroll_x *= scale
+                    scroll_y *= scale
+                lap(PHASE_VELOCITY)
+
+            self._apply_frame(current_time, phase_transitions, move_x, move_y, scroll_x, scroll_y)
+
+        def _apply_frame(self, current_time: float, phase_transitions, move_x: int, move_y: int, scroll_x: float, scroll_y: float):
+            """Emit a frame of advanced builders: positions plus the given
+            velocity move and scroll, then remove completed builders and run
+            callbacks"""
+            lap = self.perf.lap
+            has_absolute_position, absolute_target, relative_x, relative_y, relative_position_updates = self._process_position_builders()
+            lap(PHASE_POSITION)
+
+            engine = self._get_engine()
+            if engine is not None:
+                move_x, move_y, scroll_x, scroll_y = self._hand_off_velocity(
+                    engine, has_absolute_position, move_x, move_y, scroll_x, scroll_y)
+                lap(PHASE_EMIT)
+
+            self._emit_mouse_movement(has_absolute_position, absolute_target, move_x + relative_x, move_y + relative_y)
+            lap(PHASE_EMIT)
+
+            scroll_pos_x, scroll_pos_y, scroll_position_updates = self._process_scroll_position_builders()
+            lap(PHASE_POSITION)
+            if math.hypot(scroll_pos_x, scroll_pos_y) > 0.001:
+                scroll_x += scroll_pos_x
+                scroll_y += scroll_pos_y
+            self._emit_scroll(scroll_x, scroll_y)
+            lap(PHASE_EMIT)
+
+            if relative_x or relative_y:
+                for group in self._layer_groups.property_groups("pos"):
+                    if group.replace_target is not None:
+                        if group.builders and group.builders[0].config.movement_type == "relative":
+                            committed = group.committed_value
+                            group.committed_value = Vec2(committed.x + relative_x, committed.y + relative_y)
 
             for builder, new_value, new_int_value in relative_position_updates:
                 builder._last_emitted_relative_pos = new_value
@@ -619,14 +1232,30 @@ def _build_classes(core):
 
             for builder, new_value, _ in scroll_position_updates:
                 builder._last_emitted_scroll_pos = new_value
+            lap(PHASE_POSITION)
 
             completed_layers = self._remove_completed_builders(current_time)
+            lap(PHASE_REMOVE)
             self._execute_phase_callbacks(phase_transitions)
+            lap(PHASE_CALLBACKS)
             self._stop_frame_loop_if_done()
 
+            if self._frame_loop_job is not None and self._is_adaptive_frame_rate():
+                self._update_frame_interval(current_time)
+            lap(PHASE_SCHEDULE)
+
+        def _tag_stall(self, stall: dict):
+            """Record what was active when the frame loop stalled"""
+            layers = list(self._layer_groups.keys())
+            stall["layers"] = layers[:8] + ([f"+{len(layers) - 8} more"] if len(layers) > 8 else [])
+            stall["builders"] = sum(len(group.builders) for group in self._layer_groups.values())
+            stall["backend"] = "headless" if runtime.current.output is not None else get_active_api_name()
+            stall["time_based"] = bool(self._is_time_based())
+            stall["adaptive"] = bool(self._is_adaptive_frame_rate())
+
         def _calculate_delta_time(self) -> tuple:
             """Calculate time since last frame. Returns (current_time, dt) where dt is None on first frame."""
-            now = time.perf_counter()
+            now = runtime.current.now()
             if self._last_frame_time is None:
                 self._last_frame_time = now
                 return (now, None)
@@ -635,77 +1264,335 @@ def _build_classes(core):
             self._last_frame_time = now
             return (now, dt)
 
-        def _advance_all_builders(self, current_time: float) -> list:
-            """Advance all groups and track phase transitions."""
-            phase_transitions = []
+        def _integrate_velocity(self, current_time: float, dt: float) -> tuple:
+            """Advance builders and integrate move/scroll velocity over real dt
+
+            Used in time-based mode, where speed is px/s and scroll speed is
+            lines/s, and for frames stretched by the adaptive frame rate, where
+            per-frame speed is scaled by the number of frame intervals elapsed.
+            A late frame is split into substeps no longer than one frame
+            interval so eased speed changes, boosts and emit decay are sampled
+            along the way instead of jumping to their current value.
+
+            Returns (phase_transitions, move dx, move dy, scroll x, scroll y),
+            the move in whole pixels.
+            """
+            frame_seconds = self._get_frame_interval_seconds()
+            steps = min(MAX_SUBSTEPS, max(1, math.ceil(dt / frame_seconds - 1e-6)))
+            step_dt = dt / steps
+            start_time = current_time - dt
+            step_scale = step_dt if self._is_time_based() else step_dt / frame_seconds
+
+            lap = self.perf.lap
+            phase_transitions = _NO_TRANSITIONS
+            move_x = move_y = 0.0
+            scroll_x = scroll_y = 0.0
+
+            for step in range(1, steps + 1):
+                step_time = current_time if step == steps else start_time + step_dt * step
+                transitions = self._advance_all_builders(step_time)
+                if transitions:
+                    if phase_transitions is _NO_TRANSITIONS:
+                        phase_transitions = []
+                    phase_transitions.extend(transitions)
+                self._invalidate_snapshot()
+                lap(PHASE_ADVANCE)
+
+                vx, vy = self._velocity_xy()
+                move_x += vx * step_scale
+                move_y += vy * step_scale
+
+                sx, sy = self._scroll_vector_xy()
+                scroll_x += sx * step_scale
+                scroll_y += sy * step_scale
+                lap(PHASE_VELOCITY)
+
+            # Integrated from the early frame's time, if there was one
+            self._early_velocity = False
+            dx, dy = self._subpixel_adjuster.adjust(move_x, move_y)
+            return phase_transitions, dx, dy, scroll_x, scroll_y
 
-            for layer, group in list(self._layer_groups.items()):
-                group_transitions, builders_to_remove = group.advance(current_time)
-                phase_transitions.extend(group_transitions)
+        # ====================================================================
+        # ENGINE PROCESS
+        # ====================================================================
 
-                if not hasattr(group, '_pending_bake_results'):
-                    group._pending_bake_results = []
-                group._pending_bake_results.extend(builders_to_remove)
+        def _get_engine(self) -> Optional[EngineProcess]:
+            """The engine process to hand this frame's velocity to, or None to
+            emit everything in-process (setting off, headless, .api()
+            overrides, an unsupported backend, a worker that keeps dying, or
+            one that hasn't ticked yet)"""
+            rt = runtime.current
+            engine = self._engine
+            config = None
+            if rt.output is None and rt.setting("user.mouse_rig_engine_process", False) and not self._has_api_overrides():
+                config = engine_config(
+                    get_active_api_name(),
+                    get_active_scroll_api_name(),
+                    rt.setting("user.mouse_rig_scale", 1.0),
+                    rt.setting("user.mouse_rig_engine_python", ""),
+                )
 
-            return phase_transitions
+            if config is not None and (engine is None or engine.config != config):
+                if engine is not None:
+                    engine.close()
+                engine = self._engine = EngineProcess(*config)
 
-        def _remove_completed_builders(self, current_time: float) -> set:
-            """Remove completed builders from groups"""
-            completed_layers = set()
+            if config is None or not engine.ensure_running() or not engine.ready:
+                if engine is not None and engine.alive:
+                    engine.set_velocity(0.0, 0.0, 0.0, 0.0)
+                return None
+            return engine
+
+        def _hand_off_velocity(self, engine: EngineProcess, has_absolute_position: bool,
+                               move_x: int, move_y: int, scroll_x: float, scroll_y: float) -> tuple:
+            """Send this frame's move and scroll velocity to the engine process
+
+            Velocity goes over as px/s and lines/s. Moves that follow an
+            absolute position builder stay in-process, as does scrolling on
+            APIs the worker can't drive. Returns (move_x, move_y, scroll_x,
+            scroll_y) left to emit locally.
+            """
+            per_second = 1.0 if self._is_time_based() else 1.0 / self._get_frame_interval_seconds()
+
+            vx = vy = 0.0
+            if not has_absolute_position:
+                vx, vy = self._velocity_xy()
+                vx *= per_second
+                vy *= per_second
+                move_x = move_y = 0
+                self._subpixel_adjuster.reset()
+
+            sx = sy = 0.0
+            if engine.handles_scroll:
+                sx, sy = self._scroll_vector_xy()
+                sx *= per_second
+                sy *= per_second
+                scroll_x = scroll_y = 0.0
+
+            engine.set_interval(self._frame_interval_ms or self._get_frame_interval_ms())
+            engine.set_velocity(vx, vy, sx, sy)
+            return move_x, move_y, scroll_x, scroll_y
 
-            for layer, group in list(self._layer_groups.items()):
-                builders_to_remove = []
+        def _close_engine(self):
+            """Shut down the engine process, if one was started. The next
+            frame that needs one starts a fresh worker."""
+            engine, self._engine = self._engine, None
+            if engine is not None:
+                engine.close()
+
+        @property
+        def engine(self) -> Optional[dict]:
+            """Engine process state (ticks, pid, emitted/scrolled totals,
+            current velocity), or None when everything is emitted in-process"""
+            if self._engine is None or not self._engine.alive:
+                return None
+            return self._engine.read_state()
+
+        # ====================================================================
+        # ADAPTIVE FRAME RATE
+        # ====================================================================
+
+        def _is_reduced_rate_frame(self, dt: float) -> bool:
+            """True when this frame covers more than one frame interval because
+            the adaptive scheduler slowed the loop down"""
+            if not self._is_adaptive_frame_rate():
+                return False
+            return dt > self._get_frame_interval_seconds() * 1.5
+
+        def _get_adaptive_frame_interval(self, current_time: float, base_ms: int, max_ms: int) -> int:
+            """Pick a frame interval (ms) for what is currently active
+
+            Full rate while anything is interpolating (over/revert phases,
+            position moves, pending debounces) or moving fast. Holds, slow
+            constant velocity and scroll-only motion run slower, always as a
+            whole number of frame intervals and never past the end of a hold.
+            """
+            if max_ms < base_ms * 2 or self._debounce_pending:
+                return base_ms
+
+            interval_ms = float(max_ms)
+
+            for group in self._layer_groups.values():
+                if group.property in ("pos", "scroll_pos"):
+                    return base_ms
 
                 for builder in group.builders:
-                    if builder._marked_for_removal:
-                        builders_to_remove.append(builder)
-                        continue
-
-                    completed_phase, _ = builder.advance(current_time)
-
-                    if completed_phase is not None:
-                        if (builder.config.property == "pos" and
-                            builder.config.movement_type == "relative" and
-                            hasattr(builder, '_total_emitted_int')):
-
-                            final_value = builder.get_interpolated_value()
-                            final_target_int = Vec2(round(final_value.x), round(final_value.y))
-                            final_delta_int = final_target_int - builder._total_emitted_int
-
-                            if final_delta_int.x != 0 or final_delta_int.y != 0:
-                                _, move_relative_override = self._get_override_functions()
-                                if move_relative_override is not None:
-                                    move_relative_override(int(final_delta_int.x), int(final_delta_int.y))
-                                else:
-                                    mouse_move_relative(int(final_delta_int.x), int(final_delta_int.y))
-
-                        builders_to_remove.append(builder)
-                    elif builder.lifecycle.should_be_garbage_collected():
-                        builders_to_remove.append(builder)
-
-                if hasattr(group, '_pending_bake_results'):
-                    for builder, bake_result in group._pending_bake_results:
-                        if builder in group.builders:
-                            if bake_result == "bake_to_base":
-                                self._bake_group_to_base(group)
-                    group._pending_bake_results = []
-
-                for builder in builders_to_remove:
+                    for lifecycle in (builder.lifecycle, builder.group_lifecycle):
+                        if lifecycle is None or lifecycle.is_complete() or lifecycle.phase is None:
+                            continue
+                        if lifecycle.phase != LifecyclePhase.HOLD:
+                            return base_ms
+                        if lifecycle.hold_ms is not None:
+                            elapsed_ms = (current_time - lifecycle.phase_start_time) * 1000
+                            interval_ms = min(interval_ms, lifecycle.hold_ms - elapsed_ms)
+
+            speed = self._get_snapshot().speed
+            if speed > EPSILON:
+                px_per_ms = speed / 1000.0 if self._is_time_based() else speed / base_ms
+                interval_ms = min(interval_ms, ADAPTIVE_MAX_STEP_PX / px_per_ms)
+
+            frames = int(interval_ms // base_ms)
+            if frames < 2:
+                return base_ms
+            return frames * base_ms
+
+        def _update_frame_interval(self, current_time: float):
+            """Reschedule the frame loop if the adaptive interval changed"""
+            interval_ms = self._get_adaptive_frame_interval(
+                current_time,
+                self._get_frame_interval_ms(),
+                max(1, runtime.current.setting("user.mouse_rig_max_frame_interval", 64)),
+            )
+            if interval_ms != self._frame_interval_ms:
+                self._reschedule_frame_loop(interval_ms)
+
+        def _frame_loop_key(self, interval_ms: int) -> tuple:
+            """What a frame loop job was scheduled with; an idle job is only
+            resumed if this still matches"""
+            return (interval_ms, bool(runtime.current.setting("user.mouse_rig_frame_thread", False)))
+
+        def _resume_idle_loop(self) -> bool:
+            """Make the idle job the frame loop job again, if there is one
+            scheduled the way a new one would be. Returns True if resumed."""
+            job = self._idle_job
+            if job is None:
+                return False
+            self._idle_job = None
+            if self._idle_key != self._frame_loop_key(self._frame_interval_ms):
+                self._cancel_frame_loop_job(job)
+                return False
+            self._frame_loop_job = job
+            self.frame_loop_counts["resumes"] += 1
+            return True
+
+        def _idle_tick(self):
+            """Tick of the idle job: nothing to do until the grace period
+            ends, then cancel it"""
+            job = self._idle_job
+            if job is not None and runtime.current.now() >= self._idle_until:
+                self._idle_job = None
+                self._cancel_frame_loop_job(job)
+
+        def _cancel_frame_loop_job(self, job):
+            self._cancel_cron(job)
+            self.frame_loop_counts["stops"] += 1
+
+        def _reschedule_frame_loop(self, interval_ms: int):
+            """Swap the running frame loop cron for one at a new interval.
+            Frame timing carries over so the next dt covers the whole gap."""
+            self._cancel_frame_loop_job(self._frame_loop_job)
+            self._frame_interval_ms = interval_ms
+            self._frame_loop_job = self._schedule_cron_interval(f"{interval_ms}ms", self._tick_frame)
+            self.frame_loop_counts["starts"] += 1
+
+        def _advance_all_builders(self, current_time: float):
+            """Advance every group once and return the phase transitions.
+
+            This is the frame's only advance: builders that completed, were
+            marked for removal or can be collected, bake results and groups
+            left empty are noted here for _remove_completed_builders.
+            """
+            if not self._layer_groups:
+                return _NO_TRANSITIONS
+            if self._stack_holders:
+                self._unpark_stacked(current_time)
+            phase_transitions = _NO_TRANSITIONS
+            removals = self._frame_removals
+
+            for layer, group in self._layer_groups.items():
+                group_transitions, bake_results = group.advance(current_time)
+                if group_transitions:
+                    group.invalidate()
+                    if not group.is_base and group.mode == "offset" and group.property in _STACKABLE_PROPERTIES:
+                        self._fold_holding(group)
+                    if phase_transitions is _NO_TRANSITIONS:
+                        phase_transitions = []
+                    phase_transitions.extend(group_transitions)
+                if bake_results:
+                    self._frame_bakes.append((group, bake_results))
+
+                builders = group.builders
+                if not builders:
+                    removals.append((layer, group, None))
+                    continue
+                for builder in builders:
+                    lifecycle = builder.lifecycle
+                    if (builder._marked_for_removal or lifecycle.is_complete()
+                            or lifecycle.should_be_garbage_collected()):
+                        removals.append((layer, group, builder))
+
+            return phase_transitions
+
+        def _remove_completed_builders(self, current_time: float):
+            """Apply this frame's bakes, remove the builders noted while
+            advancing and drop groups that no longer persist"""
+            bakes = self._frame_bakes
+            removals = self._frame_removals
+            if not bakes and not removals:
+                return _NO_LAYERS
+            completed_layers = set()
+            removed_any = False
+
+            for group, bake_results in bakes:
+                for builder, bake_result in bake_results:
+                    if bake_result == "bake_to_base" and builder in group.builders:
+                        self._bake_group_to_base(group)
+            bakes.clear()
+
+            for layer, group, builder in removals:
+                if builder is not None and builder in group.builders:
+                    if not builder._marked_for_removal and builder.lifecycle.is_complete():
+                        self._emit_final_relative_delta(builder)
                     group.remove_builder(builder)
+                    removed_any = True
 
-                if not group.should_persist():
-                    if layer in self._layer_groups:
-                        del self._layer_groups[layer]
+                if self._layer_groups.get(layer) is group and not group.should_persist():
+                    del self._layer_groups[layer]
                     if layer in self._layer_orders:
                         del self._layer_orders[layer]
                     completed_layers.add(layer)
+            removals.clear()
+
+            if removed_any or completed_layers:
+                self._invalidate_snapshot()
 
             return completed_layers
 
+        def _emit_final_relative_delta(self, builder):
+            """Emit whatever a finished relative pos move has left to reach
+            its exact final value"""
+            config = builder.config
+            if config.property != "pos" or config.movement_type != "relative":
+                return
+            emitted = builder._total_emitted_int
+            if emitted is None:
+                return
+
+            final_value = builder.get_interpolated_value()
+            dx = round(final_value.x) - emitted.x
+            dy = round(final_value.y) - emitted.y
+            if dx != 0 or dy != 0:
+                _, move_relative_override = self._get_override_functions()
+                self._emit(EMIT_RELATIVE, move_relative_override or mouse_move_relative, int(dx), int(dy))
+
         def _execute_phase_callbacks(self, phase_transitions: list):
             """Execute callbacks for completed phases"""
-            for builder, completed_phase in phase_transitions:
-                builder.lifecycle.execute_callbacks(completed_phase)
+            if not phase_transitions:
+                return
+
+            def run_phase_callbacks():
+                for builder, completed_phase in phase_transitions:
+                    builder.lifecycle.execute_callbacks(completed_phase)
+
+            self._call_on_main_thread(run_phase_callbacks)
+
+        def _call_on_main_thread(self, fn):
+            """Run user callbacks now, or hand them to Talon's main thread
+            when called from the frame thread"""
+            if on_frame_thread():
+                runtime.current.after("0ms", fn)
+            else:
+                fn()
 
         def _bake_group_to_base(self, group):
             """Bake base layer group's value into base state"""
@@ -803,9 +1690,12 @@ def _build_classes(core):
                     if l in self._layer_orders:
                         del self._layer_orders[l]
 
+            self._invalidate_snapshot()
+
         def stop(self, transition_ms: Optional[float] = None, easing: str = "linear", **kwargs):
             """Stop everything"""
             transition_ms = validate_timing(transition_ms, 'transition_ms', method='stop')
+            easing = resolve_easing(easing)
 
             config = BuilderConfig()
             all_kwargs = {'easing': easing, **kwargs}
@@ -818,10 +1708,12 @@ def _build_classes(core):
 
             self._layer_groups.clear()
             self._layer_orders.clear()
+            self._stack_holders.clear()
             self._throttle_times.clear()
             self._rate_builder_cache.clear()
             self._debounce_pending.clear()
             self._primed_button = None
+            self._invalidate_snapshot()
 
             if transition_ms is None or transition_ms == 0:
                 self._base_speed = 0.0
@@ -901,7 +1793,7 @@ def _build_classes(core):
                             self._absolute_current_pos = Vec2(self._absolute_base_pos.x, self._absolute_base_pos.y)
                 elif mode == "override":
                     if self._absolute_base_pos is None or self._absolute_current_pos is None:
-                        current_screen_pos = Vec2(*ctrl.mouse_pos())
+                        current_screen_pos = Vec2(*runtime.current.mouse_pos())
                         self._absolute_base_pos = current_screen_pos
                         self._absolute_current_pos = current_screen_pos
 
@@ -923,10 +1815,10 @@ def _build_classes(core):
                 is_relative = builder.config.movement_type == "relative"
                 if not will_be_active and not is_relative and self._absolute_base_pos is not None:
                     move_absolute_override, _ = self._get_override_functions()
-                    if move_absolute_override is not None:
-                        move_absolute_override(int(self._absolute_base_pos.x), int(self._absolute_base_pos.y))
-                    else:
-                        mouse_move(int(self._absolute_base_pos.x), int(self._absolute_base_pos.y))
+                    self._emit(
+                        EMIT_ABSOLUTE, move_absolute_override or mouse_move,
+                        int(self._absolute_base_pos.x), int(self._absolute_base_pos.y),
+                    )
 
             if self._should_frame_loop_be_active():
                 self._ensure_frame_loop_running()
@@ -936,28 +1828,9 @@ def _build_classes(core):
             speed = self._base_speed
             direction = Vec2(self._base_direction.x, self._base_direction.y)
 
-            base_groups = []
-            user_groups = []
-            emit_groups = []
-
-            for layer_name, group in self._layer_groups.items():
-                if group.property in ("speed", "direction", "vector"):
-                    if group.input_type != 'move':
-                        continue
+            emit_groups = self._layer_groups.velocity_groups('move', is_emit_layer=True)
 
-                    if group.is_emit_layer:
-                        emit_groups.append(group)
-                    elif group.is_base:
-                        base_groups.append(group)
-                    else:
-                        user_groups.append(group)
-
-            def get_layer_order(group) -> int:
-                return group.order if group.order is not None else 999999
-
-            user_groups = sorted(user_groups, key=get_layer_order)
-
-            for group in base_groups + user_groups:
+            for group in self._layer_groups.velocity_groups('move'):
                 prop = group.property
                 mode = group.mode
                 current_value = group.get_current_value()
@@ -987,28 +1860,9 @@ def _build_classes(core):
             scroll_speed = self._base_scroll_speed
             scroll_direction = Vec2(self._base_scroll_direction.x, self._base_scroll_direction.y)
 
-            base_groups = []
-            user_groups = []
-            emit_groups = []
-
-            for layer_name, group in self._layer_groups.items():
-                if group.property in ("speed", "direction", "vector"):
-                    if getattr(group, 'input_type', 'move') != 'scroll':
-                        continue
-
-                    if group.is_emit_layer:
-                        emit_groups.append(group)
-                    elif group.is_base:
-                        base_groups.append(group)
-                    else:
-                        user_groups.append(group)
+            emit_groups = self._layer_groups.velocity_groups('scroll', is_emit_layer=True)
 
-            def get_layer_order(group) -> int:
-                return group.order if group.order is not None else 999999
-
-            user_groups = sorted(user_groups, key=get_layer_order)
-
-            for group in base_groups + user_groups:
+            for group in self._layer_groups.velocity_groups('scroll'):
                 prop = group.property
                 mode = group.mode
                 current_value = group.get_current_value()
@@ -1044,26 +1898,109 @@ def _build_classes(core):
             dx_int, dy_int = self._subpixel_adjuster.adjust(velocity.x, velocity.y)
             self._absolute_current_pos = Vec2(self._absolute_current_pos.x + dx_int, self._absolute_current_pos.y + dy_int)
 
-        def _compute_velocity_delta(self):
-            """Compute velocity contribution as delta"""
-            speed, direction = self._compute_velocity()
-            if speed == 0:
-                return Vec2(0, 0)
+        def _steady_velocity(self) -> Optional[tuple]:
+            """Per-frame (move x, move y, scroll x, scroll y) while nothing
+            but the base velocity is active, or None for a full frame
+
+            Steady means no layers, no pending debounce, no profiling (its
+            report breaks full frames down by phase) and no setting that
+            reshapes a frame (time-based, adaptive rate, engine process).
+            The vector is cached until a base value is reassigned; the
+            settings and backend until the runtime or a setting changes.
+            """
+            if self._layer_groups or self._debounce_pending or self.perf.enabled:
+                return None
+            rt = runtime.current
+            output = rt.output
+            version = get_settings_version()
+            if rt is not self._steady_runtime or output is not self._steady_output or version != self._steady_version:
+                self._steady_runtime = rt
+                self._steady_output = output
+                self._steady_version = version
+                self._steady_allowed = not (
+                    rt.setting("user.mouse_rig_time_based", False)
+                    or rt.setting("user.mouse_rig_adaptive_frame_rate", False)
+                    or (output is None and rt.setting("user.mouse_rig_engine_process", False)))
+                self._steady_move = get_mouse_move_with_overrides()[1]
+                self._steady_scroll = get_mouse_scroll_with_override()
+            if not self._steady_allowed:
+                return None
 
-            velocity = direction * speed
-            dx, dy = self._subpixel_adjuster.adjust(velocity.x, velocity.y)
-            return Vec2(dx, dy)
+            steady = self._steady
+            if steady is None:
+                direction = self._base_direction
+                speed = self._base_speed
+                scroll_direction = self._base_scroll_direction
+                scroll_speed = self._base_scroll_speed
+                steady = self._steady = (
+                    direction.x * speed, direction.y * speed,
+                    scroll_direction.x * scroll_speed, scroll_direction.y * scroll_speed,
+                )
+            return steady
+
+        def _run_steady_frame(self, steady: tuple, dt: Optional[float] = None):
+            """A frame of constant base velocity: subpixel accumulation and
+            at most one move and one scroll backend call"""
+            vx, vy, sx, sy = steady
+            if self._early_velocity:
+                scale = self._early_frame_scale(dt)
+                vx, vy, sx, sy = vx * scale, vy * scale, sx * scale, sy * scale
+            if vx != 0 or vy != 0:
+                dx, dy = self._subpixel_adjuster.adjust(vx, vy)
+                if dx != 0 or dy != 0:
+                    self._emit(EMIT_RELATIVE, self._steady_move, dx, dy)
+            if abs(sx) >= SCROLL_EMIT_THRESHOLD or abs(sy) >= SCROLL_EMIT_THRESHOLD:
+                self._emit(EMIT_SCROLL, self._steady_scroll, sx, sy)
+            self.perf.lap(PHASE_EMIT)
+
+            if not any(steady):
+                self._stop_frame_loop_if_done()
+
+        def _compute_velocity_delta(self, scale: float = 1.0) -> tuple:
+            """This frame's velocity move in whole pixels, (dx, dy), for
+            `scale` of a frame"""
+            vx, vy = self._velocity_xy()
+            if vx == 0 and vy == 0:
+                return 0, 0
+            return self._subpixel_adjuster.adjust(vx * scale, vy * scale)
+
+        def _velocity_xy(self) -> tuple:
+            """Move velocity (direction * speed) as an (x, y) pair - read
+            straight from the base while no layer changes it"""
+            registry = self._layer_groups
+            if registry.velocity_groups('move') or registry.velocity_groups('move', is_emit_layer=True):
+                speed, direction = self._compute_velocity()
+            else:
+                speed, direction = self._base_speed, self._base_direction
+            return direction.x * speed, direction.y * speed
+
+        def _scroll_vector_xy(self) -> tuple:
+            """Per-frame scroll vector as an (x, y) pair - read straight from
+            the base while no layer changes it"""
+            registry = self._layer_groups
+            if registry.velocity_groups('scroll') or registry.velocity_groups('scroll', is_emit_layer=True):
+                vector = self._get_snapshot().scroll_vector
+                return vector.x, vector.y
+            direction = self._base_scroll_direction
+            speed = self._base_scroll_speed
+            return direction.x * speed, direction.y * speed
 
         def _process_position_builders(self) -> tuple:
-            """Process all position builders and gather their contributions"""
+            """Process all position builders and gather their contributions.
+            Returns (has_absolute_position, absolute_target, relative dx,
+            relative dy, relative_position_updates)."""
+            pos_groups = self._layer_groups.property_groups("pos")
+            if not pos_groups:
+                return False, None, 0, 0, _NO_UPDATES
+
             has_absolute_position = False
             absolute_target = None
-            relative_delta = Vec2(0, 0)
+            relative_x = relative_y = 0
             relative_position_updates = []
+            replace_group = None
+            now = None
 
-            for layer_name, group in self._layer_groups.items():
-                if group.property != "pos":
-                    continue
+            for group in pos_groups:
                 if not group.builders:
                     continue
 
@@ -1074,73 +2011,83 @@ def _build_classes(core):
                     absolute_target = group.get_current_value()
                 else:
                     for builder in group.builders:
-                        current_interpolated = builder.get_interpolated_value()
-
-                        if not hasattr(builder, '_last_emitted_relative_pos'):
-                            builder._last_emitted_relative_pos = Vec2(0, 0)
-                        if not hasattr(builder, '_total_emitted_int'):
-                            builder._total_emitted_int = Vec2(0, 0)
-
-                        target_total_int = Vec2(round(current_interpolated.x), round(current_interpolated.y))
-                        actual_delta_int = target_total_int - builder._total_emitted_int
+                        plan = self._get_trajectory(builder, integer=True)
+                        if plan is not None and builder.lifecycle.phase == LifecyclePhase.OVER:
+                            if now is None:
+                                now = runtime.current.now()
+                            x, y = plan.total_at((now - builder.lifecycle.phase_start_time) * 1000)
+                            current_interpolated = Vec2(x, y)
+                        else:
+                            current_interpolated = builder.get_interpolated_value()
+
+                        target_x = round(current_interpolated.x)
+                        target_y = round(current_interpolated.y)
+                        emitted = builder._total_emitted_int
+                        if emitted is None:
+                            relative_x += target_x
+                            relative_y += target_y
+                        else:
+                            relative_x += target_x - emitted.x
+                            relative_y += target_y - emitted.y
 
-                        relative_delta += Vec2(actual_delta_int.x, actual_delta_int.y)
+                        relative_position_updates.append((builder, current_interpolated, Vec2(target_x, target_y)))
 
-                        new_total_emitted = builder._total_emitted_int + actual_delta_int
-                        relative_position_updates.append((builder, current_interpolated, new_total_emitted))
+                    if replace_group is None and group.replace_target is not None:
+                        replace_group = group
 
-            for layer_name, group in self._layer_groups.items():
-                if group.property != "pos":
-                    continue
-                if not group.builders:
-                    continue
-                first_builder = group.builders[0]
-                if first_builder.config.movement_type == "relative" and group.replace_target is not None:
-                    projected_total = group.committed_value + relative_delta
-                    clamped_total = Vec2(
-                        max(-abs(group.replace_target.x), min(abs(group.replace_target.x), projected_total.x)),
-                        max(-abs(group.replace_target.y), min(abs(group.replace_target.y), projected_total.y))
-                    )
-                    clamped_delta = clamped_total - group.committed_value
-                    relative_delta = clamped_delta
-                    break
+            # The first relative group with a replace target clamps the total
+            if replace_group is not None:
+                committed = replace_group.committed_value
+                limit_x = abs(replace_group.replace_target.x)
+                limit_y = abs(replace_group.replace_target.y)
+                relative_x = max(-limit_x, min(limit_x, committed.x + relative_x)) - committed.x
+                relative_y = max(-limit_y, min(limit_y, committed.y + relative_y)) - committed.y
 
-            return has_absolute_position, absolute_target, relative_delta, relative_position_updates
+            return has_absolute_position, absolute_target, relative_x, relative_y, relative_position_updates
 
         def _process_scroll_position_builders(self) -> tuple:
-            """Process all scroll_pos builders"""
-            scroll_delta = Vec2(0, 0)
+            """Process all scroll_pos builders.
+            Returns (scroll dx, scroll dy, scroll_position_updates)."""
+            scroll_groups = self._layer_groups.property_groups("scroll_pos")
+            if not scroll_groups:
+                return 0.0, 0.0, _NO_UPDATES
+
+            scroll_x = scroll_y = 0.0
             scroll_position_updates = []
+            now = None
 
-            for layer_name, group in self._layer_groups.items():
-                if group.property != "scroll_pos":
-                    continue
+            for group in scroll_groups:
                 if not group.builders:
                     continue
 
                 for builder in group.builders:
-                    current_interpolated = builder.get_interpolated_value()
-
-                    if not hasattr(builder, '_last_emitted_scroll_pos'):
-                        builder._last_emitted_scroll_pos = Vec2(0, 0)
-                    if not hasattr(builder, '_total_emitted_scroll_int'):
-                        builder._total_emitted_scroll_int = Vec2(0, 0)
-
-                    target_total = current_interpolated
-                    actual_delta = target_total - builder._last_emitted_scroll_pos
+                    plan = self._get_trajectory(builder, integer=False)
+                    if plan is not None and builder.lifecycle.phase == LifecyclePhase.OVER:
+                        if now is None:
+                            now = runtime.current.now()
+                        x, y = plan.total_at((now - builder.lifecycle.phase_start_time) * 1000)
+                        current_interpolated = Vec2(x, y)
+                    else:
+                        current_interpolated = builder.get_interpolated_value()
 
-                    scroll_delta += actual_delta
+                    last = builder._last_emitted_scroll_pos
+                    scroll_x += current_interpolated.x - last.x
+                    scroll_y += current_interpolated.y - last.y
                     scroll_position_updates.append((builder, current_interpolated, current_interpolated))
 
-            return scroll_delta, scroll_position_updates
+            return scroll_x, scroll_y, scroll_position_updates
+
+        def _get_trajectory(self, builder, integer: bool):
+            """Precomputed OVER-phase plan for a finite pos / scroll_pos move,
+            planned on the builder's first frame (see trajectory.py)"""
+            plan = builder._trajectory
+            if plan is UNPLANNED:
+                plan = builder._trajectory = plan_for_builder(builder, self._get_frame_interval_ms(), integer)
+            return plan
 
         def _has_api_overrides(self) -> bool:
             """Check if any active group has API overrides"""
-            for group in self._layer_groups.values():
-                for builder in group.builders:
-                    if builder.config.api_override is not None:
-                        return True
-            return False
+            return self._layer_groups.has_api_overrides()
 
         def _get_override_functions(self):
             """Get override functions if any builder has overrides"""
@@ -1148,58 +2095,43 @@ def _build_classes(core):
                 return None, None
 
             api_override = None
-            for group in self._layer_groups.values():
+            for group in self._layer_groups.api_override_groups():
                 for builder in group.builders:
                     if builder.config.api_override is not None:
                         api_override = builder.config.api_override
 
-            return get_mouse_move_functions(api_override, api_override)
+            return get_mouse_move_with_overrides(api_override, api_override)
 
-        def _emit_mouse_movement(self, has_absolute_position: bool, absolute_target, frame_delta):
-            """Emit mouse movement based on accumulated deltas"""
+        def _emit_mouse_movement(self, has_absolute_position: bool, absolute_target, dx, dy):
+            """Emit mouse movement: a move to absolute_target + (dx, dy), or
+            a relative move by (dx, dy)"""
             move_absolute_override, move_relative_override = self._get_override_functions()
 
             if has_absolute_position:
-                final_pos = absolute_target + frame_delta
+                final_pos = Vec2(absolute_target.x + dx, absolute_target.y + dy)
                 self._absolute_current_pos = final_pos
                 new_x = int(round(final_pos.x))
                 new_y = int(round(final_pos.y))
-                current_x, current_y = ctrl.mouse_pos()
+                current_x, current_y = runtime.current.mouse_pos()
                 if new_x != current_x or new_y != current_y:
-                    if move_absolute_override is not None:
-                        move_absolute_override(new_x, new_y)
-                    else:
-                        mouse_move(new_x, new_y)
-            else:
-                if frame_delta.x != 0 or frame_delta.y != 0:
-                    dx = round(frame_delta.x)
-                    dy = round(frame_delta.y)
-                    if move_relative_override is not None:
-                        move_relative_override(dx, dy)
-                    else:
-                        mouse_move_relative(dx, dy)
-
-        def _emit_scroll(self, scroll_pos_delta=None):
-            """Emit scroll events"""
-            scroll_speed = self.scroll_speed.current
-            scroll_direction = self.scroll_direction.current
-
-            scroll_velocity = scroll_direction * scroll_speed
-
-            if scroll_pos_delta is not None:
-                scroll_velocity = scroll_velocity + scroll_pos_delta
+                    self._emit(EMIT_ABSOLUTE, move_absolute_override or mouse_move, new_x, new_y)
+            elif dx != 0 or dy != 0:
+                self._emit(EMIT_RELATIVE, move_relative_override or mouse_move_relative, round(dx), round(dy))
 
-            if abs(scroll_velocity.x) < SCROLL_EMIT_THRESHOLD and abs(scroll_velocity.y) < SCROLL_EMIT_THRESHOLD:
+        def _emit_scroll(self, x: float, y: float):
+            """Emit this frame's scroll, if it reaches the emit threshold"""
+            if abs(x) < SCROLL_EMIT_THRESHOLD and abs(y) < SCROLL_EMIT_THRESHOLD:
                 return
 
-            mouse_scroll_native(scroll_velocity.x, scroll_velocity.y)
+            self._emit(EMIT_SCROLL, mouse_scroll_native, x, y)
 
-        def _update_relative_position_tracking(self, relative_position_updates: list, completed_layers: set):
-            """Update tracking for relative position builders after removal"""
-            for builder, new_value, new_int_value in relative_position_updates:
-                if builder.config.layer_name not in completed_layers:
-                    builder._last_emitted_relative_pos = new_value
-                    builder._total_emitted_int = new_int_value
+        def _emit(self, kind: int, fn, x: float, y: float):
+            """Make one backend call, through the emit queue when async
+            emission is on (see emit_queue.py)"""
+            if self._async_emit:
+                self.emit_queue.put(kind, fn, x, y)
+            else:
+                fn(x, y)
 
         def _has_movement(self) -> bool:
             """Check if there's any movement happening"""
@@ -1208,13 +2140,8 @@ def _build_classes(core):
             if self._base_scroll_speed != 0:
                 return True
 
-            for group in self._layer_groups.values():
-                prop = group.property
-                if prop in ("speed", "direction", "vector"):
-                    if prop in ("speed", "vector"):
-                        return True
-
-            return False
+            registry = self._layer_groups
+            return bool(registry.property_groups("speed") or registry.property_groups("vector"))
 
         def _get_cardinal_direction(self, direction) -> Optional[str]:
             """Get cardinal/intercardinal direction name from direction vector"""
@@ -1257,16 +2184,17 @@ def _build_classes(core):
 
             @property
             def target(self) -> Optional[str]:
-                layer_name = "base.direction"
-                if layer_name in self._rig_state._layer_groups:
-                    group = self._rig_state._layer_groups[layer_name]
-                    if len(group.builders) > 0:
-                        for builder in group.builders:
-                            if not builder.lifecycle.is_complete():
-                                target_dir = builder.target_value
-                                if is_vec2(target_dir):
-                                    return self._rig_state._get_cardinal_direction(target_dir)
-                return None
+                with self._rig_state._lock:
+                    layer_name = "base.direction"
+                    if layer_name in self._rig_state._layer_groups:
+                        group = self._rig_state._layer_groups[layer_name]
+                        if len(group.builders) > 0:
+                            for builder in group.builders:
+                                if not builder.lifecycle.is_complete():
+                                    target_dir = builder.target_value
+                                    if is_vec2(target_dir):
+                                        return self._rig_state._get_cardinal_direction(target_dir)
+                    return None
 
             def __repr__(self):
                 return f"CardinalPropertyState(current={self._current_cardinal}, target={self.target})"
@@ -1288,33 +2216,36 @@ def _build_classes(core):
         @property
         def direction_cardinal(self):
             """Current direction as cardinal/intercardinal string"""
-            direction_vec = self._compute_current_state()[2]
+            direction_vec = self._get_snapshot().direction
             cardinal = self._get_cardinal_direction(direction_vec)
             return _MouseRigState.CardinalPropertyState(self, cardinal)
 
         class LayersView:
             """Dict-like read-only view of active layers."""
-            __slots__ = ('_groups',)
+            __slots__ = ('_groups', '_lock')
 
-            def __init__(self, groups):
+            def __init__(self, groups, lock):
                 self._groups = groups
+                self._lock = lock
 
             def __getitem__(self, name: str):
                 group = self._groups.get(name)
-                return _MouseRigState.LayerState(group) if group is not None else None
+                return _MouseRigState.LayerState(group, self._lock) if group is not None else None
 
             def get(self, name: str, default=None):
                 group = self._groups.get(name)
-                return _MouseRigState.LayerState(group) if group is not None else default
+                return _MouseRigState.LayerState(group, self._lock) if group is not None else default
 
             def keys(self):
                 return self._groups.keys()
 
             def values(self):
-                return [_MouseRigState.LayerState(g) for g in self._groups.values()]
+                with self._lock:
+                    return [_MouseRigState.LayerState(g, self._lock) for g in self._groups.values()]
 
             def items(self):
-                return [(k, _MouseRigState.LayerState(g)) for k, g in self._groups.items()]
+                with self._lock:
+                    return [(k, _MouseRigState.LayerState(g, self._lock)) for k, g in self._groups.items()]
 
             def __contains__(self, name: str) -> bool:
                 return name in self._groups
@@ -1334,12 +2265,17 @@ def _build_classes(core):
         @property
         def layers(self):
             """Dict-like view of active layers"""
-            return _MouseRigState.LayersView(self._layer_groups)
+            return _MouseRigState.LayersView(self._layer_groups, self._lock)
 
         class LayerState:
-            """State information for a specific layer"""
-            def __init__(self, group):
+            """State information for a specific layer
+
+            Reads that evaluate the group hold the rig state's lock (see
+            _get_snapshot).
+            """
+            def __init__(self, group, lock):
                 self._group = group
+                self._lock = lock
 
             def __repr__(self) -> str:
                 def format_value(val):
@@ -1352,37 +2288,38 @@ def _build_classes(core):
                     else:
                         return str(val)
 
-                current_value = self._group.get_current_value()
-                target_value = self._group.target
-
-                lines = [
-                    f"LayerState('{self._group.layer_name}'):",
-                    f"  property = {self._group.property}",
-                    f"  mode = {self._group.mode}",
-                    f"  layer_type = {self._group.layer_type}",
-                    f"  order = {self._group.order}",
-                    f"  is_emit_layer = {self._group.is_emit_layer}",
-                    f"  source_layer = {self._group.source_layer}",
-                    f"  value = {format_value(current_value)}",
-                    f"  target = {format_value(target_value)}",
-                    f"  accumulated = {format_value(self._group.accumulated_value)}",
-                    f"  active_builders = {len(self._group.builders)}",
-                ]
-
-                if self._group.builders:
-                    builder = self._group.builders[0]
-                    lifecycle = builder.lifecycle
-                    lines.append(f"  time_alive = {builder.time_alive:.2f}s")
-                    lines.append(f"  operator = {builder.config.operator}")
-
-                    if lifecycle.over_ms:
-                        lines.append(f"  over_ms = {lifecycle.over_ms}")
-                    if lifecycle.hold_ms:
-                        lines.append(f"  hold_ms = {lifecycle.hold_ms}")
-                    if lifecycle.revert_ms:
-                        lines.append(f"  revert_ms = {lifecycle.revert_ms}")
-
-                return "\n".join(lines)
+                with self._lock:
+                    current_value = self._group.get_current_value()
+                    target_value = self._group.target
+
+                    lines = [
+                        f"LayerState('{self._group.layer_name}'):",
+                        f"  property = {self._group.property}",
+                        f"  mode = {self._group.mode}",
+                        f"  layer_type = {self._group.layer_type}",
+                        f"  order = {self._group.order}",
+                        f"  is_emit_layer = {self._group.is_emit_layer}",
+                        f"  source_layer = {self._group.source_layer}",
+                        f"  value = {format_value(current_value)}",
+                        f"  target = {format_value(target_value)}",
+                        f"  accumulated = {format_value(self._group.accumulated_value)}",
+                        f"  active_builders = {len(self._group.builders)}",
+                    ]
+
+                    if self._group.builders:
+                        builder = self._group.builders[0]
+                        lifecycle = builder.lifecycle
+                        lines.append(f"  time_alive = {builder.time_alive:.2f}s")
+                        lines.append(f"  operator = {builder.config.operator}")
+
+                        if lifecycle.over_ms:
+                            lines.append(f"  over_ms = {lifecycle.over_ms}")
+                        if lifecycle.hold_ms:
+                            lines.append(f"  hold_ms = {lifecycle.hold_ms}")
+                        if lifecycle.revert_ms:
+                            lines.append(f"  revert_ms = {lifecycle.revert_ms}")
+
+                    return "\n".join(lines)
 
             def __str__(self) -> str:
                 return self.__repr__()
@@ -1403,15 +2340,17 @@ def _build_classes(core):
 
             @property
             def current(self):
-                return self._group.get_current_value()
+                with self._lock:
+                    return self._group.get_current_value()
 
             @property
             def target(self):
-                return self._group.target
+                with self._lock:
+                    return self._group.target
 
             @property
             def time_alive(self) -> float:
-                return time.perf_counter() - self._group.creation_time
+                return runtime.current.now() - self._group.creation_time
 
             @property
             def time_left(self) -> float:
@@ -1455,14 +2394,15 @@ def _build_classes(core):
 
             @property
             def target(self):
-                layer_name = f"base.{self._property_name}"
-                if layer_name in self._rig_state._layer_groups:
-                    group = self._rig_state._layer_groups[layer_name]
-                    if len(group.builders) > 0:
-                        for builder in group.builders:
-                            if not builder.lifecycle.is_complete():
-                                return builder.target_value
-                return None
+                with self._rig_state._lock:
+                    layer_name = f"base.{self._property_name}"
+                    if layer_name in self._rig_state._layer_groups:
+                        group = self._rig_state._layer_groups[layer_name]
+                        if len(group.builders) > 0:
+                            for builder in group.builders:
+                                if not builder.lifecycle.is_complete():
+                                    return builder.target_value
+                    return None
 
             def __repr__(self):
                 return f"BasePropertyState('{self._property_name}', value={self._base_value}, target={self.target})"
@@ -1638,14 +2578,15 @@ def _build_classes(core):
 
             @property
             def target(self):
-                for layer_name, group in self._rig_state._layer_groups.items():
-                    if (group.is_base and
-                        group.property in ("scroll", "scroll_vector") and
-                        len(group.builders) > 0):
-                        for builder in group.builders:
-                            if not builder.lifecycle.is_complete():
-                                return builder.target_value
-                return None
+                with self._rig_state._lock:
+                    for layer_name, group in self._rig_state._layer_groups.items():
+                        if (group.is_base and
+                            group.property in ("scroll", "scroll_vector") and
+                            len(group.builders) > 0):
+                            for builder in group.builders:
+                                if not builder.lifecycle.is_complete():
+                                    return builder.target_value
+                    return None
 
             @property
             def x(self):
@@ -1673,48 +2614,45 @@ def _build_classes(core):
 
             @property
             def pos(self):
-                scroll_speed = self._rig_state._compute_current_state()[3]
-                scroll_direction = self._rig_state._compute_current_state()[4]
-                return _MouseRigState.SmartPropertyState(self._rig_state, "scroll", scroll_direction * scroll_speed)
+                scroll_vector = self._rig_state._get_snapshot().scroll_vector
+                return _MouseRigState.SmartPropertyState(self._rig_state, "scroll", scroll_vector)
 
             @property
             def speed(self):
-                scroll_speed_val = self._rig_state._compute_current_state()[3]
+                scroll_speed_val = self._rig_state._get_snapshot().scroll_speed
                 return _MouseRigState.SmartPropertyState(self._rig_state, "scroll_speed", scroll_speed_val)
 
             @property
             def direction(self):
-                scroll_direction_vec = self._rig_state._compute_current_state()[4]
+                scroll_direction_vec = self._rig_state._get_snapshot().scroll_direction
                 return _MouseRigState.SmartPropertyState(self._rig_state, "scroll_direction", scroll_direction_vec)
 
             @property
             def direction_cardinal(self):
-                scroll_direction_vec = self._rig_state._compute_current_state()[4]
+                scroll_direction_vec = self._rig_state._get_snapshot().scroll_direction
                 cardinal = self._rig_state._get_cardinal_direction(scroll_direction_vec)
                 return _MouseRigState.CardinalPropertyState(self._rig_state, cardinal)
 
             @property
             def vector(self):
-                scroll_speed = self._rig_state._compute_current_state()[3]
-                scroll_direction = self._rig_state._compute_current_state()[4]
-                return _MouseRigState.SmartPropertyState(self._rig_state, "scroll_vector", scroll_direction * scroll_speed)
+                scroll_vector = self._rig_state._get_snapshot().scroll_vector
+                return _MouseRigState.SmartPropertyState(self._rig_state, "scroll_vector", scroll_vector)
 
             @property
             def current(self):
-                scroll_speed = self._rig_state._compute_current_state()[3]
-                scroll_direction = self._rig_state._compute_current_state()[4]
-                return scroll_direction * scroll_speed
+                return self._rig_state._get_snapshot().scroll_vector
 
             @property
             def target(self):
-                for layer_name, group in self._rig_state._layer_groups.items():
-                    if (group.is_base and
-                        group.property in ("scroll", "scroll_vector") and
-                        len(group.builders) > 0):
-                        for builder in group.builders:
-                            if not builder.lifecycle.is_complete():
-                                return builder.target_value
-                return None
+                with self._rig_state._lock:
+                    for layer_name, group in self._rig_state._layer_groups.items():
+                        if (group.is_base and
+                            group.property in ("scroll", "scroll_vector") and
+                            len(group.builders) > 0):
+                            for builder in group.builders:
+                                if not builder.lifecycle.is_complete():
+                                    return builder.target_value
+                    return None
 
             @property
             def x(self):
@@ -1743,14 +2681,15 @@ def _build_classes(core):
 
             @property
             def target(self):
-                for layer_name, group in self._rig_state._layer_groups.items():
-                    if (group.is_base and
-                        group.property == self._property_name and
-                        len(group.builders) > 0):
-                        for builder in group.builders:
-                            if not builder.lifecycle.is_complete():
-                                return builder.target_value
-                return None
+                with self._rig_state._lock:
+                    for layer_name, group in self._rig_state._layer_groups.items():
+                        if (group.is_base and
+                            group.property == self._property_name and
+                            len(group.builders) > 0):
+                            for builder in group.builders:
+                                if not builder.lifecycle.is_complete():
+                                    return builder.target_value
+                    return None
 
             @property
             def x(self):
@@ -1902,40 +2841,36 @@ def _build_classes(core):
         # Override property getters to return smart accessors
         @property
         def pos(self):
-            pos_vec = self._compute_current_state()[0]
+            pos_vec = self._get_snapshot().pos
             return _MouseRigState.SmartPropertyState(self, "pos", pos_vec)
 
         @property
         def speed(self):
-            speed_val = self._compute_current_state()[1]
+            speed_val = self._get_snapshot().speed
             return _MouseRigState.SmartPropertyState(self, "speed", speed_val)
 
         @property
         def direction(self):
-            direction_vec = self._compute_current_state()[2]
+            direction_vec = self._get_snapshot().direction
             return _MouseRigState.SmartPropertyState(self, "direction", direction_vec)
 
         @property
         def vector(self):
-            speed = self._compute_current_state()[1]
-            direction = self._compute_current_state()[2]
-            return _MouseRigState.SmartPropertyState(self, "vector", direction * speed)
+            return _MouseRigState.SmartPropertyState(self, "vector", self._get_snapshot().vector)
 
         @property
         def scroll_speed(self):
-            scroll_speed_val = self._compute_current_state()[3]
+            scroll_speed_val = self._get_snapshot().scroll_speed
             return _MouseRigState.SmartPropertyState(self, "speed", scroll_speed_val)
 
         @property
         def scroll_direction(self):
-            scroll_direction_vec = self._compute_current_state()[4]
+            scroll_direction_vec = self._get_snapshot().scroll_direction
             return _MouseRigState.SmartPropertyState(self, "direction", scroll_direction_vec)
 
         @property
         def scroll_vector(self):
-            scroll_speed = self._compute_current_state()[3]
-            scroll_direction = self._compute_current_state()[4]
-            return _MouseRigState.SmartPropertyState(self, "vector", scroll_direction * scroll_speed)
+            return _MouseRigState.SmartPropertyState(self, "vector", self._get_snapshot().scroll_vector)
 
         @property
         def scroll(self):
@@ -1969,6 +2904,7 @@ def _build_classes(core):
         def scroll_stop(self, transition_ms: Optional[float] = None, easing: str = "linear", **kwargs):
             """Stop scrolling only"""
             transition_ms = validate_timing(transition_ms, 'transition_ms', method='scroll_stop')
+            easing = resolve_easing(easing)
 
             config = BuilderConfig()
             all_kwargs = {'easing': easing, **kwargs}
@@ -1988,6 +2924,7 @@ def _build_classes(core):
                 del self._layer_groups[layer]
                 if layer in self._layer_orders:
                     del self._layer_orders[layer]
+            self._invalidate_snapshot()
 
             if transition_ms is None or transition_ms == 0:
                 self._base_scroll_speed = 0.0
@@ -2017,6 +2954,7 @@ def _build_classes(core):
         def move_stop(self, transition_ms: Optional[float] = None, easing: str = "linear", **kwargs):
             """Stop movement only"""
             transition_ms = validate_timing(transition_ms, 'transition_ms', method='move_stop')
+            easing = resolve_easing(easing)
 
             config = BuilderConfig()
             all_kwargs = {'easing': easing, **kwargs}
@@ -2036,6 +2974,7 @@ def _build_classes(core):
                 del self._layer_groups[layer]
                 if layer in self._layer_orders:
                     del self._layer_orders[layer]
+            self._invalidate_snapshot()
 
             self._primed_button = None
 
@@ -2043,7 +2982,7 @@ def _build_classes(core):
                 self._base_speed = 0.0
                 if len(self._layer_groups) == 0 and self._base_scroll_speed == 0:
                     self._stop_frame_loop()
-                cron.after("1ms", self._fire_move_stop_callbacks)
+                runtime.current.after("1ms", self._fire_move_stop_callbacks)
             else:
                 from .builder import ActiveBuilder
 
@@ -2113,10 +3052,11 @@ def _build_classes(core):
 
         def reset(self):
             """Reset everything to default state"""
-            self._stop_frame_loop()
+            self.shutdown()
 
             self._layer_groups.clear()
             self._layer_orders.clear()
+            self._stack_holders.clear()
             self._throttle_times.clear()
             self._rate_builder_cache.clear()
             self._debounce_pending.clear()
@@ -2130,6 +3070,7 @@ def _build_classes(core):
 
             self._subpixel_adjuster.reset()
             self._next_auto_order = 0
+            self._invalidate_snapshot()
 
             self._stop_callbacks.clear()
             self._scroll_stop_callbacks.clear()
@@ -2142,11 +3083,17 @@ def _build_classes(core):
                 group = self._layer_groups[layer]
 
                 if current_time is None:
-                    current_time = time.perf_counter()
+                    current_time = runtime.current.now()
 
                 if group.builders:
                     for builder in group.builders:
                         builder.lifecycle.trigger_revert(current_time, revert_ms, easing)
+                        if builder._stack_parked:
+                            # Its parked builders hold the same value, so
+                            # they revert with it, as part of its weight
+                            builder._stack_parked = ()
+                            self._stack_holders.pop(builder, None)
+                    group.invalidate()
                 else:
                     if not group.is_base and not group._is_reverted_to_zero():
                         from .builder import ActiveBuilder
@@ -2181,6 +3128,20 @@ def _build_classes(core):
 
                         self.add_builder(builder)
 
+                self._invalidate_snapshot()
                 self._ensure_frame_loop_running()
 
+        def remove_layer(self, *args, **kwargs):
+            """Override to drop the state snapshot after a layer is removed"""
+            result = super().remove_layer(*args, **kwargs)
+            self._invalidate_snapshot()
+            return result
+
+        def reverse_all_directions(self):
+            """Override to drop the state snapshot after directions flip"""
+            super().reverse_all_directions()
+            for group in self._layer_groups.values():
+                group.invalidate()
+            self._invalidate_snapshot()
+
     RigState = _MouseRigState
@@ -0,0 +1,110 @@
+"""Trajectory plans - precomputed per-frame totals for finite smooth moves
+
+Relative pos.by / pos.to moves and scroll_pos moves (the *_smooth actions)
+ease a fixed distance over a fixed time. Instead of re-interpolating and
+rounding through the builder every tick, the OVER phase is planned once:
+the cumulative total at every frame boundary, already rounded to whole
+pixels for mouse moves (scroll keeps fractions, the native scroll APIs
+accumulate them). Each tick then picks the frame nearest to the elapsed
+time. Hold and revert phases, group lifecycles and non-lerp interpolation
+keep going through the builder.
+
+Plans are cached in an LRU keyed by (distance, duration, easing, frame
+interval), so a voice command repeated through the day is planned once.
+NumPy, when available, vectorises the scale-and-round step.
+"""
+
+import math
+from functools import lru_cache
+from typing import Optional
+
+from . import core as _core
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Distinct (distance, duration, easing, interval) plans kept
+PLAN_CACHE_SIZE = 256
+
+# Builder._trajectory before the first frame has looked at it
+UNPLANNED = object()
+
+
+class TrajectoryPlan:
+    """Cumulative (x, y) totals at each frame boundary of an OVER phase"""
+
+    __slots__ = ("xs", "ys", "interval_ms", "frames")
+
+    def __init__(self, xs, ys, interval_ms: float):
+        self.xs = xs
+        self.ys = ys
+        self.interval_ms = interval_ms
+        self.frames = len(xs) - 1
+
+    def total_at(self, elapsed_ms: float) -> tuple:
+        """Total at the frame boundary nearest `elapsed_ms`; the exact
+        distance once the phase is over"""
+        k = int(elapsed_ms / self.interval_ms + 0.5)
+        if k > self.frames:
+            k = self.frames
+        elif k < 0:
+            k = 0
+        return self.xs[k], self.ys[k]
+
+    def __repr__(self) -> str:
+        return f"TrajectoryPlan({self.frames} frames, to ({self.xs[-1]}, {self.ys[-1]}))"
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _build_plan(dx: float, dy: float, duration_ms: float, easing: str, interval_ms: float, integer: bool) -> TrajectoryPlan:
+    ease = _core.get_easing_function(easing)
+    frames = max(1, math.ceil(duration_ms / interval_ms))
+    progress = [ease(min(1.0, k * interval_ms / duration_ms)) for k in range(frames + 1)]
+
+    if np is not None:
+        p = np.asarray(progress, dtype=float)
+        xs, ys = p * dx, p * dy
+        if integer:
+            xs, ys = np.rint(xs).astype(int), np.rint(ys).astype(int)
+        return TrajectoryPlan(tuple(xs.tolist()), tuple(ys.tolist()), interval_ms)
+
+    xs = [dx * p for p in progress]
+    ys = [dy * p for p in progress]
+    if integer:
+        xs = [round(x) for x in xs]
+        ys = [round(y) for y in ys]
+    return TrajectoryPlan(tuple(xs), tuple(ys), interval_ms)
+
+
+def get_plan(dx: float, dy: float, duration_ms: float, easing: str, interval_ms: float, integer: bool = True) -> TrajectoryPlan:
+    """Plan moving (dx, dy) over duration_ms with `easing`, sampled every
+    interval_ms. Cached until clear_plans()."""
+    return _build_plan(float(dx), float(dy), float(duration_ms), easing, float(interval_ms), integer)
+
+
+def plan_for_builder(builder, interval_ms: float, integer: bool) -> Optional[TrajectoryPlan]:
+    """Plan for a builder's OVER phase, or None if it has to be interpolated
+    live (no timed OVER phase, group lifecycle, non-lerp interpolation)"""
+    lifecycle = builder.lifecycle
+    config = builder.config
+    if lifecycle is None or builder.group_lifecycle is not None:
+        return None
+    over_ms = lifecycle.over_ms
+    if not over_ms or over_ms <= 0 or config.over_interpolation != "lerp":
+        return None
+    target = builder.target_value
+    if not _core.is_vec2(target):
+        return None
+    return get_plan(target.x, target.y, over_ms, config.over_easing or "linear", interval_ms, integer)
+
+
+def clear_plans():
+    """Drop cached plans (an easing name was redefined)"""
+    _build_plan.cache_clear()
+
+
+def plan_cache_info():
+    """functools cache statistics (hits, misses, maxsize, currsize)"""
+    return _build_plan.cache_info()
@@ -0,0 +1,1193 @@
+"""Engine tests - frame loop internals, backends and emission
+
+Sync tests that check engine behavior directly rather than through cursor
+movement.
+"""
+
+from talon import actions
+
+
+# ============================================================================
+# BACKEND CACHE
+# ============================================================================
+
+def test_backends_cached():
+    """Test: move and scroll backends are built once per API and reused"""
+    from ..src.mouse_api import get_mouse_move_functions, get_mouse_scroll_function
+
+    first = get_mouse_move_functions("talon", "talon")
+    second = get_mouse_move_functions("talon", "talon")
+    assert first[0] is second[0], "Absolute move function rebuilt for the same API"
+    assert first[1] is second[1], "Relative move function rebuilt for the same API"
+
+    scroll = get_mouse_scroll_function("talon")
+    assert get_mouse_scroll_function("talon") is scroll, "Scroll function rebuilt for the same API"
+
+
+def test_backends_invalidated():
+    """Test: an API setting change drops cached backends"""
+    from ..src.mouse_api import get_mouse_scroll_function
+    from ..src.core import _on_api_setting_change
+
+    scroll = get_mouse_scroll_function("talon")
+    _on_api_setting_change()
+    assert get_mouse_scroll_function("talon") is not scroll, "Scroll backend survived invalidation"
+
+
+# ============================================================================
+# LINUX X11 BACKEND (recorded fake connection, runs on any platform)
+# ============================================================================
+
+class RecordingX11Connection:
+    """Stands in for the XTest connection and records what would be sent"""
+
+    def __init__(self):
+        self.events = []
+        self.flushes = 0
+
+    def move_absolute(self, x, y):
+        self.events.append(("warp", x, y))
+
+    def move_relative(self, dx, dy):
+        self.events.append(("motion", dx, dy))
+
+    def click(self, button):
+        self.events.append(("click", button))
+
+    def flush(self):
+        self.flushes += 1
+
+
+def test_x11_relative_motion():
+    """Test: linux_x11 relative moves are XTest relative motion events"""
+    from ..src.mouse_api import _make_linux_x11_mouse_move
+
+    conn = RecordingX11Connection()
+    _, move_relative = _make_linux_x11_mouse_move(conn)
+    move_relative(3, -2)
+
+    assert conn.events == [("motion", 3, -2)], f"Unexpected events {conn.events}"
+    assert conn.flushes == 1, f"Expected 1 flush outside a frame, got {conn.flushes}"
+
+
+def test_x11_frame_single_flush():
+    """Test: moves and scrolls in one frame share a single flush"""
+    from ..src.mouse_api import _make_linux_x11_mouse_move, _make_linux_x11_mouse_scroll, begin_frame, end_frame
+
+    conn = RecordingX11Connection()
+    _, move_relative = _make_linux_x11_mouse_move(conn)
+    scroll = _make_linux_x11_mouse_scroll(conn)
+
+    begin_frame()
+    move_relative(1, 0)
+    move_relative(0, 1)
+    scroll(0, 2.5)
+    assert conn.flushes == 0, "Flushed before end of frame"
+    end_frame()
+
+    assert conn.flushes == 1, f"Expected 1 flush per frame, got {conn.flushes}"
+    clicks = [event for event in conn.events if event[0] == "click"]
+    assert clicks == [("click", 5), ("click", 5)], f"Expected 2 scroll-down clicks, got {clicks}"
+
+    scroll(0, 0.5)
+    clicks = [event for event in conn.events if event[0] == "click"]
+    assert len(clicks) == 3, "Fractional scroll was not carried to the next call"
+
+
+# ============================================================================
+# LINUX UINPUT BACKEND (in-memory sink, runs on any platform)
+# ============================================================================
+
+class RecordingSink:
+    """File-like sink that keeps each write() separately"""
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+
+
+def _decode_input_events(data):
+    import struct
+    event = struct.Struct("llHHi")
+    return [event.unpack_from(data, offset)[2:] for offset in range(0, len(data), event.size)]
+
+
+def test_uinput_frame_single_write():
+    """Test: a frame's uinput move and scroll go out in one write ending in SYN"""
+    from ..src.mouse_api import (
+        _UinputDevice, _make_linux_uinput_mouse_move, _make_linux_uinput_mouse_scroll,
+        begin_frame, end_frame,
+    )
+
+    sink = RecordingSink()
+    device = _UinputDevice(sink)
+    _, move_relative = _make_linux_uinput_mouse_move(device)
+    scroll = _make_linux_uinput_mouse_scroll(device)
+
+    begin_frame()
+    move_relative(2, 0)
+    scroll(0, 0.25)
+    assert not sink.writes, "Wrote before end of frame"
+    end_frame()
+
+    assert len(sink.writes) == 1, f"Expected 1 write per frame, got {len(sink.writes)}"
+    events = _decode_input_events(sink.writes[0])
+    assert events[-1] == (0, 0, 0), f"Frame does not end with SYN_REPORT: {events}"
+    assert (2, 0x00, 2) in events, f"Missing REL_X motion: {events}"
+    assert (2, 0x0b, -30) in events, f"Expected -30 hi-res wheel units for 0.25 lines down: {events}"
+    assert not any(code == 0x08 for _, code, _ in events), "Whole-line wheel sent for a quarter line"
+
+
+def test_uinput_hi_res_accumulates_lines():
+    """Test: hi-res scroll emits a classic wheel detent once a line accumulates"""
+    from ..src.mouse_api import _UinputDevice, _make_linux_uinput_mouse_scroll
+
+    sink = RecordingSink()
+    scroll = _make_linux_uinput_mouse_scroll(_UinputDevice(sink))
+
+    for _ in range(4):
+        scroll(0, -0.25)
+
+    events = [event for data in sink.writes for event in _decode_input_events(data)]
+    hi_res = sum(value for ev_type, code, value in events if code == 0x0b)
+    lines = sum(value for ev_type, code, value in events if code == 0x08)
+    assert hi_res == 120, f"Expected 120 hi-res units for one line up, got {hi_res}"
+    assert lines == 1, f"Expected 1 wheel detent, got {lines}"
+
+
+def test_uinput_relative_carries_fraction():
+    """Test: scaled relative motion keeps the fraction EV_REL cannot carry"""
+    from talon import settings
+    from ..src.mouse_api import _UinputDevice, _make_linux_uinput_mouse_move
+
+    sink = RecordingSink()
+    _, move_relative = _make_linux_uinput_mouse_move(_UinputDevice(sink))
+    scale = settings.get("user.mouse_rig_scale", 1.0)
+
+    for _ in range(10):
+        move_relative(0.5 / scale, -0.25 / scale)
+
+    events = [event for data in sink.writes for event in _decode_input_events(data)]
+    x = sum(value for ev_type, code, value in events if ev_type == 2 and code == 0x00)
+    y = sum(value for ev_type, code, value in events if ev_type == 2 and code == 0x01)
+    assert (x, y) == (5, -2), f"Expected (5, -2) counts from 10 fractional moves, got {(x, y)}"
+
+
+class FullQueueSink:
+    """Sink whose kernel queue is always full"""
+
+    def write(self, data):
+        raise BlockingIOError(11, "Resource temporarily unavailable")
+
+
+def test_uinput_full_queue_dropped():
+    """Test: a full uinput queue drops the frame instead of raising into the tick"""
+    from ..src.mouse_api import _UinputDevice
+
+    device = _UinputDevice(FullQueueSink())
+    device.emit(2, 0x00, 3)
+    device.flush()
+    assert device.dropped == 1, f"Expected 1 dropped frame, got {device.dropped}"
+
+    device.flush()
+    assert device.dropped == 1, "Dropped events were kept and sent again"
+
+
+# ============================================================================
+# HEADLESS SIMULATION (virtual clock, recorded output)
+# ============================================================================
+
+def test_headless_constant_speed():
+    """Test: speed 2 to the right for 10 virtual frames moves the simulated cursor 20px"""
+    from ..src.headless import Simulation
+
+    with Simulation(cursor=(100, 100)) as sim:
+        rig = sim.rig()
+        rig.direction.to(1, 0)
+        rig.speed.to(2)
+        frames = sim.run_frames(10)
+
+        assert frames == 10, f"Frame loop stopped early after {frames} frames"
+        moved_x = sum(dx for _, dx, _ in sim.output.relative_events)
+        moved_y = sum(dy for _, _, dy in sim.output.relative_events)
+        assert abs(moved_x - 20) <= 1, f"Expected ~20px right, got {moved_x}"
+        assert moved_y == 0, f"Expected no vertical movement, got {moved_y}"
+        assert sim.cursor[0] == 100 + moved_x, "Simulated cursor did not follow relative moves"
+
+
+def test_headless_restores_runtime():
+    """Test: closing a simulation puts the Talon runtime back"""
+    from ..src import runtime
+    from ..src.headless import Simulation
+
+    with Simulation() as sim:
+        assert runtime.current is sim.runtime, "Headless runtime not installed"
+    assert isinstance(runtime.current, runtime.TalonRuntime), "Talon runtime not restored"
+
+
+# ============================================================================
+# TICK PROFILING
+# ============================================================================
+
+def test_perf_disabled_by_default():
+    """Test: frames run without profiling record nothing"""
+    from ..src.headless import Simulation
+
+    with Simulation() as sim:
+        rig = sim.rig()
+        rig.direction.to(1, 0)
+        rig.speed.to(2)
+        sim.run_frames(5)
+
+        assert not sim.state.perf.enabled, "Profiler enabled without the setting"
+        assert sim.state.perf.frame.count == 0, "Disabled profiler recorded frames"
+
+
+def test_perf_phases_recorded():
+    """Test: an enabled profiler counts every frame and its phases"""
+    from ..src.headless import Simulation
+
+    with Simulation(settings={"mouse_rig_perf": True}) as sim:
+        rig = sim.rig()
+        rig.direction.to(1, 0)
+        rig.speed.to(2)
+        sim.run_frames(10)
+
+        perf = sim.state.perf
+        assert perf.enabled, "mouse_rig_perf setting did not enable the profiler"
+        assert perf.frame.count == 10, f"Expected 10 frames, got {perf.frame.count}"
+        for phase in ("advance", "velocity", "emit", "remove"):
+            count = perf.phases[phase].count
+            assert count == 10, f"Expected 10 {phase} samples, got {count}"
+        assert perf.worst_frame is not None, "Slowest frame not kept"
+        assert "advance" in perf.report(), "Report missing phase rows"
+
+        perf.reset()
+        assert perf.frame.count == 0, "reset() kept frame counts"
+
+
+def test_jitter_stall_tagged():
+    """Test: a tick arriving several frames late is counted and tagged with active layers"""
+    from ..src.headless import Simulation
+
+    with Simulation() as sim:
+        rig = sim.rig()
+        rig.direction.to(1, 0)
+        rig.layer("jitter_test").speed.add(2)
+        sim.run_frames(5)
+
+        jitter = sim.state.jitter
+        assert jitter.frames == 5, f"Expected 5 frames, got {jitter.frames}"
+        assert jitter.stalls == 0, "On-time frames counted as stalls"
+
+        # Hold the next tick back by 100ms (6 frames at 16ms)
+        sim.state._frame_loop_job.due += 0.1
+        sim.run_frames(1)
+
+        assert jitter.stalls == 1, f"Expected 1 stall, got {jitter.stalls}"
+        assert jitter.missed_frames == 6, f"Expected 6 missed frames, got {jitter.missed_frames}"
+        stall = jitter.worst_stall
+        assert "jitter_test" in stall["layers"], f"Stall not tagged with active layer: {stall}"
+        assert stall["backend"] == "headless", f"Unexpected backend tag: {stall['backend']}"
+        assert sum(jitter.recent_histogram) == 6, "Rolling histogram out of step with frames"
+
+
+# ============================================================================
+# FRAME THREAD
+# ============================================================================
+
+def test_frame_thread_ticks_off_main_thread():
+    """Test: a frame thread ticks on its deadlines while holding the lock, skips missed ones, and stops on cancel"""
+    import threading
+    from ..src.frame_thread import FrameThread, on_frame_thread
+    from ..src.headless import VirtualClock
+
+    clock = VirtualClock()
+    start = clock.now()
+    lock = threading.RLock()
+    ticks = []
+
+    def sleep(seconds):
+        # Spinning sleep(0) still has to move the virtual clock along
+        clock.advance(max(seconds, 0.0001))
+
+    def tick():
+        ticks.append((clock.now() - start, on_frame_thread(), lock._is_owned()))
+        if len(ticks) == 3:
+            clock.advance(0.010)    # a slow tick misses two deadlines
+        if len(ticks) == 6:
+            thread.cancel()
+
+    thread = FrameThread(0.004, tick, lock, clock=clock.now, sleep=sleep)
+    thread.start()
+    thread.join(5)
+
+    assert not thread.is_alive(), "Frame thread still running after cancel"
+    assert not on_frame_thread(), "Main thread reported as the frame thread"
+    assert len(ticks) == 6, f"Expected 6 ticks before cancel, got {len(ticks)}"
+    assert all(on_thread for _, on_thread, _ in ticks), "Tick did not run on the frame thread"
+    assert all(owned for _, _, owned in ticks), "Tick ran without holding the state lock"
+
+    expected = [0.004, 0.008, 0.012, 0.024, 0.028, 0.032]
+    for (at, _, _), deadline in zip(ticks, expected):
+        assert deadline <= at + 1e-9 < deadline + 0.0005, f"Ticks at {[round(t[0], 4) for t in ticks]}, expected {expected}"
+
+
+def test_state_reads_hold_lock():
+    """Test: computing state for a read holds the lock a frame thread ticks under"""
+    from ..src.headless import Simulation
+
+    with Simulation() as sim:
+        rig = sim.rig()
+        state = sim.state
+        rig.speed.to(3).over(100)
+        rig.layer("lock_test").speed.offset.add(1)
+
+        owned = []
+
+        def checked(compute):
+            def wrapper():
+                owned.append(state._lock._is_owned())
+                return compute()
+            return wrapper
+
+        group = state._layer_groups["lock_test"]
+        state._compute_current_state = checked(state._compute_current_state)
+        group.get_current_value = checked(group.get_current_value)
+        state._invalidate_snapshot()
+        _ = state.speed
+        _ = state.layers["lock_test"].current
+        del state._compute_current_state
+        del group.get_current_value
+
+        assert owned and all(owned), f"Computed-state reads with the lock held: {owned}"
+
+
+def test_engine_ring_and_state_roundtrip():
+    """Test: engine process commands and state survive shared memory, in order and bounded"""
+    from multiprocessing import shared_memory
+    from ..src.engine_process import (
+        CommandRing, StateBlock, RING_SLOTS, CMD_VELOCITY, CMD_INTERVAL, _RING_SIZE, _STATE,
+    )
+
+    ring_shm = shared_memory.SharedMemory(create=True, size=_RING_SIZE)
+    state_shm = shared_memory.SharedMemory(create=True, size=_STATE.size)
+    try:
+        ring_shm.buf[:_RING_SIZE] = bytes(_RING_SIZE)
+        state_shm.buf[:_STATE.size] = bytes(_STATE.size)
+        producer, consumer = CommandRing(ring_shm), CommandRing(ring_shm)
+
+        assert consumer.pop() is None, "Empty ring returned a command"
+        assert producer.push(CMD_INTERVAL, 8.0)
+        assert producer.push(CMD_VELOCITY, 120.0, -40.0, 0.0, 2.5)
+        assert consumer.pop() == (CMD_INTERVAL, [8.0, 0.0, 0.0, 0.0, 0.0])
+        assert consumer.pop() == (CMD_VELOCITY, [120.0, -40.0, 0.0, 2.5, 0.0])
+        assert consumer.pop() is None, "Ring returned a command twice"
+
+        pushed = 0
+        while producer.push(CMD_VELOCITY, float(pushed)):
+            pushed += 1
+        assert pushed == RING_SLOTS, f"Ring accepted {pushed} commands, expected {RING_SLOTS}"
+        assert consumer.pop()[1][0] == 0.0, "Ring did not wrap in order"
+        assert producer.push(CMD_VELOCITY, -1.0), "Ring stayed full after a pop"
+
+        writer, reader = StateBlock(state_shm), StateBlock(state_shm)
+        assert reader.read()["ticks"] == 0
+        writer.write(3, 1234, 10.0, -5.0, 0.0, 1.5, 600.0, -300.0, 0.0, 90.0)
+        state = reader.read()
+        assert state["ticks"] == 3 and state["pid"] == 1234, f"Bad state {state}"
+        assert state["emitted_x"] == 10.0 and state["scroll_velocity_y"] == 90.0, f"Bad state {state}"
+
+        # A write in progress (odd sequence) leaves the last good snapshot
+        struct_seq = state_shm.buf[:8].tobytes()
+        state_shm.buf[:8] = (int.from_bytes(struct_seq, "little") + 1).to_bytes(8, "little")
+        assert reader.read()["ticks"] == 3, "Torn state read"
+    finally:
+        for shm in (ring_shm, state_shm):
+            shm.close()
+            shm.unlink()
+
+
+def _shared_memory_exists(name):
+    from multiprocessing import shared_memory
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    shm.close()
+    return True
+
+
+def test_engine_shared_memory_released():
+    """Test: an engine's shared memory is unlinked on close() and when the engine is dropped"""
+    import gc
+    from ..src.engine_process import EngineProcess
+
+    def started_engine():
+        # A missing interpreter fails after the shared memory is created
+        engine = EngineProcess("linux_uinput", "", 1.0, "/nonexistent/mouse_rig_python")
+        try:
+            engine.start()
+        except OSError:
+            pass
+        names = (engine._ring.shm.name, engine._state.shm.name)
+        assert all(_shared_memory_exists(name) for name in names), "Shared memory not created"
+        return engine, names
+
+    engine, names = started_engine()
+    engine.close()
+    engine.close()
+    assert not any(_shared_memory_exists(name) for name in names), "close() left shared memory behind"
+
+    engine, names = started_engine()
+    del engine
+    gc.collect()
+    assert not any(_shared_memory_exists(name) for name in names), "Dropped engine left shared memory behind"
+
+
+def test_engine_ready_after_first_tick():
+    """Test: an engine only takes over emission once its worker has ticked"""
+    from ..src.engine_process import EngineProcess, StateBlock
+
+    engine = EngineProcess("linux_uinput", "", 1.0, "/nonexistent/mouse_rig_python")
+    engine._velocity = (100.0, 0.0, 0.0, 0.0)
+    try:
+        engine.start()
+    except OSError:
+        pass
+    try:
+        assert engine._velocity == (0.0, 0.0, 0.0, 0.0), "A new worker should start still"
+        assert not engine.ready, "Engine ready before its worker ticked"
+        worker = StateBlock(engine._state.shm)
+        worker.write(0, 1234, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        assert not engine.ready, "Engine ready before its worker ticked"
+        worker.write(1, 1234, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        assert engine.ready, "Engine not ready after its worker ticked"
+    finally:
+        engine.close()
+    assert not engine.ready, "Closed engine still ready"
+
+
+class RecordingEngine:
+    """Stands in for an EngineProcess and records close()"""
+
+    def __init__(self):
+        self.closed = 0
+
+    def close(self):
+        self.closed += 1
+
+
+def test_reset_closes_engine():
+    """Test: rig.reset() shuts down the engine process instead of orphaning it"""
+    from ..src.headless import Simulation
+
+    with Simulation() as sim:
+        engine = RecordingEngine()
+        sim.state._engine = engine
+        sim.rig().reset()
+        assert engine.closed == 1, f"Engine closed {engine.closed} times on reset, expected 1"
+        assert sim.state._engine is None, "Reset kept a closed engine"
+
+
+def test_emit_queue_merges_when_full():
+    """Test: a backed-up emit queue merges frames instead of dropping motion"""
+    import threading
+    from ..src.emit_queue import EmitQueue, EMIT_ABSOLUTE, EMIT_RELATIVE, EMIT_SCROLL
+
+    gate = threading.Event()
+    moves, scrolls, targets = [], [], []
+
+    def move_relative(dx, dy):
+        gate.wait(1.0)
+        moves.append((dx, dy))
+
+    queue = EmitQueue(maxlen=2)
+    for frame in range(10):
+        queue.begin()
+        queue.put(EMIT_RELATIVE, move_relative, 3, -1)
+        queue.put(EMIT_SCROLL, lambda x, y: scrolls.append((x, y)), 0.0, 0.25)
+        if frame == 9:
+            queue.put(EMIT_ABSOLUTE, lambda x, y: targets.append((x, y)), 500, 400)
+        queue.commit()
+        assert queue.depth <= 2, f"Queue grew past its bound: {queue.depth}"
+
+    gate.set()
+    assert queue.drain(1.0), "Emit queue did not drain"
+
+    assert sum(dx for dx, _ in moves) == 30 and sum(dy for _, dy in moves) == -10, f"Lost motion: {moves}"
+    assert abs(sum(y for _, y in scrolls) - 2.5) < 1e-9, f"Lost scroll: {scrolls}"
+    assert targets == [(500, 400)], f"Absolute move not emitted once: {targets}"
+    assert queue.merged > 0, "Expected frames to merge while the backend was blocked"
+    assert queue.batches == 10 and queue.max_depth == 2
+    assert queue.latency.count == queue.backend.count == 10 - queue.merged
+
+
+def test_easing_tables():
+    """Test: custom easing curves compile into tables that match the curve"""
+    from ..src.easing import EasingTable, cubic_bezier, piecewise, resolve_easing
+    from ..src.core import EASING_FUNCTIONS
+
+    ease = cubic_bezier(0.25, 0.1, 0.25, 1.0)
+    assert ease(0) == 0.0 and ease(1) == 1.0, "Bezier endpoints not exact"
+    assert abs(ease(0.5) - 0.8024) < 1e-3, f"CSS 'ease' at 0.5 should be ~0.8024, got {ease(0.5)}"
+    straight = cubic_bezier(0, 0, 1, 1)
+    assert all(abs(straight(i / 97) - i / 97) < 1e-9 for i in range(98)), "Linear bezier is not linear"
+
+    kick = piecewise([(0, 0), (0.25, 0.75), (1, 1)])
+    assert abs(kick(0.125) - 0.375) < 1e-9 and abs(kick(0.625) - 0.875) < 1e-9, "Piecewise segments off"
+
+    quartic = EasingTable.from_function(lambda t: t ** 4)
+    worst = max(abs(quartic(i / 1009) - (i / 1009) ** 4) for i in range(1010))
+    assert worst < 1e-5, f"Table interpolation error {worst}"
+
+    name = resolve_easing("cubic-bezier(0.3, 0, 0.2, 1)")
+    assert name == "cubic_bezier(0.3, 0, 0.2, 1)", f"Unexpected normalized name {name}"
+    assert isinstance(EASING_FUNCTIONS[name], EasingTable), "Inline easing not registered with rig-core"
+    assert resolve_easing("ease_in_out") == "ease_in_out", "Built-in easing renamed"
+
+
+def test_easing_release():
+    """Test: custom easings can't replace built-ins and come back out of rig-core on release"""
+    from ..src import easing
+    from ..src.contracts import ConfigError, VALID_EASINGS
+    from ..src.core import EASING_FUNCTIONS
+
+    linear = EASING_FUNCTIONS["linear"]
+    try:
+        easing.register_easing("linear", "cubic_bezier(0.2, 0.9, 0.3, 1)")
+        assert False, "Registering over a built-in easing should raise"
+    except ConfigError:
+        pass
+    assert EASING_FUNCTIONS["linear"] is linear, "Built-in easing replaced"
+
+    easing.register_easing("release_test", "piecewise(0:0, 0.5:0.9, 1:1)")
+    assert "release_test" in EASING_FUNCTIONS and "release_test" in VALID_EASINGS
+    try:
+        easing.release()
+        leftover = [name for name, fn in EASING_FUNCTIONS.items() if getattr(fn, "mouse_rig_easing", False)]
+        assert not leftover, f"Custom easings left in rig-core after release: {leftover}"
+        assert "release_test" not in VALID_EASINGS, "Custom easing left in VALID_EASINGS"
+        assert "linear" in EASING_FUNCTIONS, "Release removed a built-in easing"
+    finally:
+        easing._custom.pop("release_test", None)
+        easing._build_classes(easing._core)
+
+
+def test_trajectory_plan_cached():
+    """Test: a smooth pos.by follows its precomputed plan, lands exactly, and repeats hit the plan cache"""
+    from ..src.headless import Simulation
+    from ..src.trajectory import get_plan, plan_cache_info
+
+    plan = get_plan(100, -40, 160, "ease_in_out", 16)
+    assert plan.frames == 10, f"Expected 10 frames for 160ms at 16ms, got {plan.frames}"
+    assert (plan.xs[0], plan.ys[0]) == (0, 0) and (plan.xs[-1], plan.ys[-1]) == (100, -40)
+    assert all(isinstance(v, int) for v in plan.xs + plan.ys), "Move plans should be whole pixels"
+    assert list(plan.xs) == sorted(plan.xs), "ease_in_out plan should not move backwards"
+
+    with Simulation(cursor=(500, 500)) as sim:
+        rig = sim.rig()
+        for _ in range(2):
+            rig.pos.by(100, -40).over(160, "ease_in_out")
+            sim.run_until_idle()
+        before = plan_cache_info()
+        rig.pos.by(100, -40).over(160, "ease_in_out")
+        sim.run_until_idle()
+        after = plan_cache_info()
+
+        assert sim.cursor == (800, 380), f"Expected cursor at (800, 380), got {sim.cursor}"
+        assert after.hits > before.hits and after.misses == before.misses, "Repeated move was re-planned"
+
+
+def test_state_at_and_finish_all():
+    """Test: state.at() looks ahead without advancing anything, finish_all() lands animations at their end"""
+    from ..src.headless import Simulation
+
+    with Simulation(cursor=(100, 100)) as sim:
+        rig = sim.rig()
+        rig.speed.to(10).over(500)
+        sim.run_frames(1)
+        speed = float(rig.state.speed)
+
+        halfway = rig.state.at(250).speed
+        assert 0 < halfway < 10, f"Expected speed between 0 and 10 at 250ms, got {halfway}"
+        assert abs(rig.state.at(2000).speed - 10) < 1e-6, "Expected speed 10 after the over phase"
+        assert float(rig.state.speed) == speed, "state.at() advanced the rig"
+
+        rig.finish_all()
+        assert abs(float(rig.state.speed) - 10) < 1e-6, f"Expected speed 10 after finish_all, got {rig.state.speed}"
+        rig.stop()
+        sim.run_until_idle()
+
+        done = []
+        start = sim.cursor
+        rig.pos.by(200, 0).over(1000).then(lambda: done.append(True))
+        sim.run_frames(3)
+        rig.finish_all()
+        assert sim.cursor == (start[0] + 200, start[1]), f"Expected move to finish 200px right, got {sim.cursor}"
+        assert done, "Expected .then() to fire on finish_all"
+
+
+def test_stack_coalescing():
+    """Test: identical stacked boosts from one frame fold into one weighted builder with the same total"""
+    from ..src.headless import Simulation
+
+    def boost(rig):
+        return rig.layer("boost").speed.offset.add(2).over(100).hold(100).revert(100)
+
+    with Simulation() as sim:
+        rig = sim.rig()
+        boost(rig).run()
+        sim.run_frames(4)
+        single = float(rig.state.speed)
+
+    with Simulation() as sim:
+        rig = sim.rig()
+        for _ in range(5):
+            boost(rig).run()
+        builders = sim.state._layer_groups["boost"].builders
+        assert len(builders) == 1, f"Expected 1 folded builder, got {len(builders)}"
+        assert builders[0]._stack_weight == 5, f"Expected weight 5, got {builders[0]._stack_weight}"
+
+        sim.run_frames(4)
+        assert abs(float(rig.state.speed) - 5 * single) < 1e-6, f"Expected {5 * single}, got {rig.state.speed}"
+
+        boost(rig).run()
+        assert len(builders) == 2, "A boost from a later frame should stay separate while easing in"
+        sim.run_frames(7)
+        assert len(builders) == 1 and builders[0]._stack_weight == 6, \
+            f"Expected both boosts folded while holding, got {[b._stack_weight for b in builders]}"
+        sim.run_until_idle()
+        assert float(rig.state.speed) == 0, f"Expected boosts to revert to 0, got {rig.state.speed}"
+
+    with Simulation() as sim:
+        rig = sim.rig()
+        for _ in range(5):
+            boost(rig).max(6).run()
+        sim.run_frames(8)
+        assert abs(float(rig.state.speed) - 6) < 1e-6, f"Expected max(6) to clamp the folded total, got {rig.state.speed}"
+
+    with Simulation(cursor=(500, 500)) as sim:
+        rig = sim.rig()
+        for _ in range(3):
+            rig.pos.offset.by(10, 0).stack().over(48).hold(48).revert(48).run()
+        builders = sim.state._layer_groups["pos.offset"].builders
+        assert len(builders) == 3, f"Stacked pos offsets should stay separate, got {len(builders)} builders"
+
+        sim.run_frames(4)
+        assert sim.cursor == (530, 500), f"Expected 3 stacked offsets to move 30px, got {sim.cursor}"
+        sim.run_until_idle()
+        assert sim.cursor == (500, 500), f"Expected stacked offsets to revert to the start, got {sim.cursor}"
+
+
+def test_stack_folds_across_frames():
+    """Test: boosts mashed across frames fold while holding, with the same speed every frame as unfolded ones"""
+    from ..src.headless import Simulation
+
+    def mash(fold):
+        with Simulation() as sim:
+            rig = sim.rig()
+            speeds, counts = [], []
+            for frame in range(60):
+                if frame < 12:
+                    builder = rig.layer("boost").speed.offset.add(1).over(48).hold(400).revert(96)
+                    if not fold:
+                        # A then callback keeps a builder from being folded
+                        builder.then(lambda: None)
+                    builder.run()
+                sim.run_frames(1)
+                speeds.append(float(rig.state.speed))
+                group = sim.state._layer_groups.get("boost")
+                counts.append(len(group.builders) if group is not None else 0)
+            sim.run_until_idle()
+            speeds.append(float(rig.state.speed))
+            return speeds, counts
+
+    folded_speeds, folded_counts = mash(True)
+    speeds, counts = mash(False)
+
+    worst = max(abs(a - b) for a, b in zip(folded_speeds, speeds))
+    assert worst < 1e-9, f"Folded boosts drifted from unfolded ones by {worst}"
+    assert folded_speeds[-1] == 0, f"Expected folded boosts to revert to 0, got {folded_speeds[-1]}"
+    assert counts[15:27] == [12] * 12, f"Expected 12 unfolded builders while holding, got {counts[15:27]}"
+    assert folded_counts[15:27] == [1] * 12, f"Expected one builder while all 12 hold, got {folded_counts[15:27]}"
+
+
+def test_soa_matches_object_path():
+    """Test: vectorised group evaluation gives exactly the object path's total"""
+    from unittest import SkipTest
+    from ..src.headless import Simulation
+    from ..src import soa
+
+    if soa.np is None:
+        raise SkipTest("NumPy is not installed, so groups are never evaluated as arrays")
+
+    with Simulation() as sim:
+        rig = sim.rig()
+        rig.speed.to(1)
+        for i in range(soa.SOA_MIN_BUILDERS + 4):
+            rig.layer("boost").speed.offset.add(0.5 + i * 0.1).over(100, "ease_in_out").hold(50).revert(200, "ease_out").run()
+            rig.layer("drift").vector.offset.add(0.3, -0.2 * i).over(120).revert(120).run()
+            sim.run_frames(1)
+
+        for _ in range(30):
+            sim.run_frames(1)
+            for name in ("boost", "drift"):
+                group = sim.state._layer_groups.get(name)
+                if group is None or len(group.builders) < soa.SOA_MIN_BUILDERS:
+                    continue
+                value = group.get_current_value()
+                assert group._soa is not None and group._soa.verified, f"Expected {name} to be evaluated as arrays"
+                soa._disabled = True
+                expected = group.get_current_value()
+                soa._disabled = False
+                assert soa._same(value, expected), f"{name}: arrays gave {value}, object path {expected}"
+        assert not soa._disabled, "Vectorised evaluation was turned off"
+
+
+class StubArrays:
+    """Stands in for soa.GroupArrays: supports any group, and either gets
+    the total wrong or fails like an interpolation that rejects arrays"""
+
+    error = None
+
+    def __init__(self, builders):
+        self.builders = tuple(builders)
+        self.supported = True
+        self.verified = False
+
+    def matches(self, builders):
+        return tuple(builders) == self.builders
+
+    def evaluate(self, current_time, start):
+        if StubArrays.error is not None:
+            raise StubArrays.error
+        return start + 1000.0
+
+
+def test_soa_verification_falls_back():
+    """Test: a vectorised total that disagrees with the object path is replaced by it and turns arrays off"""
+    from ..src.headless import Simulation
+    from ..src import soa
+
+    saved = (soa.np, soa.GroupArrays, soa._disabled)
+    try:
+        # Any non-None np enables the path; the stub arrays never touch it
+        soa.np = object()
+        soa.GroupArrays = StubArrays
+
+        for error in (None, TypeError("interpolate() got an array")):
+            StubArrays.error = error
+            with Simulation() as sim:
+                rig = sim.rig()
+                soa._disabled = True
+                for i in range(soa.SOA_MIN_BUILDERS):
+                    rig.layer("boost").speed.offset.add(0.5 + i * 0.1).over(100).revert(100).run()
+                sim.run_frames(2)
+                group = sim.state._layer_groups["boost"]
+
+                soa._disabled = False
+                group.invalidate()
+                value = group.get_current_value()
+                assert soa._disabled, f"A failed check ({error!r}) left vectorised evaluation on"
+
+                group.invalidate()
+                expected = group.get_current_value()
+                assert value == expected, f"Expected the object path's {expected} after a failed check, got {value}"
+                assert isinstance(group._soa, StubArrays), "Group was not evaluated through the arrays"
+    finally:
+        soa.np, soa.GroupArrays, soa._disabled = saved
+        StubArrays.error = None
+
+
+def test_constant_velocity_allocation_free():
+    """Test: a constant-velocity tick builds no Vec2s and retains no memory, on the steady path and a full frame"""
+    import tracemalloc
+    from ..src.headless import Simulation
+    from ..src.core import Vec2
+
+    class Sink:
+        """Output that keeps only the last event, so it never grows"""
+        last = None
+
+        def move_absolute(self, x, y):
+            self.last = (x, y)
+
+        def move_relative(self, dx, dy):
+            self.last = (dx, dy)
+
+        def scroll(self, dx, dy):
+            self.last = (dx, dy)
+
+    def measure(sim):
+        """(Vec2s built, bytes retained) over 200 frames"""
+        created = [0]
+        original_init = Vec2.__init__
+        counting = original_init is not object.__init__
+        if counting:
+            def counting_init(self, *args, **kwargs):
+                created[0] += 1
+                original_init(self, *args, **kwargs)
+            Vec2.__init__ = counting_init
+
+        tracemalloc.start()
+        try:
+            sim.run_frames(10)
+            before = tracemalloc.get_traced_memory()[0]
+            sim.run_frames(200)
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+            if counting:
+                Vec2.__init__ = original_init
+        return created[0], after - before
+
+    for full_frame in (False, True):
+        path = "full frame" if full_frame else "steady path"
+        with Simulation() as sim:
+            rig = sim.rig()
+            rig.direction.to(1, 0)
+            rig.speed.to(3)
+            sim.runtime.output = Sink()
+
+            apply_frame = sim.state._apply_frame
+            full_frames = [0]
+
+            def counting_apply_frame(*args):
+                full_frames[0] += 1
+                return apply_frame(*args)
+            sim.state._apply_frame = counting_apply_frame
+            if full_frame:
+                sim.state._steady_velocity = lambda: None
+            sim.run_frames(20)
+            del sim.state._apply_frame
+            expected = 20 if full_frame else 0
+            assert full_frames[0] == expected, f"{path}: expected {expected} full frames, {full_frames[0]} ran"
+
+            created, grew = measure(sim)
+            assert sim.runtime.output.last == (3, 0), f"{path}: expected steady (3, 0) moves, last {sim.runtime.output.last}"
+            assert created == 0, f"{path}: expected no Vec2 per tick, {created} built over 200 frames"
+            assert grew <= 0, f"{path}: expected no retained allocations, grew {grew} bytes over 200 frames"
+
+
+def test_builders_advance_once_per_frame():
+    """Test: each builder is advanced once per frame and a finished move still lands exactly"""
+    from ..src.headless import Simulation
+
+    with Simulation(cursor=(500, 500)) as sim:
+        rig = sim.rig()
+        rig.pos.by(37, -11).over(100, "ease_out")
+        rig.layer("boost").speed.offset.add(2).over(50).hold(40).revert(60)
+
+        counts = {}
+        for group in sim.state._layer_groups.values():
+            for builder in group.builders:
+                advance = builder.advance
+
+                def counting_advance(current_time, _advance=advance, _builder=builder):
+                    counts[_builder] = counts.get(_builder, 0) + 1
+                    return _advance(current_time)
+                builder.advance = counting_advance
+
+        while sim.state._frame_loop_job is not None:
+            counts.clear()
+            sim.run_frames(1)
+            assert all(n <= 1 for n in counts.values()), f"Builder advanced {max(counts.values())} times in one frame"
+
+        assert sim.cursor == (537, 489), f"Expected cursor at (537, 489), got {sim.cursor}"
+        assert not sim.state._frame_bakes and not sim.state._frame_removals, "Frame cleanup left entries behind"
+        for group in sim.state._layer_groups.values():
+            assert "_pending_bake_results" not in vars(group), "Groups should not carry pending bakes"
+
+
+def test_steady_velocity_fast_path():
+    """Test: constant base velocity skips the full frame, and any change falls back to it"""
+    from ..src.headless import Simulation
+
+    with Simulation(cursor=(0, 0)) as sim:
+        rig = sim.rig()
+        rig.direction.to(1, 0)
+        rig.speed.to(4)
+        sim.run_frames(5)
+
+        full_frames = [0]
+        apply_frame = sim.state._apply_frame
+
+        def counting_apply_frame(*args):
+            full_frames[0] += 1
+            return apply_frame(*args)
+        sim.state._apply_frame = counting_apply_frame
+
+        start = sim.cursor[0]
+        sim.run_frames(30)
+        assert full_frames[0] == 0, f"Expected steady frames only, {full_frames[0]} full frames ran"
+        assert sim.cursor[0] - start == 120, f"Expected 120px at 4px/frame, moved {sim.cursor[0] - start}"
+
+        rig.speed.to(2).over(48)
+        sim.run_frames(2)
+        assert full_frames[0] == 2, "A new builder should fall back to full frames"
+
+        sim.run_frames(10)
+        steady_from = full_frames[0]
+        sim.output.clear()
+        sim.run_frames(10)
+        assert full_frames[0] == steady_from, "Expected the fast path to resume once the change baked"
+        assert all(dx == 2 and dy == 0 for _, dx, dy in sim.output.relative_events), "Steady frames should use the new speed"
+
+        # Settings are read once per settings version, not per tick
+        from ..src.core import _on_frame_setting_change
+        sim.runtime.settings["user.mouse_rig_adaptive_frame_rate"] = True
+        assert sim.state._steady_velocity() is not None, "Expected the cached settings until the change is reported"
+        _on_frame_setting_change()
+        assert sim.state._steady_velocity() is None, "A frame setting change should turn the fast path off"
+
+
+def test_holding_group_value_cached():
+    """Test: a group holding its value is not re-aggregated each frame, and a revert invalidates it"""
+    from ..src.headless import Simulation
+
+    with Simulation() as sim:
+        rig = sim.rig()
+        rig.speed.to(1)
+        rig.layer("boost").speed.offset.add(3).over(32).hold(60000)
+        sim.run_frames(5)
+
+        group = sim.state._layer_groups["boost"]
+        builder = group.builders[0]
+        calls = [0]
+        get_value = builder.get_interpolated_value
+
+        def counting_get_value():
+            calls[0] += 1
+            return get_value()
+        builder.get_interpolated_value = counting_get_value
+
+        values = []
+        for _ in range(10):
+            sim.run_frames(1)
+            values.append(group.get_current_value())
+        assert values == [3] * 10, f"Expected a held offset of 3, got {values}"
+        assert calls[0] == 0, f"Holding group was re-aggregated {calls[0]} times"
+
+        rig.layer("boost").revert(64)
+        sim.run_frames(2)
+        value = group.get_current_value()
+        assert calls[0] > 0 and 0 < value < 3, f"Expected the revert to be picked up, got {value}"
+
+        sim.run_until_idle()
+        assert abs(sim.state.speed - 1) < 1e-9, f"Expected speed back at 1, got {sim.state.speed}"
+
+
+def test_reverse_held_layer():
+    """Test: reversing a layer that is holding its direction takes effect on the next frame"""
+    from ..src.headless import Simulation
+
+    with Simulation() as sim:
+        rig = sim.rig()
+        rig.direction.to(1, 0)
+        rig.speed.to(2)
+        rig.layer("steer").direction.override.to(0, 1).over(32).hold(60000)
+        sim.run_frames(5)
+
+        before = sim.cursor
+        sim.run_frames(1)
+        step = (sim.cursor[0] - before[0], sim.cursor[1] - before[1])
+        assert step == (0, 2), f"Expected the held direction to move down 2px, got {step}"
+
+        rig.layer("steer").reverse()
+        before = sim.cursor
+        sim.run_frames(1)
+        step = (sim.cursor[0] - before[0], sim.cursor[1] - before[1])
+        assert step == (0, -2), f"Expected the reversed hold to move up 2px, got {step}"
+
+
+def test_idle_grace_resumes_frame_loop():
+    """Test: rapid nudges reuse the idle frame loop job, and stop callbacks still fire when motion stops"""
+    from ..src.headless import Simulation
+
+    with Simulation(cursor=(0, 0)) as sim:
+        rig = sim.rig()
+        counts = sim.state.frame_loop_counts
+        stopped = []
+
+        for i in range(3):
+            sim.state.add_stop_callback(lambda: stopped.append(sim.runtime.now()))
+            rig.pos.by(5, 0).over(32)
+            while sim.state._frame_loop_job is not None:
+                sim.run_frames(1)
+            assert len(stopped) == i + 1, f"Stop callback {i + 1} did not fire when the loop stopped"
+            assert stopped[-1] == sim.runtime.now(), "Stop callback fired late"
+            sim.advance(100)
+
+        assert sim.cursor == (15, 0), f"Expected cursor at (15, 0), got {sim.cursor}"
+        assert (counts["starts"], counts["resumes"], counts["idles"], counts["stops"]) == (1, 2, 3, 0), \
+            f"Expected one job resumed twice, got {counts}"
+
+        sim.advance(1000)
+        assert counts["stops"] == 1 and sim.state._idle_job is None, f"Idle job not cancelled after the grace period: {counts}"
+
+        rig.pos.by(5, 0).over(32)
+        while sim.state._frame_loop_job is not None:
+            sim.run_frames(1)
+        assert sim.state._idle_job is not None, "Expected the job parked for the grace period"
+        rig.reset()
+        assert sim.state._idle_job is None and sim.runtime.next_due() is None, "Reset left the idle job scheduled"
+        assert counts["stops"] == 2, f"Expected the parked job cancelled on reset, got {counts}"
+
+
+def test_first_frame_emitted_by_command():
+    """Test: a command from idle moves the cursor before any tick, and motion steps evenly from there"""
+    from ..src.headless import Simulation
+
+    with Simulation(cursor=(0, 0)) as sim:
+        rig = sim.rig()
+        rig.direction.to(1, 0)
+        sim.run_until_idle()
+        start = sim.runtime.now()
+        rig.speed.to(3)
+
+        events = sim.output.relative_events
+        assert events, "Expected motion within the command that started the loop"
+        assert events[0] == (start, 3, 0), f"Expected (3, 0) at once, got {events[0]}"
+
+        sim.run_frames(10)
+        steps = [event[1] for event in events]
+        gaps = [round((later[0] - earlier[0]) * 1000) for earlier, later in zip(events, events[1:])]
+        assert steps == [3] * 11, f"Expected the command's frame and 10 ticks of 3px, got {steps}"
+        assert gaps == [16] * 10, f"Expected a step every 16ms from the command on, got {gaps}"
+
+        # A resumed idle job keeps its old phase: the first tick moves only
+        # for the time since the command's frame
+        rig.stop()
+        while sim.state._frame_loop_job is not None:
+            sim.run_frames(1)
+        sim.advance(100)
+        sim.output.clear()
+        before = sim.cursor
+        start = sim.runtime.now()
+        rig.speed.to(3)
+        first_tick = sim.runtime.next_due()
+        sim.run_frames(1)
+        expected = 3 + 3 * (first_tick - start) / 0.016
+        moved = sim.cursor[0] - before[0]
+        assert 0 < first_tick - start < 0.016, f"Expected the resumed job to tick within a frame, got {first_tick - start}"
+        assert abs(moved - expected) < 1, f"Expected about {expected:.2f}px by the first tick, got {moved}"
+
+        rig.stop()
+        sim.run_until_idle()
+        before = sim.cursor
+        rig.pos.by(50, 0).over(160)
+        sim.run_until_idle()
+        assert sim.cursor == (before[0] + 50, before[1]), f"Expected a 50px move from {before}, got {sim.cursor}"
+
+
+def _spy_frame_lifecycle(sim) -> list:
+    """Record (method, time) whenever the state advances builders, removes
+    completed ones, runs phase callbacks or checks whether to stop"""
+    state = sim.state
+    calls = []
+    for name in ("_advance_all_builders", "_remove_completed_builders", "_execute_phase_callbacks", "_stop_frame_loop_if_done"):
+        def spy(*args, _name=name, _original=getattr(state, name)):
+            calls.append((_name, sim.runtime.now()))
+            return _original(*args)
+        setattr(state, name, spy)
+    return calls
+
+
+def test_first_frame_defers_then():
+    """Test: a .then() added after the command started the loop fires from a tick, not the first frame"""
+    from ..src.headless import Simulation
+
+    with Simulation(cursor=(0, 0)) as sim:
+        rig = sim.rig()
+        rig.direction.to(1, 0)
+        sim.run_until_idle()
+        lifecycle = _spy_frame_lifecycle(sim)
+        done = []
+
+        start = sim.runtime.now()
+        builder = rig.speed.to(3).over(48).run()
+        builder.then(lambda: done.append(sim.runtime.now()))
+
+        assert sim.state._frame_loop_job is not None, "Expected the command to start the frame loop"
+        assert not done, "then callback fired inside the command"
+        assert not [call for call in lifecycle if call[1] == start], f"First frame ran lifecycle work: {lifecycle}"
+        assert sim.state._layer_groups.property_groups("speed"), "Builder completed inside the command"
+
+        for _ in range(20):
+            if done:
+                break
+            sim.run_frames(1)
+        assert len(done) == 1 and done[0] > start, f"Expected the then callback once, from a tick, got {done}"
+
+
+def test_first_frame_reentrant_callback():
+    """Test: a callback that issues another command runs from a tick and its command takes effect"""
+    from ..src.headless import Simulation
+
+    with Simulation(cursor=(0, 0)) as sim:
+        rig = sim.rig()
+        lifecycle = _spy_frame_lifecycle(sim)
+        calls = []
+
+        def chain():
+            calls.append((sim.runtime.now(), sim.state._frame_loop_job is not None))
+            rig.pos.by(10, 0).over(32)
+
+        start = sim.runtime.now()
+        rig.pos.by(30, 0).over(32).then(chain)
+
+        assert not calls, "Callback re-entered the rig inside the command"
+        assert not [call for call in lifecycle if call[1] == start], f"First frame ran lifecycle work: {lifecycle}"
+
+        sim.run_until_idle()
+        assert len(calls) == 1 and calls[0][0] > start, f"Expected the callback once, from a tick, got {calls}"
+        assert calls[0][1], "Callback ran outside the frame loop"
+        assert sim.cursor == (40, 0), f"Expected both moves applied, got {sim.cursor}"
+
+
+# ============================================================================
+# TEST REGISTRY
+# ============================================================================
+
+ENGINE_TESTS = [
+    ("backends cached", test_backends_cached),
+    ("backends invalidated", test_backends_invalidated),
+    ("x11 relative motion", test_x11_relative_motion),
+    ("x11 frame single flush", test_x11_frame_single_flush),
+    ("uinput frame single write", test_uinput_frame_single_write),
+    ("uinput hi-res accumulates lines", test_uinput_hi_res_accumulates_lines),
+    ("uinput relative carries fraction", test_uinput_relative_carries_fraction),
+    ("uinput full queue dropped", test_uinput_full_queue_dropped),
+    ("headless constant speed", test_headless_constant_speed),
+    ("headless restores runtime", test_headless_restores_runtime),
+    ("perf disabled by default", test_perf_disabled_by_default),
+    ("perf phases recorded", test_perf_phases_recorded),
+    ("jitter stall tagged", test_jitter_stall_tagged),
+    ("frame thread ticks off main thread", test_frame_thread_ticks_off_main_thread),
+    ("state reads hold lock", test_state_reads_hold_lock),
+    ("engine ring and state roundtrip", test_engine_ring_and_state_roundtrip),
+    ("engine shared memory released", test_engine_shared_memory_released),
+    ("engine ready after first tick", test_engine_ready_after_first_tick),
+    ("reset closes engine", test_reset_closes_engine),
+    ("emit queue merges when full", test_emit_queue_merges_when_full),
+    ("easing tables", test_easing_tables),
+    ("easing release", test_easing_release),
+    ("trajectory plan cached", test_trajectory_plan_cached),
+    ("state at and finish_all", test_state_at_and_finish_all),
+    ("stack coalescing", test_stack_coalescing),
+    ("stack folds across frames", test_stack_folds_across_frames),
+    ("soa matches object path", test_soa_matches_object_path),
+    ("soa verification falls back", test_soa_verification_falls_back),
+    ("constant velocity allocation free", test_constant_velocity_allocation_free),
+    ("builders advance once per frame", test_builders_advance_once_per_frame),
+    ("steady velocity fast path", test_steady_velocity_fast_path),
+    ("holding group value cached", test_holding_group_value_cached),
+    ("reverse held layer", test_reverse_held_layer),
+    ("idle grace resumes frame loop", test_idle_grace_resumes_frame_loop),
+    ("first frame emitted by command", test_first_frame_emitted_by_command),
+    ("first frame defers then", test_first_frame_defers_then),
+    ("first frame reentrant callback", test_first_frame_reentrant_callback),
+]
@@ -3,6 +3,7 @@ import time
 import inspect
 import re
 from datetime import datetime
+from unittest import SkipTest
 
 CENTER_X = 960
 CENTER_Y = 540
@@ -16,6 +17,7 @@ _test_runner_state = {
     "stop_requested": False,
     "passed_count": 0,
     "failed_count": 0,
+    "skipped_count": 0,
     "all_tests_running": False,
     "test_results_file": None,
     "group_names": []
@@ -39,6 +41,7 @@ def toggle_test_ui(show: bool = None):
         from .actions_scroll import ACTIONS_SCROLL_TESTS
         from .sequence import SEQUENCE_TESTS
         from .move import MOVE_TESTS
+        from .engine import ENGINE_TESTS
 
         test_groups = [
             ("Position", POSITION_TESTS),
@@ -54,7 +57,8 @@ def toggle_test_ui(show: bool = None):
             ("Actions Scroll", ACTIONS_SCROLL_TESTS),
             ("Sequence", SEQUENCE_TESTS),
             ("Move", MOVE_TESTS),
-            ("State", STATE_TESTS)
+            ("State", STATE_TESTS),
+            ("Engine", ENGINE_TESTS)
         ]
 
         _test_runner_state["group_names"] = [name for name, _ in test_groups]
@@ -161,6 +165,25 @@ def run_single_test(test_name, test_func, on_complete=None, test_group=None, fas
         delay = "200ms" if fast_mode else "1s"
         cron.after(delay, clear_and_complete)
 
+    def on_test_skipped(reason):
+        actions.user.mouse_rig().stop()
+
+        actions.user.ui_elements_set_state("test_result", {
+            "success": True,
+            "message": "SKIPPED"
+        })
+        print(f"SKIPPED: {test_name}")
+        print(f"  Reason: {reason}")
+
+        def clear_and_complete():
+            actions.user.ui_elements_set_state("test_result", None)
+            actions.user.ui_elements_set_state("current_test", None)
+            actions.user.ui_elements_unhighlight(test_button_id)
+            if on_complete:
+                on_complete(None)
+        delay = "200ms" if fast_mode else "1s"
+        cron.after(delay, clear_and_complete)
+
     def on_test_failure(error_msg):
         actions.user.mouse_rig().stop()
 
@@ -194,6 +217,8 @@ def run_single_test(test_name, test_func, on_complete=None, test_group=None, fas
             try:
                 test_func()
                 on_test_success()
+            except SkipTest as e:
+                on_test_skipped(str(e))
             except AssertionError as e:
                 on_test_failure(str(e))
             except Exception as e:
@@ -231,6 +256,7 @@ def run_all_tests(tests, group_name):
     _test_runner_state["stop_requested"] = False
     _test_runner_state["passed_count"] = 0
     _test_runner_state["failed_count"] = 0
+    _test_runner_state["skipped_count"] = 0
 
     actions.user.ui_elements_set_state("run_all_active", True)
 
@@ -249,13 +275,15 @@ def run_all_tests(tests, group_name):
         def on_test_complete(success):
             actions.user.mouse_rig().stop()
 
-            if success:
+            if success is None:
+                _test_runner_state["skipped_count"] += 1
+            elif success:
                 _test_runner_state["passed_count"] += 1
             else:
                 _test_runner_state["failed_count"] += 1
 
             stop_on_fail = actions.user.ui_elements_get_state("stop_on_fail", True)
-            if not success and stop_on_fail:
+            if success is False and stop_on_fail:
                 print("Stopping test run due to failure")
                 show_summary()
             elif _test_runner_state["running"]:
@@ -272,6 +300,7 @@ def run_all_tests(tests, group_name):
 def show_summary():
     passed = _test_runner_state["passed_count"]
     failed = _test_runner_state["failed_count"]
+    skipped = _test_runner_state["skipped_count"]
     total = passed + failed
 
     all_passed = failed == 0
@@ -279,6 +308,7 @@ def show_summary():
     actions.user.ui_elements_set_state("test_summary", {
         "passed": passed,
         "failed": failed,
+        "skipped": skipped,
         "total": total,
         "all_passed": all_passed
     })
@@ -287,6 +317,8 @@ def show_summary():
     print(f"Test Run Complete: {passed}/{total} passed")
     if failed > 0:
         print(f"Failed: {failed}")
+    if skipped > 0:
+        print(f"Skipped: {skipped}")
     print(f"{'='*50}\n")
 
     def clear_summary():
@@ -347,6 +379,7 @@ def run_all_tests_global(test_groups):
     _test_runner_state["stop_requested"] = False
     _test_runner_state["passed_count"] = 0
     _test_runner_state["failed_count"] = 0
+    _test_runner_state["skipped_count"] = 0
 
     actions.user.ui_elements_set_state("run_all_tests_global", True)
 
@@ -365,7 +398,10 @@ def run_all_tests_global(test_groups):
         def on_test_complete(success):
             actions.user.mouse_rig().stop()
 
-            if success:
+            if success is None:
+                _test_runner_state["skipped_count"] += 1
+                result_msg = f"SKIPPED: {group_name} - {test_name}\n"
+            elif success:
                 _test_runner_state["passed_count"] += 1
                 result_msg = f"PASSED: {group_name} - {test_name}\n"
             else:
@@ -378,7 +414,7 @@ def run_all_tests_global(test_groups):
                     f.write(result_msg)
 
             stop_on_fail = actions.user.ui_elements_get_state("stop_on_fail", True)
-            if not success and stop_on_fail:
+            if success is False and stop_on_fail:
                 print("Stopping test run due to failure")
                 finalize_results()
             elif _test_runner_state["running"]:
@@ -390,6 +426,7 @@ def run_all_tests_global(test_groups):
     def finalize_results():
         passed = _test_runner_state["passed_count"]
         failed = _test_runner_state["failed_count"]
+        skipped = _test_runner_state["skipped_count"]
         total = passed + failed
         all_passed = failed == 0
 
@@ -399,6 +436,8 @@ def run_all_tests_global(test_groups):
             f.write(f"Test Run Complete: {passed}/{total} passed\n")
             if failed > 0:
                 f.write(f"Failed: {failed}\n")
+            if skipped > 0:
+                f.write(f"Skipped: {skipped}\n")
             f.write("="*70 + "\n")
 
         print(f"Test results written to: {_test_runner_state['test_results_file']}")
@@ -406,6 +445,7 @@ def run_all_tests_global(test_groups):
         actions.user.ui_elements_set_state("test_summary", {
             "passed": passed,
             "failed": failed,
+            "skipped": skipped,
             "total": total,
             "all_passed": all_passed
         })
@@ -414,6 +454,8 @@ def run_all_tests_global(test_groups):
         print(f"Test Run Complete: {passed}/{total} passed")
         if failed > 0:
             print(f"Failed: {failed}")
+        if skipped > 0:
+            print(f"Skipped: {skipped}")
         print(f"{'='*50}\n")
 
         def clear_summary():
@@ -640,11 +682,12 @@ def test_result_ui():
         return screen()
 
     is_success = result.get("success", False)
+    is_skipped = result.get("message") == "SKIPPED"
 
-    bg_color = "#00ff00dd" if is_success else "#ff0000dd"
+    bg_color = "#888888dd" if is_skipped else "#00ff00dd" if is_success else "#ff0000dd"
     icon_name = "check" if is_success else "close"
     icon_color = "white"
-    label = "PASSED" if is_success else "FAILED"
+    label = "SKIPPED" if is_skipped else "PASSED" if is_success else "FAILED"
 
     return screen(align_items="center", justify_content="flex_end")[
         div(
@@ -671,6 +714,7 @@ def test_summary_ui():
 
     passed = summary.get("passed", 0)
     failed = summary.get("failed", 0)
+    skipped = summary.get("skipped", 0)
     total = summary.get("total", 0)
     all_passed = summary.get("all_passed", False)
 
@@ -687,6 +731,7 @@ def test_summary_ui():
         )[
             text("Test Run Complete", font_size=32, color="white", font_weight="bold"),
             text(f"{passed}/{total} Passed", font_size=24, color="white"),
-            text(f"{failed} Failed", font_size=24, color="white") if failed > 0 else div()
+            text(f"{failed} Failed", font_size=24, color="white") if failed > 0 else div(),
+            text(f"{skipped} Skipped", font_size=24, color="white") if skipped > 0 else div()
         ]
     ]
@@ -623,6 +623,81 @@ def test_frame_loop_status():
     rig.stop()
     return True, "Frame loop status shown"
 
+def test_state_snapshot_reused():
+    """Test: state reads share one snapshot until builders or base values change"""
+    rig = actions.user.mouse_rig()
+    rig.stop()
+    state = rig.state
+
+    first = state._get_snapshot()
+    _ = (state.pos, state.speed, state.direction, state.vector, state.scroll.vector, repr(state))
+    assert state._get_snapshot() is first, "Snapshot was recomputed without any change"
+
+    rig.speed.to(3).run()
+    assert state._get_snapshot() is not first, "Snapshot not invalidated after speed.to()"
+    assert abs(state.speed - 3) < 0.01, f"Speed is {state.speed}, expected 3"
+
+    second = state._get_snapshot()
+    rig.layer("snapshot_test").speed.offset.add(2).run()
+    assert state._get_snapshot() is not second, "Snapshot not invalidated after layer added"
+    assert abs(state.speed - 5) < 0.01, f"Speed is {state.speed}, expected 5"
+
+    rig.stop()
+    assert state.speed == 0, f"Speed is {state.speed} after stop, expected 0"
+
+def test_adaptive_frame_interval():
+    """Test: adaptive scheduler slows down for slow constant motion only"""
+    rig = actions.user.mouse_rig()
+    rig.stop()
+    state = rig.state
+
+    rig.speed.to(0.25).run()
+    interval = state._get_adaptive_frame_interval(time.perf_counter(), 16, 64)
+    assert interval == 64, f"Slow constant speed interval is {interval}, expected 64"
+
+    for speed in (0.3, 0.5, 0.7, 0.9):
+        rig.speed.to(speed).run()
+        interval = state._get_adaptive_frame_interval(time.perf_counter(), 16, 64)
+        step = speed * interval / 16
+        assert step <= 1.0, f"Speed {speed} steps {step:.2f}px every {interval}ms, expected at most 1px"
+
+    rig.speed.to(1000).run()
+    interval = state._get_adaptive_frame_interval(time.perf_counter(), 16, 64)
+    assert interval == 16, f"Fast speed interval is {interval}, expected 16"
+
+    rig.speed.to(0.5).run()
+    rig.layer("adaptive_test").speed.offset.add(0.1).over(500).run()
+    interval = state._get_adaptive_frame_interval(time.perf_counter(), 16, 64)
+    assert interval == 16, f"Interval during over phase is {interval}, expected 16"
+
+    rig.stop()
+
+def test_layer_registry_order():
+    """Test: layer registry keeps groups sorted by order and partitioned by property"""
+    rig = actions.user.mouse_rig()
+    rig.stop()
+    registry = rig.state._layer_groups
+
+    rig.layer("registry_late", order=5).speed.offset.add(1).run()
+    rig.layer("registry_early", order=1).speed.offset.add(1).run()
+    rig.layer("registry_direction", order=3).direction.offset.add((0, 1)).run()
+
+    names = [group.layer_name for group in registry.ordered()]
+    expected = ["registry_early", "registry_direction", "registry_late"]
+    assert names == expected, f"Ordered layers are {names}, expected {expected}"
+
+    speed_names = [group.layer_name for group in registry.select("move", "speed")]
+    assert speed_names == ["registry_early", "registry_late"], f"Speed partition is {speed_names}"
+    assert len(registry.velocity_groups("move")) == 3, "Velocity index missing groups"
+    assert not registry.velocity_groups("scroll"), "Scroll velocity index should be empty"
+
+    del registry["registry_early"]
+    names = [group.layer_name for group in registry.ordered()]
+    assert names == ["registry_direction", "registry_late"], f"After removal layers are {names}"
+
+    rig.stop()
+    assert not registry.ordered(), "Registry not empty after stop"
+
 STATE_TESTS = [
     ("RigState (empty)", test_rig_state_empty),
     ("BaseState (empty)", test_base_state_empty),
@@ -647,4 +722,7 @@ STATE_TESTS = [
     ("LayerState - custom scroll", test_scroll_layer_custom_named),
     ("LayersView - dict-like", test_layers_view_dict_like),
     ("Frame loop status", test_frame_loop_status),
+    ("State snapshot reused", test_state_snapshot_reused),
+    ("Adaptive frame interval", test_adaptive_frame_interval),
+    ("Layer registry order", test_layer_registry_order),
 ]